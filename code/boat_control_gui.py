@@ -3,28 +3,63 @@ ESP32 Boat Control - Modern PyQt6 Interface
 Professional UI for controlling RC cargo barge via ESP32 ESP-NOW
 """
 
+import re
 import sys
+import time
 import serial
 import serial.tools.list_ports
 from datetime import datetime
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QComboBox, QGroupBox, QSlider, QTextEdit,
+    QPushButton, QLabel, QComboBox, QGroupBox, QSlider, QPlainTextEdit,
     QGridLayout, QFrame, QStatusBar, QProgressBar
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread
-from PyQt6.QtGui import QFont, QIcon, QPalette, QColor
+from PyQt6.QtCore import (
+    Qt, QTimer, pyqtSignal, QThread, QSocketNotifier, QSignalBlocker,
+    QElapsedTimer, QObject, QRunnable, QThreadPool
+)
+from PyQt6.QtGui import QFont, QIcon, QPalette, QColor, QTextCursor, QTextCharFormat
+
+
+# Lines reporting the boat status; matched on raw bytes in one scan
+_STATUS_RE = re.compile(rb"ESTADO DEL BARCO|Estado:")
 
 
 class SerialThread(QThread):
-    """Thread for handling serial communication"""
-    data_received = pyqtSignal(str)
+    """Serial communication with the ESP32.
+
+    Received lines are emitted in batches as (text, is_status) tuples;
+    failures are reported through error for the GUI log.
+
+    On POSIX the port's file descriptor is watched with a QSocketNotifier on
+    the GUI thread; on Windows (no selectable fd) a reader thread is used.
+    """
+    data_received = pyqtSignal(list)
     connection_status = pyqtSignal(bool)
+    error = pyqtSignal(str)
+    # Emitted by the reader thread when the device goes away; queued to
+    # disconnect() on the GUI thread (run() cannot wait() on itself)
+    _port_lost = pyqtSignal()
+
+    TX_FLUSH_MS = 10
+
+    # Movement commands are a fixed alphabet; encode them once
+    _CMD_CACHE = {c: f"{c}\n".encode() for c in ("w", "a", "s", "d", "p")}
 
     def __init__(self):
         super().__init__()
         self.serial_port = None
         self.running = False
+        self._rx_buffer = b""
+        self._notifier = None
+        # Outgoing commands are coalesced for TX_FLUSH_MS; both queueing and
+        # flushing happen on the GUI thread, which owns this timer
+        self._tx_buffer = bytearray()
+        self._tx_timer = QTimer()
+        self._tx_timer.setSingleShot(True)
+        self._tx_timer.setInterval(self.TX_FLUSH_MS)
+        self._tx_timer.timeout.connect(self._flush_tx)
+        self._port_lost.connect(self.disconnect)
 
     def connect(self, port, baudrate=115200):
         """Connect to serial port"""
@@ -32,7 +67,10 @@ class SerialThread(QThread):
             if self.serial_port and self.serial_port.is_open:
                 self.serial_port.close()
             
-            self.serial_port = serial.Serial(port, baudrate, timeout=0.1)
+            self.serial_port = serial.Serial(port, baudrate, timeout=0.5)
+            self._set_low_latency()
+            self._rx_buffer = b""
+            self._tx_buffer.clear()
             self.running = True
             self.connection_status.emit(True)
             return True
@@ -40,46 +78,193 @@ class SerialThread(QThread):
             self.connection_status.emit(False)
             return False
 
+    def _set_low_latency(self):
+        """Ask the Linux driver for ASYNC_LOW_LATENCY (TIOCSSERIAL).
+
+        USB-serial adapters otherwise hold received bytes for their latency
+        timer (16 ms on FTDI) before handing them over. Ports that don't
+        support the ioctl are left as they are.
+        """
+        if not sys.platform.startswith("linux"):
+            return
+        try:
+            self.serial_port.set_low_latency_mode(True)
+        except (AttributeError, ValueError, OSError):
+            pass
+
     def disconnect(self):
         """Disconnect from serial port"""
         self.running = False
+        self._flush_tx()
+        if self._notifier is not None:
+            self._notifier.setEnabled(False)
+            self._notifier.deleteLater()
+            self._notifier = None
+        # Let the blocking read return (at most one port timeout) before
+        # closing the port underneath it
+        if self.isRunning():
+            self.wait()
         if self.serial_port and self.serial_port.is_open:
             self.serial_port.close()
         self.connection_status.emit(False)
 
+    def start_reading(self):
+        """Start delivering received lines through data_received"""
+        if sys.platform != "win32":
+            self._notifier = QSocketNotifier(
+                self.serial_port.fileno(), QSocketNotifier.Type.Read, self
+            )
+            self._notifier.activated.connect(self._on_readable)
+        else:
+            self.start()
+
     def send_command(self, command):
-        """Send command to ESP32"""
+        """Queue a command for the ESP32; queued commands go out in one write"""
         if self.serial_port and self.serial_port.is_open:
-            try:
-                self.serial_port.write(f"{command}\n".encode())
-                return True
-            except Exception as e:
-                print(f"Error sending command: {e}")
-                return False
+            buf = self._CMD_CACHE.get(command)
+            if buf is None:
+                buf = f"{command}\n".encode()
+            self._tx_buffer += buf
+            if not self._tx_timer.isActive():
+                self._tx_timer.start()
+            return True
         return False
 
+    def _flush_tx(self):
+        """Write all queued commands with a single call"""
+        self._tx_timer.stop()
+        if not self._tx_buffer:
+            return
+        buf = bytes(self._tx_buffer)
+        self._tx_buffer.clear()
+        if self.serial_port and self.serial_port.is_open:
+            try:
+                self.serial_port.write(buf)
+            except (serial.SerialException, OSError) as e:
+                # Commands were already accepted by send_command; report
+                # the lost write and drop the dead port
+                self.error.emit(f"Error sending command: {e}")
+                self.disconnect()
+
+    def _on_readable(self):
+        """Read everything the driver has buffered (QSocketNotifier path)"""
+        try:
+            chunk = self.serial_port.read(max(1, self.serial_port.in_waiting))
+        except (serial.SerialException, OSError) as e:
+            # Device reported ready but returned nothing: it went away
+            self.error.emit(f"Error reading serial: {e}")
+            self.disconnect()
+            return
+        self._consume(chunk)
+
+    def _consume(self, chunk):
+        """Split received bytes into lines and emit the complete ones"""
+        if not chunk:
+            return
+        self._rx_buffer += chunk
+        *lines, self._rx_buffer = self._rx_buffer.split(b'\n')
+        decoded = []
+        for raw in lines:
+            text = raw.decode('utf-8', errors='ignore').strip()
+            if text:
+                # Status detection runs once on the raw bytes
+                decoded.append((text, _STATUS_RE.search(raw) is not None))
+        if decoded:
+            self.data_received.emit(decoded)
+
     def run(self):
-        """Read serial data continuously"""
+        """Read serial data continuously (thread fallback for Windows)"""
+        # Block in the driver until at least one byte arrives (or the port
+        # timeout expires), then drain whatever else is already waiting so a
+        # burst of lines costs one read and one signal.
         while self.running:
-            if self.serial_port and self.serial_port.is_open:
-                try:
-                    if self.serial_port.in_waiting:
-                        data = self.serial_port.readline().decode('utf-8', errors='ignore').strip()
-                        if data:
-                            self.data_received.emit(data)
-                except Exception as e:
-                    print(f"Error reading serial: {e}")
-            self.msleep(50)
+            try:
+                chunk = self.serial_port.read(max(1, self.serial_port.in_waiting))
+            except (serial.SerialException, TypeError, AttributeError, OSError) as e:
+                # Port closed under us by disconnect(), or device unplugged
+                if self.running:
+                    self.running = False
+                    self.error.emit(f"Error reading serial: {e}")
+                    self._port_lost.emit()
+                break
+            self._consume(chunk)
+
+
+class LogWriterSignals(QObject):
+    """Signals emitted by LogWriter back on the GUI thread"""
+    saved = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+
+class LogWriter(QRunnable):
+    """Write a log snapshot to disk on a QThreadPool worker"""
+
+    def __init__(self, filename, text, signals):
+        super().__init__()
+        self.filename = filename
+        self.text = text
+        self.signals = signals
+
+    def run(self):
+        try:
+            with open(self.filename, 'w', encoding='utf-8') as f:
+                f.write(self.text)
+            self.signals.saved.emit(self.filename)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+# Log timestamps only change once a second; format them once per second
+_LAST_TS_SEC = 0
+_LAST_TS_STR = ""
+
+
+def _log_timestamp():
+    """Return the current time as HH:MM:SS, reformatting at most once a second"""
+    global _LAST_TS_SEC, _LAST_TS_STR
+    sec = int(time.time())
+    if sec != _LAST_TS_SEC:
+        _LAST_TS_STR = time.strftime("%H:%M:%S", time.localtime(sec))
+        _LAST_TS_SEC = sec
+    return _LAST_TS_STR
+
+
+# Per-accent ModernButton QSS blocks, built once and reused across themes
+_BUTTON_QSS_CACHE = {}
 
 
 class ModernButton(QPushButton):
     """Custom styled button with modern appearance"""
+    ACCENT_COLORS = ("#2196F3", "#4CAF50", "#F44336", "#FF9800", "#9C27B0")
+    _LIGHTEN = {
+        "#2196F3": "#42A5F5",
+        "#4CAF50": "#66BB6A",
+        "#F44336": "#EF5350",
+        "#FF9800": "#FFA726",
+        "#9C27B0": "#AB47BC",
+    }
+    _DARKEN = {
+        "#2196F3": "#1976D2",
+        "#4CAF50": "#388E3C",
+        "#F44336": "#D32F2F",
+        "#FF9800": "#F57C00",
+        "#9C27B0": "#7B1FA2",
+    }
+
     def __init__(self, text, color="#2196F3", parent=None):
         super().__init__(text, parent)
         self.default_color = color
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
+        # Appearance comes from the shared window stylesheet (see
+        # ModernButton.stylesheet), selected through the "accent" property
+        self.setProperty("accent", color)
+        if color not in self.ACCENT_COLORS:
+            self.setStyleSheet(self._accent_qss(color))
+
+    @classmethod
+    def stylesheet(cls):
+        """Return the QSS shared by every ModernButton instance"""
+        base = """
+            ModernButton {
                 color: white;
                 border: none;
                 border-radius: 8px;
@@ -87,53 +272,161 @@ class ModernButton(QPushButton):
                 font-size: 14px;
                 font-weight: bold;
                 min-height: 40px;
+            }
+            ModernButton:disabled {
+                background-color: #CCCCCC;
+                color: #666666;
+            }
+        """
+        return base + "".join(cls._accent_qss(color) for color in cls.ACCENT_COLORS)
+
+    @classmethod
+    def _accent_qss(cls, color):
+        """Return (cached) background rules for a single accent color"""
+        qss = _BUTTON_QSS_CACHE.get(color)
+        if qss is None:
+            qss = f"""
+            ModernButton[accent="{color}"] {{
+                background-color: {color};
             }}
-            QPushButton:hover {{
-                background-color: {self._lighten_color(color)};
+            ModernButton[accent="{color}"]:hover {{
+                background-color: {cls._lighten_color(color)};
             }}
-            QPushButton:pressed {{
-                background-color: {self._darken_color(color)};
+            ModernButton[accent="{color}"]:pressed {{
+                background-color: {cls._darken_color(color)};
             }}
-            QPushButton:disabled {{
+            ModernButton[accent="{color}"]:disabled {{
                 background-color: #CCCCCC;
-                color: #666666;
             }}
-        """)
+        """
+            _BUTTON_QSS_CACHE[color] = qss
+        return qss
 
-    def _lighten_color(self, color):
+    @classmethod
+    def _lighten_color(cls, color):
         """Lighten color for hover effect"""
-        color_map = {
-            "#2196F3": "#42A5F5",
-            "#4CAF50": "#66BB6A",
-            "#F44336": "#EF5350",
-            "#FF9800": "#FFA726",
-            "#9C27B0": "#AB47BC",
-        }
-        return color_map.get(color, "#64B5F6")
-
-    def _darken_color(self, color):
+        return cls._LIGHTEN.get(color, "#64B5F6")
+
+    @classmethod
+    def _darken_color(cls, color):
         """Darken color for pressed effect"""
-        color_map = {
-            "#2196F3": "#1976D2",
-            "#4CAF50": "#388E3C",
-            "#F44336": "#D32F2F",
-            "#FF9800": "#F57C00",
-            "#9C27B0": "#7B1FA2",
-        }
-        return color_map.get(color, "#1976D2")
+        return cls._DARKEN.get(color, "#1976D2")
+
+
+# Application-wide dark theme, installed once on the QApplication
+_APP_QSS = """
+    QMainWindow {
+        background-color: #1E1E1E;
+    }
+    QWidget {
+        background-color: #1E1E1E;
+        color: #E0E0E0;
+    }
+    QGroupBox {
+        border: 2px solid #3C3C3C;
+        border-radius: 8px;
+        margin-top: 12px;
+        padding-top: 12px;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+        color: #2196F3;
+    }
+    QLabel {
+        color: #E0E0E0;
+    }
+    QComboBox {
+        background-color: #2C2C2C;
+        border: 2px solid #3C3C3C;
+        border-radius: 6px;
+        padding: 8px;
+        color: #E0E0E0;
+        min-height: 30px;
+    }
+    QComboBox:hover {
+        border-color: #2196F3;
+    }
+    QComboBox::drop-down {
+        border: none;
+    }
+    QPlainTextEdit {
+        background-color: #252525;
+        border: 2px solid #3C3C3C;
+        border-radius: 6px;
+        padding: 8px;
+        color: #E0E0E0;
+    }
+    QSlider::groove:horizontal {
+        border: 1px solid #3C3C3C;
+        height: 8px;
+        background: #2C2C2C;
+        border-radius: 4px;
+    }
+    QSlider::handle:horizontal {
+        background: #2196F3;
+        border: 2px solid #1976D2;
+        width: 18px;
+        margin: -5px 0;
+        border-radius: 9px;
+    }
+    QSlider::handle:horizontal:hover {
+        background: #42A5F5;
+    }
+    QProgressBar {
+        border: 2px solid #3C3C3C;
+        border-radius: 6px;
+        background-color: #2C2C2C;
+        text-align: center;
+        color: white;
+    }
+    QProgressBar::chunk {
+        background-color: #2196F3;
+        border-radius: 4px;
+    }
+    ModernButton#connectBtn[connected="true"] {
+        background-color: #F44336;
+    }
+    ModernButton#connectBtn[connected="true"]:hover {
+        background-color: #EF5350;
+    }
+    ModernButton#connectBtn[connected="true"]:pressed {
+        background-color: #D32F2F;
+    }
+""" + ModernButton.stylesheet()
 
 
 class BoatControlGUI(QMainWindow):
     """Main GUI window for boat control"""
-    
+    LOG_FLUSH_INTERVAL_MS = 100
+    LOG_BUFFER_LIMIT = 500
+    LOG_MAX_LINES = 2000
+    VELOCITY_DEBOUNCE_MS = 100
+    _COMMAND_NAMES = {
+        'w': 'ADELANTE',
+        's': 'ATRAS',
+        'a': 'IZQUIERDA',
+        'd': 'DERECHA',
+        'p': 'PARAR'
+    }
+
     def __init__(self):
         super().__init__()
         self.serial_thread = SerialThread()
         self.serial_thread.data_received.connect(self.on_serial_data)
         self.serial_thread.connection_status.connect(self.on_connection_status)
+        self.serial_thread.error.connect(self.on_serial_error)
+
+        self._log_writer_signals = LogWriterSignals()
+        self._log_writer_signals.saved.connect(self.on_log_saved)
+        self._log_writer_signals.failed.connect(self.on_log_save_failed)
         
         self.current_velocity = 200
         self.is_connected = False
+        self._last_ports = None
         
         self.init_ui()
         self.refresh_ports()
@@ -145,6 +438,10 @@ class BoatControlGUI(QMainWindow):
         
         # Set modern dark theme
         self.set_dark_theme()
+        self.create_fonts()
+        # Plain widgets and labels use the application font; the QSS no
+        # longer sets fonts for them
+        QApplication.instance().setFont(self._font_label)
         
         # Central widget
         central_widget = QWidget()
@@ -172,91 +469,47 @@ class BoatControlGUI(QMainWindow):
         self.setStatusBar(self.statusBar)
         self.statusBar.showMessage("Ready - Not connected")
         
-        # Update timer for telemetry
+        # Update timer for telemetry (only runs while connected)
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_telemetry)
-        self.update_timer.start(1000)
+
+        # Log lines are buffered and written to the widget in one pass
+        self._log_buffer = []
+        self._log_formats = {}
+        self._log_flush_timer = QTimer()
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+
+        # Debounce velocity slider writes
+        self._velocity_timer = QTimer(self)
+        self._velocity_timer.setSingleShot(True)
+        self._velocity_timer.setInterval(self.VELOCITY_DEBOUNCE_MS)
+        self._velocity_timer.timeout.connect(self._send_velocity)
 
     def set_dark_theme(self):
         """Apply modern dark theme"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1E1E1E;
-            }
-            QWidget {
-                background-color: #1E1E1E;
-                color: #E0E0E0;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            QGroupBox {
-                border: 2px solid #3C3C3C;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding-top: 12px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-                color: #2196F3;
-            }
-            QLabel {
-                color: #E0E0E0;
-                font-size: 13px;
-            }
-            QComboBox {
-                background-color: #2C2C2C;
-                border: 2px solid #3C3C3C;
-                border-radius: 6px;
-                padding: 8px;
-                color: #E0E0E0;
-                min-height: 30px;
-            }
-            QComboBox:hover {
-                border-color: #2196F3;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QTextEdit {
-                background-color: #252525;
-                border: 2px solid #3C3C3C;
-                border-radius: 6px;
-                padding: 8px;
-                color: #E0E0E0;
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 12px;
-            }
-            QSlider::groove:horizontal {
-                border: 1px solid #3C3C3C;
-                height: 8px;
-                background: #2C2C2C;
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                background: #2196F3;
-                border: 2px solid #1976D2;
-                width: 18px;
-                margin: -5px 0;
-                border-radius: 9px;
-            }
-            QSlider::handle:horizontal:hover {
-                background: #42A5F5;
-            }
-            QProgressBar {
-                border: 2px solid #3C3C3C;
-                border-radius: 6px;
-                background-color: #2C2C2C;
-                text-align: center;
-                color: white;
-            }
-            QProgressBar::chunk {
-                background-color: #2196F3;
-                border-radius: 4px;
-            }
-        """)
+        # The theme lives on the QApplication so it is parsed once per
+        # process; main() installs it, this covers other entry points
+        app = QApplication.instance()
+        if app.styleSheet() != _APP_QSS:
+            app.setStyleSheet(_APP_QSS)
+
+    def create_fonts(self):
+        """Create the fonts shared by labels and the log view"""
+        def make_font(families, pixel_size, bold=False):
+            font = QFont()
+            font.setFamilies(families)
+            font.setPixelSize(pixel_size)
+            font.setBold(bold)
+            return font
+
+        ui_families = ["Segoe UI", "Arial", "sans-serif"]
+        self._font_label = make_font(ui_families, 13)
+        self._font_label_bold = make_font(ui_families, 13, bold=True)
+        self._font_status = make_font(ui_families, 14)
+        self._font_big = make_font(ui_families, 16, bold=True)
+        self._font_mono = make_font(["Consolas", "Courier New", "monospace"], 12)
 
     def create_connection_group(self):
         """Create connection control group"""
@@ -279,13 +532,16 @@ class BoatControlGUI(QMainWindow):
         # Connect/Disconnect buttons
         btn_layout = QHBoxLayout()
         self.connect_btn = ModernButton("Connect", "#4CAF50")
+        self.connect_btn.setObjectName("connectBtn")
+        self.connect_btn.setProperty("connected", False)
         self.connect_btn.clicked.connect(self.toggle_connection)
         btn_layout.addWidget(self.connect_btn)
         layout.addLayout(btn_layout)
         
         # Connection status indicator
         self.status_label = QLabel("● Disconnected")
-        self.status_label.setStyleSheet("color: #F44336; font-weight: bold;")
+        self.status_label.setFont(self._font_label_bold)
+        self.status_label.setStyleSheet("color: #F44336;")
         layout.addWidget(self.status_label)
         
         group.setLayout(layout)
@@ -347,7 +603,8 @@ class BoatControlGUI(QMainWindow):
         # Velocity display
         self.velocity_label = QLabel(f"Current: {self.current_velocity} PWM")
         self.velocity_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.velocity_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #2196F3;")
+        self.velocity_label.setFont(self._font_big)
+        self.velocity_label.setStyleSheet("color: #2196F3;")
         layout.addWidget(self.velocity_label)
         
         # Preset buttons
@@ -377,11 +634,13 @@ class BoatControlGUI(QMainWindow):
         
         # Status indicators
         self.boat_status_label = QLabel("Boat Status: Waiting...")
-        self.boat_status_label.setStyleSheet("font-size: 14px; padding: 8px;")
+        self.boat_status_label.setFont(self._font_status)
+        self.boat_status_label.setStyleSheet("padding: 8px;")
         layout.addWidget(self.boat_status_label)
         
         self.last_command_label = QLabel("Last Command: None")
-        self.last_command_label.setStyleSheet("font-size: 14px; padding: 8px;")
+        self.last_command_label.setFont(self._font_status)
+        self.last_command_label.setStyleSheet("padding: 8px;")
         layout.addWidget(self.last_command_label)
         
         # Signal strength indicator (simulated)
@@ -394,10 +653,11 @@ class BoatControlGUI(QMainWindow):
         
         # Connection time
         self.connection_time_label = QLabel("Connection Time: --:--:--")
-        self.connection_time_label.setStyleSheet("font-size: 13px; padding: 8px;")
+        self.connection_time_label.setStyleSheet("padding: 8px;")
         layout.addWidget(self.connection_time_label)
         
-        self.connection_start_time = None
+        # Monotonic clock for the connection time display
+        self._conn_elapsed = QElapsedTimer()
         
         group.setLayout(layout)
         return group
@@ -407,9 +667,14 @@ class BoatControlGUI(QMainWindow):
         group = QGroupBox("📝 Serial Monitor Log")
         layout = QVBoxLayout()
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
+        self.log_text.setFont(self._font_mono)
         self.log_text.setReadOnly(True)
         self.log_text.setMinimumHeight(300)
+        # Bound memory on long sessions: old lines drop off the top and no
+        # undo history is kept for appended text
+        self.log_text.document().setMaximumBlockCount(self.LOG_MAX_LINES)
+        self.log_text.setUndoRedoEnabled(False)
         layout.addWidget(self.log_text)
         
         # Log control buttons
@@ -430,10 +695,15 @@ class BoatControlGUI(QMainWindow):
 
     def refresh_ports(self):
         """Refresh available COM ports"""
-        self.port_combo.clear()
-        ports = serial.tools.list_ports.comports()
-        for port in ports:
-            self.port_combo.addItem(f"{port.device} - {port.description}")
+        ports = [(port.device, port.description) for port in serial.tools.list_ports.comports()]
+        # Only rebuild the combo box when the port list actually changed
+        if ports != self._last_ports:
+            self._last_ports = ports
+            blocker = QSignalBlocker(self.port_combo)
+            self.port_combo.clear()
+            for device, description in ports:
+                self.port_combo.addItem(f"{device} - {description}")
+            blocker.unblock()
         
         if ports:
             self.log_message("✓ Ports refreshed", "#4CAF50")
@@ -445,33 +715,49 @@ class BoatControlGUI(QMainWindow):
         if not self.is_connected:
             port = self.port_combo.currentText().split(" - ")[0]
             if self.serial_thread.connect(port):
-                self.serial_thread.start()
+                self.serial_thread.start_reading()
                 self.is_connected = True
                 self.connect_btn.setText("Disconnect")
-                self.connect_btn.setStyleSheet(self.connect_btn.styleSheet().replace("#4CAF50", "#F44336"))
-                self.connection_start_time = datetime.now()
+                self.set_connect_button_state(True)
+                self._conn_elapsed.start()
                 self.log_message(f"✓ Connected to {port}", "#4CAF50")
         else:
+            # connection_status(False) resets the connection state
             self.serial_thread.disconnect()
             self.serial_thread.wait()
-            self.is_connected = False
-            self.connect_btn.setText("Connect")
-            self.connect_btn.setStyleSheet(self.connect_btn.styleSheet().replace("#F44336", "#4CAF50"))
-            self.connection_start_time = None
             self.log_message("⚠ Disconnected", "#FF9800")
 
+    def set_connect_button_state(self, connected):
+        """Restyle the connect button through its "connected" property"""
+        self.connect_btn.setProperty("connected", connected)
+        self.connect_btn.style().unpolish(self.connect_btn)
+        self.connect_btn.style().polish(self.connect_btn)
+
     def on_connection_status(self, connected):
         """Handle connection status change"""
         if connected:
             self.status_label.setText("● Connected")
-            self.status_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
+            self.status_label.setStyleSheet("color: #4CAF50;")
             self.set_control_buttons_enabled(True)
             self.statusBar.showMessage(f"Connected to {self.port_combo.currentText()}")
+            self.update_timer.start(1000)
         else:
+            # Every disconnect path (button, failed connect, read error on a
+            # vanished device) ends here, so the connection state is reset
+            # here rather than by the caller
+            self.is_connected = False
+            self.connect_btn.setText("Connect")
+            self.set_connect_button_state(False)
+            self._conn_elapsed.invalidate()
             self.status_label.setText("● Disconnected")
-            self.status_label.setStyleSheet("color: #F44336; font-weight: bold;")
+            self.status_label.setStyleSheet("color: #F44336;")
             self.set_control_buttons_enabled(False)
             self.statusBar.showMessage("Not connected")
+            self.update_timer.stop()
+
+    def on_serial_error(self, message):
+        """Log a serial failure reported by SerialThread"""
+        self.log_message(f"✗ {message}", "#F44336")
 
     def set_control_buttons_enabled(self, enabled):
         """Enable/disable control buttons"""
@@ -486,14 +772,7 @@ class BoatControlGUI(QMainWindow):
         # Send command with velocity parameter
         full_command = f"{command}"
         if self.serial_thread.send_command(full_command):
-            command_names = {
-                'w': 'ADELANTE',
-                's': 'ATRAS',
-                'a': 'IZQUIERDA',
-                'd': 'DERECHA',
-                'p': 'PARAR'
-            }
-            cmd_name = command_names.get(command, command)
+            cmd_name = self._COMMAND_NAMES.get(command, command)
             self.last_command_label.setText(f"Last Command: {cmd_name} @ {self.current_velocity} PWM")
             self.log_message(f"→ Sent: {cmd_name} @ PWM {self.current_velocity}", "#2196F3")
 
@@ -501,49 +780,81 @@ class BoatControlGUI(QMainWindow):
         """Handle velocity slider change"""
         self.current_velocity = value
         self.velocity_label.setText(f"Current: {value} PWM")
-        # Update velocity in real-time without sending command
-        # Velocity will be included automatically with next movement command
-        if self.is_connected and hasattr(self, '_last_velocity_update'):
-            # Debounce: only send velocity command every 500ms
-            if (datetime.now() - self._last_velocity_update).total_seconds() > 0.5:
-                self.serial_thread.send_command(f"vel {value}")
-                self.log_message(f"⚡ Velocity set to {value}", "#FF9800")
-                self._last_velocity_update = datetime.now()
-        elif self.is_connected:
-            self._last_velocity_update = datetime.now()
-            self.serial_thread.send_command(f"vel {value}")
-            self.log_message(f"⚡ Velocity set to {value}", "#FF9800")
+        # Coalesce slider movement: the velocity command is sent once the
+        # slider has been still for VELOCITY_DEBOUNCE_MS
+        if self.is_connected:
+            self._velocity_timer.start()
+
+    def _send_velocity(self):
+        """Send the current velocity to the ESP32"""
+        if self.is_connected:
+            self.serial_thread.send_command(f"vel {self.current_velocity}")
+            self.log_message(f"⚡ Velocity set to {self.current_velocity}", "#FF9800")
 
     def set_velocity(self, value):
         """Set velocity to preset value"""
         self.velocity_slider.setValue(value)
 
-    def on_serial_data(self, data):
-        """Handle incoming serial data"""
-        self.log_message(f"← {data}", "#4CAF50")
-        
-        # Parse boat status
-        if "ESTADO DEL BARCO" in data or "Estado:" in data:
-            self.boat_status_label.setText(f"Boat Status: {data}")
+    def on_serial_data(self, lines):
+        """Handle a batch of incoming (line, is_status) serial lines"""
+        for data, is_status in lines:
+            self.log_message(f"← {data}", "#4CAF50")
+
+            # Boat status lines ("ESTADO DEL BARCO" / "Estado:")
+            if is_status:
+                self.boat_status_label.setText(f"Boat Status: {data}")
 
     def update_telemetry(self):
         """Update telemetry display"""
-        if self.connection_start_time:
-            elapsed = datetime.now() - self.connection_start_time
-            hours, remainder = divmod(int(elapsed.total_seconds()), 3600)
+        if self._conn_elapsed.isValid():
+            elapsed = self._conn_elapsed.elapsed() // 1000
+            hours, remainder = divmod(elapsed, 3600)
             minutes, seconds = divmod(remainder, 60)
             self.connection_time_label.setText(f"Connection Time: {hours:02d}:{minutes:02d}:{seconds:02d}")
 
     def log_message(self, message, color="#E0E0E0"):
         """Add message to log with timestamp and color"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f'<span style="color: {color};">[{timestamp}] {message}</span>')
-        self.log_text.verticalScrollBar().setValue(
-            self.log_text.verticalScrollBar().maximum()
-        )
+        timestamp = _log_timestamp()
+        self._log_buffer.append((f"[{timestamp}] {message}", color))
+        if len(self._log_buffer) >= self.LOG_BUFFER_LIMIT:
+            self._flush_log()
+        elif not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        """Write buffered log lines to the log widget in a single insert"""
+        self._log_flush_timer.stop()
+        if not self._log_buffer:
+            return
+        # Follow new output only if the user hasn't scrolled up to read
+        scrollbar = self.log_text.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+        document = self.log_text.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        # One block per line so the document's block-count cap trims by line
+        cursor.beginEditBlock()
+        for i, (line, color) in enumerate(self._log_buffer):
+            if i or not document.isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(line, self._log_format(color))
+        cursor.endEditBlock()
+        self._log_buffer.clear()
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def _log_format(self, color):
+        """Return the (cached) character format for a log line color"""
+        fmt = self._log_formats.get(color)
+        if fmt is None:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._log_formats[color] = fmt
+        return fmt
 
     def clear_log(self):
         """Clear log display"""
+        self._log_buffer.clear()
         self.log_text.clear()
         self.log_message("Log cleared", "#9C27B0")
 
@@ -551,12 +862,18 @@ class BoatControlGUI(QMainWindow):
         """Save log to file"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"boat_control_log_{timestamp}.txt"
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(self.log_text.toPlainText())
-            self.log_message(f"✓ Log saved to {filename}", "#4CAF50")
-        except Exception as e:
-            self.log_message(f"✗ Error saving log: {e}", "#F44336")
+        self._flush_log()
+        # Snapshot on the GUI thread, write on a pool thread
+        writer = LogWriter(filename, self.log_text.toPlainText(), self._log_writer_signals)
+        QThreadPool.globalInstance().start(writer)
+
+    def on_log_saved(self, filename):
+        """Report a completed background log save"""
+        self.log_message(f"✓ Log saved to {filename}", "#4CAF50")
+
+    def on_log_save_failed(self, error):
+        """Report a failed background log save"""
+        self.log_message(f"✗ Error saving log: {error}", "#F44336")
 
     def closeEvent(self, event):
         """Handle window close event"""
@@ -570,6 +887,7 @@ def main():
     """Main application entry point"""
     app = QApplication(sys.argv)
     app.setStyle('Fusion')  # Modern look
+    app.setStyleSheet(_APP_QSS)
     
     window = BoatControlGUI()
     window.show()
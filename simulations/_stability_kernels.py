@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Numba kernels for StabilityCalculator.batch_heel
+Kept out of stability_analysis so that importing it never loads Numba
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+# Batches at least this long use the multi-threaded kernel
+PARALLEL_BATCH_MIN = 10000
+
+
+def batch_heel(cargo, offsets, base_moment, base_mass, cargo_cg, km, displacement):
+    """
+    GM and offset-load heel for each (cargo mass, lateral offset) sample.
+    Same formulas as StabilityCalculator.combined_cg / metacentric_height /
+    heel_angle_from_offset_load, written as one loop so it can be compiled
+    by Numba.
+    """
+    n = cargo.shape[0]
+    gm = np.empty(n)
+    heel = np.empty(n)
+    for i in prange(n):
+        kg = (base_moment + cargo[i] * cargo_cg) / (base_mass + cargo[i])
+        gm[i] = km - kg
+        if gm[i] <= 0:
+            heel[i] = 90.0  # Unstable
+        else:
+            heel[i] = math.degrees(math.atan(cargo[i] * offsets[i] / (displacement * gm[i])))
+    return gm, heel
+
+
+if HAS_NUMBA:
+    batch_heel_parallel = njit(cache=True, fastmath=True, parallel=True)(batch_heel)
+    batch_heel = njit(cache=True, fastmath=True)(batch_heel)
+else:
+    batch_heel_parallel = batch_heel
@@ -10,70 +10,360 @@ from pathlib import Path
 from datetime import datetime
 import subprocess
 import json
+import functools
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QLabel, QLineEdit, QPushButton, QTextEdit, QGroupBox,
+    QTabWidget, QLabel, QLineEdit, QPushButton, QPlainTextEdit, QGroupBox,
     QSpinBox, QDoubleSpinBox, QProgressBar, QFileDialog, QMessageBox,
-    QSplitter, QFrame, QScrollArea, QComboBox
+    QSplitter, QFrame, QScrollArea, QComboBox, QCheckBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QIcon, QPixmap, QPalette, QColor
+from PyQt6.QtCore import (
+    Qt, QThread, QObject, pyqtSignal, pyqtSlot, QTimer, QSignalBlocker
+)
+from PyQt6.QtGui import QFont, QIcon, QPixmap, QPalette, QColor, QVector3D
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 import matplotlib
 matplotlib.use('QtAgg')
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
 
 import numpy as np
 
-# Import analysis modules
-try:
-    from stability_analysis import (
-        HullGeometry, MassDistribution, StabilityCalculator
-    )
-    from resistance_calc import (
-        HullParameters, FluidProperties, ITTCResistanceCalculator
-    )
-    from visualize_hull_3d import create_hull_mesh
-except ImportError as e:
-    print(f"Warning: Could not import analysis modules: {e}")
-
-
-class AnalysisWorker(QThread):
-    """Worker thread for running analyses without blocking UI"""
-    progress = pyqtSignal(int)
-    status = pyqtSignal(str)
-    finished = pyqtSignal(dict)
+# The analysis modules (and through them matplotlib.pyplot) are imported
+# on first use inside the worker, keeping them off the startup path
+
+# Water density (kg/m³) and gravity (m/s²), same as the FluidProperties
+# defaults used by the resistance calculations
+_RHO_W = 1000.0
+_G = 9.81
+
+# Summary report rules
+_EQ90 = "=" * 90
+_DASH90 = "-" * 90
+
+# Fixed resistance sweep; shared by every run and by the results, so it
+# is made read-only
+_DEFAULT_VELOCITIES = np.linspace(0.1, 1.5, 30)
+_DEFAULT_VELOCITIES.setflags(write=False)
+
+# Dark plot theme, applied to matplotlib's rcParams once in main() so
+# figures and axes are created already styled
+_MPL_DARK_RC = {
+    'figure.facecolor': '#1e1e1e',
+    'axes.facecolor': '#1e1e1e',
+    'axes.edgecolor': '#3d3d3d',
+    'axes.labelcolor': '#e0e0e0',
+    'axes.titlecolor': '#14a085',
+    'axes.titleweight': 'bold',
+    'xtick.color': '#e0e0e0',
+    'ytick.color': '#e0e0e0',
+    'grid.color': '#3d3d3d',
+    'grid.alpha': 0.3,
+    'legend.facecolor': '#2b2b2b',
+    'legend.edgecolor': '#3d3d3d',
+    'legend.labelcolor': '#e0e0e0',
+}
+
+# Window theme and header fonts, built once per process
+_DARK_QSS = """
+    QMainWindow, QWidget {
+        background-color: #1e1e1e;
+        color: #ffffff;
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 10pt;
+    }
+    QGroupBox {
+        border: 2px solid #3d3d3d;
+        border-radius: 8px;
+        margin-top: 12px;
+        padding-top: 10px;
+        font-weight: bold;
+        color: #14a085;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QLabel {
+        color: #e0e0e0;
+    }
+    QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {
+        background-color: #2b2b2b;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 6px;
+        color: #ffffff;
+    }
+    QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {
+        border: 2px solid #0d7377;
+    }
+    QPushButton {
+        background-color: #0d7377;
+        color: #ffffff;
+        border: none;
+        border-radius: 5px;
+        padding: 10px 20px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #14a085;
+    }
+    QPushButton:pressed {
+        background-color: #0a5f62;
+    }
+    QPushButton:disabled {
+        background-color: #3d3d3d;
+        color: #7d7d7d;
+    }
+    QPlainTextEdit {
+        background-color: #2b2b2b;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        color: #e0e0e0;
+        font-family: 'Consolas', monospace;
+    }
+    QProgressBar {
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        text-align: center;
+        background-color: #2b2b2b;
+    }
+    QProgressBar::chunk {
+        background-color: #0d7377;
+        border-radius: 3px;
+    }
+    QScrollBar:vertical {
+        background: #2b2b2b;
+        width: 12px;
+        border-radius: 6px;
+    }
+    QScrollBar::handle:vertical {
+        background: #0d7377;
+        border-radius: 6px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: #14a085;
+    }
+"""
+_TITLE_FONT = QFont("Segoe UI", 16, QFont.Weight.Bold)
+_SUBTITLE_FONT = QFont("Segoe UI", 9)
+
+
+@dataclass(slots=True)
+class StabilityResults:
+    """Hydrostatic and flotation results for one hull/mass configuration"""
+    hull: "HullGeometry"
+    displacement: float  # Displaced volume (m³)
+    displacement_mass: float  # Displaced mass (kg)
+    kb: float  # Center of buoyancy above keel (m)
+    bm: float  # Metacentric radius (m)
+    kg: float  # Combined center of gravity above keel (m)
+    gm: float  # Metacentric height (m)
+    aw: float  # Waterplane area (m²)
+    total_mass: float  # Total mass (kg)
+    buoyancy_force: float  # (N)
+    weight_force: float  # (N)
+    net_force: float  # Buoyancy minus weight (N)
+    floats: bool
+
+
+@dataclass(slots=True)
+class ResistanceResults:
+    """
+    ITTC-1957 resistance sweep, one array entry per velocity. The fields
+    are the rows of one (6, n) block, so at(i) reads every quantity at a
+    velocity in a single column fetch
+    """
+    velocities: np.ndarray  # (m/s)
+    reynolds: np.ndarray
+    froude: np.ndarray
+    cf: np.ndarray  # Friction coefficient
+    resistance: np.ndarray  # Total resistance (N)
+    power: np.ndarray  # Effective power (W)
+    table: np.ndarray  # (6, n) block the fields above are views of
+
+    @classmethod
+    def allocate(cls, n):
+        """Uninitialised results for an n-point sweep"""
+        table = np.empty((6, n))
+        return cls(*table, table=table)
+
+    def at(self, idx):
+        """(velocity, Re, Fr, Cf, resistance, power) at sweep index idx"""
+        return self.table[:, idx]
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_mesh(L_total, L_bow, B, H, draft):
+    from visualize_hull_3d import create_hull_mesh, dedupe_mesh
+    vertices, faces = create_hull_mesh(L_total=L_total, L_bow=L_bow, B=B, H=H,
+                                       draft=draft)
+    return dedupe_mesh(vertices, faces)
+
+
+def _mesh(L_total, L_bow, B, H, draft):
+    """
+    Memoized create_hull_mesh. Dimensions are rounded so spinbox float
+    noise does not cause cache misses; the returned arrays are shared,
+    callers must not modify them.
+    """
+    return _cached_mesh(*(round(x, 6) for x in (L_total, L_bow, B, H, draft)))
+
+
+def _face_index(faces):
+    """
+    Faces as one (F, K) index array. The hull mixes triangles and quads,
+    so shorter faces are padded by repeating their last vertex, which
+    leaves the drawn polygon unchanged.
+    """
+    k = max(len(face) for face in faces)
+    return np.array([list(face) + [face[-1]] * (k - len(face)) for face in faces],
+                    dtype=np.intp)
+
+
+def _face_vertices(vertices, faces):
+    """Gather face corners into one (F, K, 3) array for Poly3DCollection"""
+    return vertices[_face_index(faces)]
+
+
+def _triangulate(faces):
+    """
+    Fan-split every face into triangles, (T, 3), for GLMeshItem; padded
+    corners only add zero-area triangles
+    """
+    index = _face_index(faces)
+    k = index.shape[1]
+    tris = [np.stack([index[:, 0], index[:, i], index[:, i + 1]], axis=1)
+            for i in range(1, k - 1)]
+    return np.concatenate(tris)
+
+
+def _downsample_faces(faces, max_faces=2000):
+    """
+    Uniformly thin a face list to about max_faces for display only;
+    analysis always works on the full mesh
+    """
+    stride = max(1, len(faces) // max_faces)
+    return faces[::stride]
+
+
+@functools.lru_cache(maxsize=1)
+def _gl_module():
+    """
+    pyqtgraph.opengl for the OpenGL 3D view, imported when the view is
+    first needed (it pulls in PyOpenGL); None when not installed, in which
+    case the matplotlib 3D canvas is used
+    """
+    try:
+        import pyqtgraph.opengl as gl
+    except ImportError:
+        return None
+    return gl
+
+
+@functools.lru_cache(maxsize=8)
+def _wetted_area(length, beam, height, bow_length, draft):
+    """
+    Wetted surface (m²) of the hull with the GUI's dimensions, from
+    CustomHullGeometry.wetted_surface_area so every tool uses one formula
+    """
+    from hull_geometry import CustomHullGeometry
+    hull = CustomHullGeometry()
+    hull.length = length
+    hull.beam = beam
+    hull.height = height
+    hull.bow_length = bow_length
+    hull.precompute()
+    return hull.wetted_surface_area(draft)
+
+
+class AnalysisWorker(QObject):
+    """
+    Runs analyses without blocking the UI. A single instance lives on a
+    long-lived QThread; jobs arrive through the queued submit() slot and
+    results are reported as finished(analysis_type, results). Progress and
+    status are only stored in latest_progress / latest_status, which the
+    window polls while a job runs.
+    """
+    finished = pyqtSignal(str, object)
     error = pyqtSignal(str)
 
-    def __init__(self, analysis_type, parameters):
+    # Parameters each cached analysis depends on
+    STABILITY_KEYS = ('length', 'beam', 'height', 'bow_length', 'draft',
+                      'hull_mass', 'cargo_mass', 'electronics_mass')
+    GEOMETRY_KEYS = ('length', 'beam', 'height', 'bow_length', 'draft')
+
+    def __init__(self, analysis_type=None, parameters=None, cache=None):
         super().__init__()
         self.analysis_type = analysis_type
         self.parameters = parameters
+        # Results shared across workers, keyed by analysis and inputs
+        self.cache = cache if cache is not None else {}
+        # Latest-only progress state; plain int/str writes are atomic
+        self.latest_progress = 0
+        self.latest_status = ""
+        # Set while run_complete_analysis runs the sub-analyses concurrently
+        self._parallel = False
+        self._dispatch = {
+            "stability": self.run_stability_analysis,
+            "resistance": self.run_resistance_analysis,
+            "3d_visualization": self.run_3d_visualization,
+            "complete": self.run_complete_analysis,
+        }
+
+    def _cache_key(self, analysis, keys):
+        """Build a cache key from the parameters an analysis depends on"""
+        return (analysis,) + tuple(self.parameters[k] for k in keys)
+
+    def _set_progress(self, value):
+        """Report sub-analysis progress, unless it is one of several running in parallel"""
+        if not self._parallel:
+            self.latest_progress = value
+
+    def _set_status(self, message):
+        """Report the current analysis step"""
+        self.latest_status = message
+
+    @pyqtSlot(str, dict)
+    def submit(self, analysis_type, parameters):
+        """Run one analysis job (called on the worker thread)"""
+        self.analysis_type = analysis_type
+        self.parameters = parameters
+        self.run()
 
     def run(self):
         try:
-            if self.analysis_type == "stability":
-                results = self.run_stability_analysis()
-            elif self.analysis_type == "resistance":
-                results = self.run_resistance_analysis()
-            elif self.analysis_type == "3d_visualization":
-                results = self.run_3d_visualization()
-            elif self.analysis_type == "complete":
-                results = self.run_complete_analysis()
-            else:
-                raise ValueError(f"Unknown analysis type: {self.analysis_type}")
+            try:
+                analysis = self._dispatch[self.analysis_type]
+            except KeyError:
+                raise ValueError(f"Unknown analysis type: {self.analysis_type}") from None
+            results = analysis()
             
-            self.finished.emit(results)
+            self.finished.emit(self.analysis_type, results)
         except Exception as e:
             self.error.emit(str(e))
 
     def run_stability_analysis(self):
         """Run stability analysis with progress updates"""
-        self.status.emit("Calculating hull geometry...")
-        self.progress.emit(10)
+        from stability_analysis import (
+            HullGeometry, MassDistribution, StabilityCalculator
+        )
+        key = self._cache_key('stability', self.STABILITY_KEYS)
+        if key in self.cache:
+            self._set_progress(100)
+            self._set_status("Stability analysis complete! (cached)")
+            return self.cache[key]
+        
+        self._set_status("Calculating hull geometry...")
+        self._set_progress(10)
         
         params = self.parameters
         hull = HullGeometry(
@@ -97,67 +387,75 @@ class AnalysisWorker(QThread):
         # Create stability calculator
         calc = StabilityCalculator(hull)
         
-        self.status.emit("Computing displacement volume...")
-        self.progress.emit(25)
+        self._set_status("Computing displacement volume...")
+        self._set_progress(25)
         displacement = calc.displacement_volume()
         
-        self.status.emit("Calculating center of buoyancy...")
-        self.progress.emit(40)
+        self._set_status("Calculating center of buoyancy...")
+        self._set_progress(40)
         kb = calc.center_of_buoyancy()
         
-        self.status.emit("Computing waterplane area...")
-        self.progress.emit(55)
+        self._set_status("Computing waterplane area...")
+        self._set_progress(55)
         aw = calc.waterplane_area()
         
-        self.status.emit("Calculating metacentric radius...")
-        self.progress.emit(70)
+        self._set_status("Calculating metacentric radius...")
+        self._set_progress(70)
         bm = calc.metacentric_radius()
         
-        self.status.emit("Computing metacentric height...")
-        self.progress.emit(85)
+        self._set_status("Computing metacentric height...")
+        self._set_progress(85)
         total_mass, kg = calc.combined_cg(masses)
         gm = calc.metacentric_height(kg)
         
         # Flotation analysis
-        self.status.emit("Analyzing flotation...")
-        self.progress.emit(95)
-        buoyancy_force = displacement * 1000 * 9.81
-        weight_force = total_mass * 9.81
+        self._set_status("Analyzing flotation...")
+        self._set_progress(95)
+        displacement_mass = displacement * _RHO_W
+        buoyancy_force = displacement_mass * _G
+        weight_force = total_mass * _G
         net_force = buoyancy_force - weight_force
         
-        results = {
-            'hull': hull,
-            'displacement': displacement,
-            'displacement_mass': displacement * 1000,
-            'kb': kb,
-            'bm': bm,
-            'kg': kg,
-            'gm': gm,
-            'aw': aw,
-            'total_mass': total_mass,
-            'buoyancy_force': buoyancy_force,
-            'weight_force': weight_force,
-            'net_force': net_force,
-            'floats': net_force >= 0
-        }
+        results = StabilityResults(
+            hull=hull,
+            displacement=displacement,
+            displacement_mass=displacement_mass,
+            kb=kb,
+            bm=bm,
+            kg=kg,
+            gm=gm,
+            aw=aw,
+            total_mass=total_mass,
+            buoyancy_force=buoyancy_force,
+            weight_force=weight_force,
+            net_force=net_force,
+            floats=net_force >= 0
+        )
+        self.cache[key] = results
         
-        self.progress.emit(100)
-        self.status.emit("Stability analysis complete!")
+        self._set_progress(100)
+        self._set_status("Stability analysis complete!")
         return results
 
     def run_resistance_analysis(self):
         """Run resistance analysis with progress updates"""
-        self.status.emit("Initializing resistance calculations...")
-        self.progress.emit(10)
+        from resistance_calc import (
+            HullParameters, FluidProperties, ITTCResistanceCalculator
+        )
+        self._set_status("Initializing resistance calculations...")
+        self._set_progress(10)
         
         params = self.parameters
+        wetted_area = params.get('wetted_area') or _wetted_area(
+            params['length'], params['beam'], params['height'],
+            params['bow_length'], params['draft'])
         
         # Create hull and fluid properties
         hull_params = HullParameters(
             length=params['length'],
             beam=params['beam'],
             draft=params['draft'],
-            wetted_area=params['wetted_area'],
+            wetted_area=wetted_area,
             form_factor=params['form_factor']
         )
         fluid = FluidProperties()
@@ -165,44 +463,37 @@ class AnalysisWorker(QThread):
         # Create resistance calculator
         calc = ITTCResistanceCalculator(hull_params, fluid)
         
-        velocities = np.linspace(0.1, 1.5, 30)
-        results = {
-            'velocities': velocities,
-            'reynolds': [],
-            'froude': [],
-            'cf': [],
-            'resistance': [],
-            'power': []
-        }
+        velocities = _DEFAULT_VELOCITIES
         
-        for i, v in enumerate(velocities):
-            progress = int(10 + (i / len(velocities)) * 85)
-            self.progress.emit(progress)
-            self.status.emit(f"Calculating for velocity {v:.2f} m/s...")
-            
-            re = calc.reynolds_number(v)
-            fr = calc.froude_number(v)
-            cf = calc.ittc_friction_coefficient(re)
-            rf = calc.friction_resistance(v, cf)
-            rv = calc.viscous_resistance(rf)
-            rw = calc.wave_resistance(v, fr)
-            rt = rv + rw
-            pe = rt * v
-            
-            results['reynolds'].append(re)
-            results['froude'].append(fr)
-            results['cf'].append(cf)
-            results['resistance'].append(rt)
-            results['power'].append(pe)
-        
-        self.progress.emit(100)
-        self.status.emit("Resistance analysis complete!")
+        # Whole sweep in one call (compiled kernel when Numba is available);
+        # the status text is only updated at start and end
+        self._set_progress(50)
+        re, fr, cf, rf, rv, rw = calc.sweep(velocities)
+        
+        # One preallocated float64 block, filled in place row by row
+        results = ResistanceResults.allocate(velocities.size)
+        results.velocities[:] = velocities
+        results.reynolds[:] = re
+        results.froude[:] = fr
+        results.cf[:] = cf
+        np.add(rv, rw, out=results.resistance)
+        np.multiply(results.resistance, velocities, out=results.power)
+        
+        self._set_progress(100)
+        self._set_status("Resistance analysis complete!")
         return results
 
     def run_3d_visualization(self):
         """Generate 3D hull visualization"""
-        self.status.emit("Creating 3D hull mesh...")
-        self.progress.emit(30)
+        from stability_analysis import HullGeometry
+        key = self._cache_key('3d', self.GEOMETRY_KEYS)
+        if key in self.cache:
+            self._set_progress(100)
+            self._set_status("3D visualization ready! (cached)")
+            return self.cache[key]
+        
+        self._set_status("Creating 3D hull mesh...")
+        self._set_progress(30)
         
         params = self.parameters
         hull = HullGeometry(
@@ -213,10 +504,10 @@ class AnalysisWorker(QThread):
             draft=params['draft']
         )
         
-        self.status.emit("Rendering 3D visualization...")
-        self.progress.emit(70)
+        self._set_status("Rendering 3D visualization...")
+        self._set_progress(70)
         
-        vertices, faces = create_hull_mesh(
+        vertices, faces = _mesh(
             L_total=hull.length,
             L_bow=hull.bow_length,
             B=hull.beam,
@@ -224,55 +515,172 @@ class AnalysisWorker(QThread):
             draft=hull.draft
         )
         
+        # Bounding box is computed once per mesh here, off the GUI thread,
+        # and cached with the rest of the results
         results = {
             'vertices': vertices,
             'faces': faces,
+            'bounds': (vertices.min(axis=0), vertices.max(axis=0)),
             'hull': hull
         }
+        self.cache[key] = results
         
-        self.progress.emit(100)
-        self.status.emit("3D visualization ready!")
+        self._set_progress(100)
+        self._set_status("3D visualization ready!")
         return results
 
     def run_complete_analysis(self):
-        """Run all analyses sequentially"""
+        """Run all analyses concurrently; they share no mutable state"""
+        parts = {
+            'stability': self.run_stability_analysis,
+            'resistance': self.run_resistance_analysis,
+            '3d': self.run_3d_visualization,
+        }
         all_results = {}
         
-        # Stability
-        self.status.emit("Running stability analysis...")
-        all_results['stability'] = self.run_stability_analysis()
-        
-        # Resistance
-        self.status.emit("Running resistance analysis...")
-        self.parameters['wetted_area'] = 0.165
-        self.parameters['form_factor'] = 0.2
-        all_results['resistance'] = self.run_resistance_analysis()
-        
-        # 3D Viz
-        self.status.emit("Generating 3D visualization...")
-        all_results['3d'] = self.run_3d_visualization()
-        
-        return all_results
+        # Sub-analysis progress would interleave, so report completed parts
+        self._set_status("Running stability, resistance and 3D analyses...")
+        self._parallel = True
+        try:
+            with ThreadPoolExecutor(max_workers=len(parts)) as executor:
+                futures = {executor.submit(fn): name for name, fn in parts.items()}
+                for done, future in enumerate(as_completed(futures), 1):
+                    all_results[futures[future]] = future.result()
+                    self.latest_progress = done * 100 // len(parts)
+        finally:
+            self._parallel = False
+        
+        return {name: all_results[name] for name in parts}
 
 
 class MatplotlibWidget(QWidget):
     """Matplotlib canvas embedded in PyQt6"""
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.figure = Figure(facecolor='#1e1e1e')
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        self.figure = Figure()
         self.canvas = FigureCanvas(self.figure)
         layout = QVBoxLayout()
         layout.addWidget(self.canvas)
         layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(layout)
+        # Axes and artists kept between updates, keyed by subplot / name
+        self._axes = {}
+        self._artists = {}
+        # Blitting: background without the animated artists, captured on
+        # every full draw, and the artists drawn on top of it
+        self._background = None
+        self._animated = []
+        # Set while a tight layout is pending for the next full draw
+        self._layout_pending = False
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         
     def clear(self):
         self.figure.clear()
-        self.canvas.draw()
+        self._axes.clear()
+        self._artists.clear()
+        self._background = None
+        self._animated.clear()
+        self.canvas.draw_idle()
+
+    def get_axes(self, subplot=111, setup=None, **subplot_kw):
+        """Return the retained Axes for a subplot, creating it on first use"""
+        ax = self._axes.get(subplot)
+        if ax is None:
+            ax = self.figure.add_subplot(subplot, **subplot_kw)
+            if setup is not None:
+                setup(ax)
+            self._axes[subplot] = ax
+        return ax
+
+    def update_line(self, name, x, y, subplot=111, setup=None, **kwargs):
+        """Create a named line on first call, afterwards only update its data"""
+        line = self._artists.get(name)
+        if line is None:
+            ax = self.get_axes(subplot, setup)
+            line, = ax.plot(x, y, **kwargs)
+            self._artists[name] = line
+            if line.get_animated():
+                self._animated.append(line)
+        else:
+            line.set_data(x, y)
+        line.axes.relim()
+        line.axes.autoscale_view()
+        return line
+
+    def update_barh(self, name, labels, values, subplot=111, setup=None, **kwargs):
+        """Create a named horizontal bar chart, afterwards only resize the bars"""
+        bars = self._artists.get(name)
+        if bars is None:
+            ax = self.get_axes(subplot, setup)
+            bars = ax.barh(labels, values, **kwargs)
+            self._artists[name] = bars
+        else:
+            for bar, value in zip(bars, values):
+                bar.set_width(value)
+        bars[0].axes.relim()
+        bars[0].axes.autoscale_view()
+        return bars
+
+    def update_poly3d(self, name, verts, subplot=111, setup=None, **kwargs):
+        """Create a named Poly3DCollection on first call, afterwards only swap its polygons"""
+        collection = self._artists.get(name)
+        if collection is None:
+            from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+            ax = self.get_axes(subplot, setup, projection='3d')
+            collection = Poly3DCollection(verts, **kwargs)
+            ax.add_collection3d(collection)  # type: ignore
+            self._artists[name] = collection
+        else:
+            collection.set_verts(verts)
+        return collection
+
+    def draw(self, layout=False):
+        """
+        Schedule a repaint; optionally recompute the subplot layout. The
+        layout is solved inside that deferred draw rather than by an
+        immediate tight_layout(), which would render the text once more
+        synchronously on the caller's stack.
+        """
+        if layout:
+            self.figure.set_layout_engine('tight')
+            self._layout_pending = True
+        self.canvas.draw_idle()
+
+    def blit(self):
+        """Repaint only the animated artists over the cached background"""
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.figure.bbox)
+
+    def _on_draw(self, event):
+        """Capture the static background after a full draw"""
+        if self._layout_pending:
+            # Keep the solved positions; later draws skip the layout pass
+            self.figure.set_layout_engine('none')
+            self._layout_pending = False
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in self._animated:
+            self.figure.draw_artist(artist)
 
 
 class MainWindow(QMainWindow):
     """Main application window with professional dark mode UI"""
+    analysis_requested = pyqtSignal(str, dict)
+    
+    # Line cap for the report views
+    REPORT_MAX_BLOCKS = 10000
+    # Progress/status refresh period while an analysis runs (20 Hz)
+    PROGRESS_POLL_MS = 50
+    # Face budget for the 3D view unless "Full resolution" is checked
+    MAX_DISPLAY_FACES = 2000
     
     def __init__(self):
         super().__init__()
@@ -284,6 +692,38 @@ class MainWindow(QMainWindow):
         
         # Initialize variables
         self.current_results = {}
+        self._analysis_cache = {}
+        # Current input values, kept in sync by the spinboxes' valueChanged
+        self._params = {}
+        self._param_inputs = {}
+        self._param_defaults = {}
+        # Vertex bounds the 3D axis limits were last fitted to
+        self._hull_bounds = None
+        # Curves currently shown in the resistance plot
+        self._last_resistance_curves = None
+        # (velocities, design velocity, index) of the last design-point lookup
+        self._last_design_idx = None
+        # Start time of the last analysis run; stamps the report and the
+        # default export file names
+        self._session_timestamp = None
+        
+        # One persistent worker on its own thread for all analyses
+        self.worker_thread = QThread(self)
+        self.worker = AnalysisWorker(cache=self._analysis_cache)
+        self.worker.moveToThread(self.worker_thread)
+        self.worker.finished.connect(self.on_analysis_finished)
+        self.worker.error.connect(self.display_error)
+        self.analysis_requested.connect(self.worker.submit)
+        self.worker_thread.start()
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(self.PROGRESS_POLL_MS)
+        self._progress_timer.timeout.connect(self._poll_progress)
+        self._result_handlers = {
+            "stability": self.display_stability_results,
+            "resistance": self.display_resistance_results,
+            "3d_visualization": self.display_3d_results,
+            "complete": self.display_complete_results,
+        }
         
         # Create main widget and layout
         main_widget = QWidget()
@@ -332,6 +772,7 @@ class MainWindow(QMainWindow):
         self.tabs.addTab(self.tab_resistance, "🌊 Resistance")
         self.tabs.addTab(self.tab_3d, "📐 3D Visualization")
         self.tabs.addTab(self.tab_summary, "📊 Summary Report")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
         main_layout.addWidget(self.tabs)
         
@@ -344,88 +785,7 @@ class MainWindow(QMainWindow):
 
     def apply_dark_theme(self):
         """Apply professional dark theme"""
-        dark_stylesheet = """
-            QMainWindow, QWidget {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 10pt;
-            }
-            QGroupBox {
-                border: 2px solid #3d3d3d;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding-top: 10px;
-                font-weight: bold;
-                color: #14a085;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QLabel {
-                color: #e0e0e0;
-            }
-            QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {
-                background-color: #2b2b2b;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 6px;
-                color: #ffffff;
-            }
-            QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {
-                border: 2px solid #0d7377;
-            }
-            QPushButton {
-                background-color: #0d7377;
-                color: #ffffff;
-                border: none;
-                border-radius: 5px;
-                padding: 10px 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #14a085;
-            }
-            QPushButton:pressed {
-                background-color: #0a5f62;
-            }
-            QPushButton:disabled {
-                background-color: #3d3d3d;
-                color: #7d7d7d;
-            }
-            QTextEdit {
-                background-color: #2b2b2b;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                color: #e0e0e0;
-                font-family: 'Consolas', monospace;
-            }
-            QProgressBar {
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                text-align: center;
-                background-color: #2b2b2b;
-            }
-            QProgressBar::chunk {
-                background-color: #0d7377;
-                border-radius: 3px;
-            }
-            QScrollBar:vertical {
-                background: #2b2b2b;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background: #0d7377;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #14a085;
-            }
-        """
-        self.setStyleSheet(dark_stylesheet)
+        self.setStyleSheet(_DARK_QSS)
 
     def create_header(self):
         """Create application header"""
@@ -443,11 +803,11 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(header)
         
         title = QLabel("🚢 RC Cargo Barge - Hydrodynamic Analysis Dashboard")
-        title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        title.setFont(_TITLE_FONT)
         title.setStyleSheet("color: #ffffff;")
         
         subtitle = QLabel("Universidad Militar Nueva Granada | Fluid Mechanics Project | ITTC-1957 Method")
-        subtitle.setFont(QFont("Segoe UI", 9))
+        subtitle.setFont(_SUBTITLE_FONT)
         subtitle.setStyleSheet("color: #e0e0e0;")
         
         layout.addWidget(title)
@@ -470,11 +830,11 @@ class MainWindow(QMainWindow):
         hull_group = QGroupBox("🔧 Hull Geometry")
         hull_layout = QVBoxLayout()
         
-        self.length_input = self.create_parameter_input("Total Length (m):", 0.45, 0.01, 2.0)
-        self.beam_input = self.create_parameter_input("Beam (m):", 0.172, 0.01, 1.0)
-        self.height_input = self.create_parameter_input("Height (m):", 0.156, 0.01, 1.0)
-        self.bow_length_input = self.create_parameter_input("Bow Length (m):", 0.05, 0.01, 0.5)
-        self.draft_input = self.create_parameter_input("Draft (m):", 0.055, 0.001, 0.5)
+        self.length_input = self.create_parameter_input('length', "Total Length (m):", 0.45, 0.01, 2.0)
+        self.beam_input = self.create_parameter_input('beam', "Beam (m):", 0.172, 0.01, 1.0)
+        self.height_input = self.create_parameter_input('height', "Height (m):", 0.156, 0.01, 1.0)
+        self.bow_length_input = self.create_parameter_input('bow_length', "Bow Length (m):", 0.05, 0.01, 0.5)
+        self.draft_input = self.create_parameter_input('draft', "Draft (m):", 0.055, 0.001, 0.5)
         
         hull_layout.addLayout(self.length_input[0])
         hull_layout.addLayout(self.beam_input[0])
@@ -487,9 +847,9 @@ class MainWindow(QMainWindow):
         mass_group = QGroupBox("⚖️ Mass Distribution")
         mass_layout = QVBoxLayout()
         
-        self.hull_mass_input = self.create_parameter_input("Hull Mass (kg):", 1.2, 0.1, 10.0)
-        self.electronics_mass_input = self.create_parameter_input("Electronics Mass (kg):", 1.0, 0.1, 10.0)
-        self.cargo_mass_input = self.create_parameter_input("Cargo Mass (kg):", 2.5, 0.0, 20.0)
+        self.hull_mass_input = self.create_parameter_input('hull_mass', "Hull Mass (kg):", 1.2, 0.1, 10.0)
+        self.electronics_mass_input = self.create_parameter_input('electronics_mass', "Electronics Mass (kg):", 1.0, 0.1, 10.0)
+        self.cargo_mass_input = self.create_parameter_input('cargo_mass', "Cargo Mass (kg):", 2.5, 0.0, 20.0)
         
         mass_layout.addLayout(self.hull_mass_input[0])
         mass_layout.addLayout(self.electronics_mass_input[0])
@@ -500,8 +860,8 @@ class MainWindow(QMainWindow):
         analysis_group = QGroupBox("🔬 Analysis Parameters")
         analysis_layout = QVBoxLayout()
         
-        self.velocity_input = self.create_parameter_input("Design Velocity (m/s):", 0.5, 0.1, 5.0)
-        self.form_factor_input = self.create_parameter_input("Form Factor (k):", 0.2, 0.05, 0.5)
+        self.velocity_input = self.create_parameter_input('velocity', "Design Velocity (m/s):", 0.5, 0.1, 5.0)
+        self.form_factor_input = self.create_parameter_input('form_factor', "Form Factor (k):", 0.2, 0.05, 0.5)
         
         analysis_layout.addLayout(self.velocity_input[0])
         analysis_layout.addLayout(self.form_factor_input[0])
@@ -544,8 +904,8 @@ class MainWindow(QMainWindow):
         
         return tab
 
-    def create_parameter_input(self, label_text, default_value, min_value, max_value):
-        """Create a labeled parameter input"""
+    def create_parameter_input(self, key, label_text, default_value, min_value, max_value):
+        """Create a labeled parameter input bound to self._params[key]"""
         layout = QHBoxLayout()
         label = QLabel(label_text)
         label.setMinimumWidth(200)
@@ -556,6 +916,11 @@ class MainWindow(QMainWindow):
         spinbox.setValue(default_value)
         spinbox.setDecimals(3)
         spinbox.setSingleStep(0.01)
+        spinbox.valueChanged.connect(
+            lambda value, k=key: self._params.__setitem__(k, value))
+        self._param_inputs[key] = spinbox
+        # As displayed, i.e. after the spinbox has applied its rounding
+        self._param_defaults[key] = spinbox.value()
         
         layout.addWidget(label)
         layout.addWidget(spinbox)
@@ -569,8 +934,10 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(tab)
         
         # Results display
-        self.stability_results = QTextEdit()
+        self.stability_results = QPlainTextEdit()
         self.stability_results.setReadOnly(True)
+        self.stability_results.setMaximumBlockCount(self.REPORT_MAX_BLOCKS)
+        self.stability_results.setUndoRedoEnabled(False)
         self.stability_results.setPlaceholderText("Run stability analysis to see results here...")
         
         # Matplotlib plot
@@ -592,8 +959,10 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(tab)
         
         # Results display
-        self.resistance_results = QTextEdit()
+        self.resistance_results = QPlainTextEdit()
         self.resistance_results.setReadOnly(True)
+        self.resistance_results.setMaximumBlockCount(self.REPORT_MAX_BLOCKS)
+        self.resistance_results.setUndoRedoEnabled(False)
         self.resistance_results.setPlaceholderText("Run resistance analysis to see results here...")
         
         # Matplotlib plot
@@ -614,8 +983,12 @@ class MainWindow(QMainWindow):
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
-        # Matplotlib 3D plot
-        self.plot_3d = MatplotlibWidget()
+        # The view itself is created by _ensure_3d_view when the tab is
+        # first shown or drawn
+        self.gl_view = None
+        self._gl_mesh = None
+        self.plot_3d = None
+        self._view_3d_layout = QVBoxLayout()
         
         # Control buttons
         button_layout = QHBoxLayout()
@@ -626,14 +999,37 @@ class MainWindow(QMainWindow):
         self.btn_export_3d = QPushButton("💾 Export Image")
         self.btn_export_3d.clicked.connect(self.export_3d_image)
         
+        # Large meshes are decimated for display unless this is checked
+        self.chk_full_res_3d = QCheckBox("Full resolution")
+        self.chk_full_res_3d.toggled.connect(self.refresh_3d_display)
+        
         button_layout.addWidget(self.btn_generate_3d)
         button_layout.addWidget(self.btn_export_3d)
+        button_layout.addWidget(self.chk_full_res_3d)
         button_layout.addStretch()
         
-        layout.addWidget(self.plot_3d)
+        layout.addLayout(self._view_3d_layout, 1)
         layout.addLayout(button_layout)
         
         return tab
+    
+    def _ensure_3d_view(self):
+        """Create the 3D view once: OpenGL when pyqtgraph is available, else matplotlib 3D plot"""
+        if self.gl_view is not None or self.plot_3d is not None:
+            return
+        gl = _gl_module()
+        if gl is not None:
+            self.gl_view = gl.GLViewWidget()
+            self.gl_view.setBackgroundColor('#1e1e1e')
+            self._view_3d_layout.addWidget(self.gl_view)
+        else:
+            self.plot_3d = MatplotlibWidget()
+            self._view_3d_layout.addWidget(self.plot_3d)
+    
+    def _on_tab_changed(self, index):
+        """Build the 3D view the first time its tab is opened"""
+        if self.tabs.widget(index) is self.tab_3d:
+            self._ensure_3d_view()
 
     def create_summary_tab(self):
         """Create summary report tab"""
@@ -641,8 +1037,10 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(tab)
         
         # Summary text area
-        self.summary_text = QTextEdit()
+        self.summary_text = QPlainTextEdit()
         self.summary_text.setReadOnly(True)
+        self.summary_text.setMaximumBlockCount(self.REPORT_MAX_BLOCKS)
+        self.summary_text.setUndoRedoEnabled(False)
         self.summary_text.setPlaceholderText("Complete analysis results will appear here...")
         
         # Export buttons
@@ -694,76 +1092,54 @@ class MainWindow(QMainWindow):
 
     def load_default_parameters(self):
         """Load default parameters into inputs"""
-        # Already set in create_parameter_input default values
-        pass
+        # Set every spinbox without firing valueChanged per box, then
+        # rebuild the cached dict once
+        for key, spinbox in self._param_inputs.items():
+            with QSignalBlocker(spinbox):
+                spinbox.setValue(self._param_defaults[key])
+        self._params = dict(self._param_defaults)
 
     def get_parameters_from_inputs(self):
-        """Extract current parameters from input widgets"""
-        return {
-            'length': self.length_input[1].value(),
-            'beam': self.beam_input[1].value(),
-            'height': self.height_input[1].value(),
-            'bow_length': self.bow_length_input[1].value(),
-            'draft': self.draft_input[1].value(),
-            'hull_mass': self.hull_mass_input[1].value(),
-            'electronics_mass': self.electronics_mass_input[1].value(),
-            'cargo_mass': self.cargo_mass_input[1].value(),
-            'velocity': self.velocity_input[1].value(),
-            'form_factor': self.form_factor_input[1].value(),
-        }
+        """Return a copy of the current input parameters"""
+        return dict(self._params)
 
     def run_stability_analysis(self):
         """Run stability analysis in worker thread"""
         params = self.get_parameters_from_inputs()
         
-        self.worker = AnalysisWorker("stability", params)
-        self.worker.progress.connect(self.update_progress)
-        self.worker.status.connect(self.update_status)
-        self.worker.finished.connect(self.display_stability_results)
-        self.worker.error.connect(self.display_error)
-        
         self.disable_buttons()
-        self.worker.start()
+        self.analysis_requested.emit("stability", params)
 
     def run_resistance_analysis(self):
         """Run resistance analysis in worker thread"""
         params = self.get_parameters_from_inputs()
-        params['wetted_area'] = 0.165  # Calculated area
-        
-        self.worker = AnalysisWorker("resistance", params)
-        self.worker.progress.connect(self.update_progress)
-        self.worker.status.connect(self.update_status)
-        self.worker.finished.connect(self.display_resistance_results)
-        self.worker.error.connect(self.display_error)
         
         self.disable_buttons()
-        self.worker.start()
+        self.analysis_requested.emit("resistance", params)
 
     def run_complete_analysis(self):
         """Run complete analysis suite"""
         params = self.get_parameters_from_inputs()
         
-        self.worker = AnalysisWorker("complete", params)
-        self.worker.progress.connect(self.update_progress)
-        self.worker.status.connect(self.update_status)
-        self.worker.finished.connect(self.display_complete_results)
-        self.worker.error.connect(self.display_error)
-        
         self.disable_buttons()
-        self.worker.start()
+        self.analysis_requested.emit("complete", params)
 
     def generate_3d_visualization(self):
         """Generate 3D hull visualization"""
         params = self.get_parameters_from_inputs()
         
-        self.worker = AnalysisWorker("3d_visualization", params)
-        self.worker.progress.connect(self.update_progress)
-        self.worker.status.connect(self.update_status)
-        self.worker.finished.connect(self.display_3d_results)
-        self.worker.error.connect(self.display_error)
-        
         self.disable_buttons()
-        self.worker.start()
+        self.analysis_requested.emit("3d_visualization", params)
+
+    def on_analysis_finished(self, analysis_type, results):
+        """Route worker results to the matching display method"""
+        self._result_handlers[analysis_type](results)
+
+    def closeEvent(self, event):
+        """Stop the worker thread when the window closes"""
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+        super().closeEvent(event)
 
     def update_progress(self, value):
         """Update progress bar"""
@@ -773,15 +1149,26 @@ class MainWindow(QMainWindow):
         """Update status label"""
         self.status_label.setText(message)
 
+    def _poll_progress(self):
+        """Show the worker's latest progress and status"""
+        self.update_progress(self.worker.latest_progress)
+        if self.worker.latest_status:
+            self.update_status(self.worker.latest_status)
+
     def disable_buttons(self):
         """Disable action buttons during analysis"""
         self.btn_run_stability.setEnabled(False)
         self.btn_run_resistance.setEnabled(False)
         self.btn_run_all.setEnabled(False)
         self.btn_generate_3d.setEnabled(False)
+        self._session_timestamp = datetime.now()
+        self.worker.latest_progress = 0
+        self.worker.latest_status = ""
+        self._progress_timer.start()
 
     def enable_buttons(self):
         """Re-enable action buttons"""
+        self._progress_timer.stop()
         self.btn_run_stability.setEnabled(True)
         self.btn_run_resistance.setEnabled(True)
         self.btn_run_all.setEnabled(True)
@@ -789,90 +1176,98 @@ class MainWindow(QMainWindow):
 
     def display_stability_results(self, results):
         """Display stability analysis results"""
-        self.current_results['stability'] = results
+        self._build_stability(results)
         
-        # Format text results
-        text = "=" * 80 + "\n"
-        text += "STABILITY ANALYSIS RESULTS\n"
-        text += "=" * 80 + "\n\n"
-        
-        text += "HULL GEOMETRY\n"
-        text += "-" * 80 + "\n"
-        text += f"  Length:              {results['hull'].length:.3f} m\n"
-        text += f"  Beam:                {results['hull'].beam:.3f} m\n"
-        text += f"  Height:              {results['hull'].height:.3f} m\n"
-        text += f"  Draft:               {results['hull'].draft:.3f} m\n"
-        text += f"  Bow Length:          {results['hull'].bow_length:.3f} m\n\n"
-        
-        text += "HYDROSTATIC PROPERTIES\n"
-        text += "-" * 80 + "\n"
-        text += f"  Displacement Volume: {results['displacement']:.6f} m³\n"
-        text += f"  Displacement Mass:   {results['displacement_mass']:.3f} kg\n"
-        text += f"  Waterplane Area:     {results['aw']:.4f} m²\n\n"
+        self.tabs.setCurrentIndex(1)
         
-        text += "FLOTATION ANALYSIS\n"
-        text += "-" * 80 + "\n"
-        text += f"  Buoyancy Force:      {results['buoyancy_force']:.2f} N ↑\n"
-        text += f"  Weight Force:        {results['weight_force']:.2f} N ↓\n"
-        text += f"  Net Force:           {results['net_force']:.2f} N\n"
-        floats_text = "✓ FLOATS" if results['floats'] else "✗ SINKS"
-        text += f"  Status:              {floats_text}\n\n"
+        self.enable_buttons()
+        self.update_status("Stability analysis complete!")
+        self.progress_bar.setValue(0)
+
+    def _build_stability(self, results):
+        """Fill the stability report and plot; no tab or status bookkeeping"""
+        self.current_results['stability'] = results
         
-        text += "STABILITY PARAMETERS\n"
-        text += "-" * 80 + "\n"
-        text += f"  KB (Center of Buoyancy):    {results['kb']*100:.2f} cm\n"
-        text += f"  BM (Metacentric Radius):    {results['bm']*100:.2f} cm\n"
-        text += f"  KG (Center of Gravity):     {results['kg']*100:.2f} cm\n"
-        text += f"  GM (Metacentric Height):    {results['gm']*100:.2f} cm\n"
-        
-        if results['gm'] < 0:
-            text += "  Rating: ✗ UNSTABLE\n"
-        elif results['gm'] < 0.05:
-            text += "  Rating: ⚠ MARGINAL\n"
+        # Format text results
+        hull = results.hull
+        rule = "=" * 80
+        sep = "-" * 80
+        if results.gm < 0:
+            rating = "✗ UNSTABLE"
+        elif results.gm < 0.05:
+            rating = "⚠ MARGINAL"
         else:
-            text += "  Rating: ✓ STABLE\n"
+            rating = "✓ STABLE"
+        floats_text = "✓ FLOATS" if results.floats else "✗ SINKS"
+        
+        parts = [
+            rule,
+            "STABILITY ANALYSIS RESULTS",
+            rule,
+            "",
+            "HULL GEOMETRY",
+            sep,
+            f"  Length:              {hull.length:.3f} m",
+            f"  Beam:                {hull.beam:.3f} m",
+            f"  Height:              {hull.height:.3f} m",
+            f"  Draft:               {hull.draft:.3f} m",
+            f"  Bow Length:          {hull.bow_length:.3f} m",
+            "",
+            "HYDROSTATIC PROPERTIES",
+            sep,
+            f"  Displacement Volume: {results.displacement:.6f} m³",
+            f"  Displacement Mass:   {results.displacement_mass:.3f} kg",
+            f"  Waterplane Area:     {results.aw:.4f} m²",
+            "",
+            "FLOTATION ANALYSIS",
+            sep,
+            f"  Buoyancy Force:      {results.buoyancy_force:.2f} N ↑",
+            f"  Weight Force:        {results.weight_force:.2f} N ↓",
+            f"  Net Force:           {results.net_force:.2f} N",
+            f"  Status:              {floats_text}",
+            "",
+            "STABILITY PARAMETERS",
+            sep,
+            f"  KB (Center of Buoyancy):    {results.kb*100:.2f} cm",
+            f"  BM (Metacentric Radius):    {results.bm*100:.2f} cm",
+            f"  KG (Center of Gravity):     {results.kg*100:.2f} cm",
+            f"  GM (Metacentric Height):    {results.gm*100:.2f} cm",
+            f"  Rating: {rating}",
+            "",
+        ]
         
-        self.stability_results.setText(text)
+        # Swap the whole report in without intermediate relayouts
+        self.stability_results.setUpdatesEnabled(False)
+        self.stability_results.setPlainText("\n".join(parts))
+        self.stability_results.setUpdatesEnabled(True)
         
         # Plot results
         self.plot_stability_results(results)
-        
-        # Switch to stability tab
-        self.tabs.setCurrentIndex(1)
-        
-        self.enable_buttons()
-        self.update_status("Stability analysis complete!")
-        self.progress_bar.setValue(0)
 
     def plot_stability_results(self, results):
         """Plot stability visualization"""
-        self.stability_plot.clear()
-        fig = self.stability_plot.figure
+        plot = self.stability_plot
+        first_draw = not plot._axes
         
-        # Create subplots
-        ax1 = fig.add_subplot(121)
-        ax2 = fig.add_subplot(122)
+        def style_centers(ax):
+            ax.set_xlabel('Height from Keel (m)')
+            ax.set_title('Stability Centers')
+            ax.grid(True)
         
         # Plot 1: Centers vertical position
         centers = ['KB', 'KG', 'KM']
-        values = [results['kb'], results['kg'], results['kb'] + results['bm']]
+        values = [results.kb, results.kg, results.kb + results.bm]
         colors = ['#0d7377', '#e63946', '#14a085']
+        plot.update_barh('centers', centers, values, subplot=121, setup=style_centers,
+                         color=colors, alpha=0.8)
         
-        ax1.barh(centers, values, color=colors, alpha=0.8)
-        ax1.set_xlabel('Height from Keel (m)', color='#e0e0e0')
-        ax1.set_title('Stability Centers', color='#14a085', fontweight='bold')
-        ax1.grid(True, alpha=0.3, color='#3d3d3d')
-        ax1.set_facecolor('#1e1e1e')
-        ax1.tick_params(colors='#e0e0e0')
-        ax1.spines['bottom'].set_color('#3d3d3d')
-        ax1.spines['left'].set_color('#3d3d3d')
-        ax1.spines['top'].set_color('#3d3d3d')
-        ax1.spines['right'].set_color('#3d3d3d')
-        
-        # Plot 2: Mass distribution
+        # Plot 2: Mass distribution (wedges can't be resized, so only this
+        # axes is redrawn)
+        ax2 = plot.get_axes(122)
+        ax2.clear()
         masses = ['Hull', 'Electronics', 'Cargo']
         mass_values = [
-            results['hull'].bow_length,  # Using hull param as placeholder
+            results.hull.bow_length,  # Using hull param as placeholder
             1.0,
             2.5
         ]
@@ -880,14 +1275,22 @@ class MainWindow(QMainWindow):
         ax2.pie(mass_values, labels=masses, autopct='%1.1f%%',
                 colors=['#0d7377', '#14a085', '#e63946'],
                 textprops={'color': '#e0e0e0'})
-        ax2.set_title('Mass Distribution', color='#14a085', fontweight='bold')
-        ax2.set_facecolor('#1e1e1e')
+        ax2.set_title('Mass Distribution')
         
-        fig.tight_layout()
-        self.stability_plot.canvas.draw()
+        plot.draw(layout=first_draw)
 
     def display_resistance_results(self, results):
         """Display resistance analysis results"""
+        self._build_resistance(results)
+        
+        self.tabs.setCurrentIndex(2)
+        
+        self.enable_buttons()
+        self.update_status("Resistance analysis complete!")
+        self.progress_bar.setValue(0)
+
+    def _build_resistance(self, results):
+        """Fill the resistance report and plot; no tab or status bookkeeping"""
         self.current_results['resistance'] = results
         
         # Format text results
@@ -896,175 +1299,221 @@ class MainWindow(QMainWindow):
         text += "=" * 80 + "\n\n"
         
         # Find design velocity results
-        design_v = self.velocity_input[1].value()
-        idx = np.argmin(np.abs(np.array(results['velocities']) - design_v))
+        design_v = self._params['velocity']
+        idx = self._design_idx(results.velocities, design_v)
         
         text += f"DESIGN VELOCITY: {design_v:.2f} m/s\n"
         text += "-" * 80 + "\n"
-        text += f"  Reynolds Number:     {results['reynolds'][idx]:.2e}\n"
-        text += f"  Froude Number:       {results['froude'][idx]:.3f}\n"
-        text += f"  Friction Coeff (Cf): {results['cf'][idx]:.5f}\n"
-        text += f"  Total Resistance:    {results['resistance'][idx]:.3f} N\n"
-        text += f"  Effective Power:     {results['power'][idx]:.3f} W\n\n"
+        _, re, fr, cf, resistance, power = results.at(idx)
+        text += f"  Reynolds Number:     {re:.2e}\n"
+        text += f"  Froude Number:       {fr:.3f}\n"
+        text += f"  Friction Coeff (Cf): {cf:.5f}\n"
+        text += f"  Total Resistance:    {resistance:.3f} N\n"
+        text += f"  Effective Power:     {power:.3f} W\n\n"
         
         text += "VELOCITY RANGE ANALYSIS\n"
         text += "-" * 80 + "\n"
-        text += f"  Min Velocity:        {results['velocities'][0]:.2f} m/s\n"
-        text += f"  Max Velocity:        {results['velocities'][-1]:.2f} m/s\n"
-        text += f"  Min Resistance:      {min(results['resistance']):.3f} N\n"
-        text += f"  Max Resistance:      {max(results['resistance']):.3f} N\n"
-        text += f"  Min Power:           {min(results['power']):.3f} W\n"
-        text += f"  Max Power:           {max(results['power']):.3f} W\n"
+        text += f"  Min Velocity:        {results.velocities[0]:.2f} m/s\n"
+        text += f"  Max Velocity:        {results.velocities[-1]:.2f} m/s\n"
+        text += f"  Min Resistance:      {min(results.resistance):.3f} N\n"
+        text += f"  Max Resistance:      {max(results.resistance):.3f} N\n"
+        text += f"  Min Power:           {min(results.power):.3f} W\n"
+        text += f"  Max Power:           {max(results.power):.3f} W\n"
         
-        self.resistance_results.setText(text)
+        self.resistance_results.setPlainText(text)
         
         # Plot results
         self.plot_resistance_results(results)
-        
-        # Switch to resistance tab
-        self.tabs.setCurrentIndex(2)
-        
-        self.enable_buttons()
-        self.update_status("Resistance analysis complete!")
-        self.progress_bar.setValue(0)
 
     def plot_resistance_results(self, results):
         """Plot resistance curves"""
-        self.resistance_plot.clear()
-        fig = self.resistance_plot.figure
+        plot = self.resistance_plot
+        first_draw = not plot._axes
         
-        # Create subplots
-        ax1 = fig.add_subplot(221)
-        ax2 = fig.add_subplot(222)
-        ax3 = fig.add_subplot(223)
-        ax4 = fig.add_subplot(224)
+        curves = (results.resistance, results.power, results.reynolds, results.froude)
+        last = self._last_resistance_curves
+        if last is not None and all(np.array_equal(a, b) for a, b in zip(curves, last)):
+            return
+        self._last_resistance_curves = tuple(c.copy() for c in curves)
+        limits = [(ax.get_xlim(), ax.get_ylim()) for ax in plot._axes.values()]
+        
+        def styled(xlabel, ylabel, title, extra=None):
+            def setup(ax):
+                if xlabel:
+                    ax.set_xlabel(xlabel)
+                else:
+                    # Top row shares the bottom row's velocity axis
+                    ax.tick_params(labelbottom=False)
+                ax.set_ylabel(ylabel)
+                ax.set_title(title)
+                ax.grid(True)
+                if extra is not None:
+                    extra(ax)
+            return setup
+        
+        def scientific_y(ax):
+            ax.ticklabel_format(style='scientific', axis='y', scilimits=(0,0))
+        
+        def displacement_limit(ax):
+            ax.axhline(y=0.4, color='#e63946', linestyle='--', label='Fr=0.4 (displacement limit)')
+            ax.legend()
+        
+        v = results.velocities
+        
+        setups = {
+            221: styled(None, 'Resistance (N)', 'Total Resistance'),
+            222: styled(None, 'Power (W)', 'Effective Power'),
+            223: styled('Velocity (m/s)', 'Reynolds Number', 'Reynolds Number',
+                        scientific_y),
+            224: styled('Velocity (m/s)', 'Froude Number', 'Froude Number',
+                        displacement_limit),
+        }
         
-        v = results['velocities']
+        # All four share the velocity axis, so x ticks are laid out once
+        if first_draw:
+            shared = plot.get_axes(223, setups[223])
+            for subplot in (221, 222, 224):
+                plot.get_axes(subplot, setups[subplot], sharex=shared)
         
         # Plot 1: Resistance vs Velocity
-        ax1.plot(v, results['resistance'], color='#0d7377', linewidth=2)
-        ax1.set_xlabel('Velocity (m/s)', color='#e0e0e0')
-        ax1.set_ylabel('Resistance (N)', color='#e0e0e0')
-        ax1.set_title('Total Resistance', color='#14a085', fontweight='bold')
-        ax1.grid(True, alpha=0.3, color='#3d3d3d')
-        ax1.set_facecolor('#1e1e1e')
-        ax1.tick_params(colors='#e0e0e0')
+        plot.update_line('resistance', v, results.resistance, subplot=221,
+                         color='#0d7377', linewidth=2, animated=True)
         
         # Plot 2: Power vs Velocity
-        ax2.plot(v, results['power'], color='#e63946', linewidth=2)
-        ax2.set_xlabel('Velocity (m/s)', color='#e0e0e0')
-        ax2.set_ylabel('Power (W)', color='#e0e0e0')
-        ax2.set_title('Effective Power', color='#14a085', fontweight='bold')
-        ax2.grid(True, alpha=0.3, color='#3d3d3d')
-        ax2.set_facecolor('#1e1e1e')
-        ax2.tick_params(colors='#e0e0e0')
+        plot.update_line('power', v, results.power, subplot=222,
+                         color='#e63946', linewidth=2, animated=True)
         
         # Plot 3: Reynolds Number
-        ax3.plot(v, results['reynolds'], color='#14a085', linewidth=2)
-        ax3.set_xlabel('Velocity (m/s)', color='#e0e0e0')
-        ax3.set_ylabel('Reynolds Number', color='#e0e0e0')
-        ax3.set_title('Reynolds Number', color='#14a085', fontweight='bold')
-        ax3.grid(True, alpha=0.3, color='#3d3d3d')
-        ax3.set_facecolor('#1e1e1e')
-        ax3.tick_params(colors='#e0e0e0')
-        ax3.ticklabel_format(style='scientific', axis='y', scilimits=(0,0))
+        plot.update_line('reynolds', v, results.reynolds, subplot=223,
+                         color='#14a085', linewidth=2, animated=True)
         
         # Plot 4: Froude Number
-        ax4.plot(v, results['froude'], color='#ffa500', linewidth=2)
-        ax4.axhline(y=0.4, color='#e63946', linestyle='--', label='Fr=0.4 (displacement limit)')
-        ax4.set_xlabel('Velocity (m/s)', color='#e0e0e0')
-        ax4.set_ylabel('Froude Number', color='#e0e0e0')
-        ax4.set_title('Froude Number', color='#14a085', fontweight='bold')
-        ax4.grid(True, alpha=0.3, color='#3d3d3d')
-        ax4.set_facecolor('#1e1e1e')
-        ax4.tick_params(colors='#e0e0e0')
-        ax4.legend(facecolor='#2b2b2b', edgecolor='#3d3d3d', labelcolor='#e0e0e0')
-        
-        for ax in [ax1, ax2, ax3, ax4]:
-            for spine in ax.spines.values():
-                spine.set_color('#3d3d3d')
-        
-        fig.tight_layout()
-        self.resistance_plot.canvas.draw()
+        plot.update_line('froude', v, results.froude, subplot=224,
+                         color='#ffa500', linewidth=2, animated=True)
+        
+        # Only the curves are animated; while no axis rescaled, blit them
+        # over the cached axes/ticks/grid instead of redrawing everything
+        if limits == [(ax.get_xlim(), ax.get_ylim()) for ax in plot._axes.values()]:
+            plot.blit()
+        else:
+            plot.draw(layout=first_draw)
 
     def display_3d_results(self, results):
-        """Display 3D visualization"""
-        self.current_results['3d'] = results
+        """Display 3D visualization results"""
+        self._build_3d(results)
         
-        self.plot_3d.clear()
-        fig = self.plot_3d.figure
-        ax = fig.add_subplot(111, projection='3d')
+        self.tabs.setCurrentIndex(3)
         
+        self.enable_buttons()
+        self.update_status("3D visualization complete!")
+        self.progress_bar.setValue(0)
+
+    def _build_3d(self, results):
+        """Store and plot the hull mesh; no tab or status bookkeeping"""
+        self.current_results['3d'] = results
+        self.plot_3d_results(results)
+
+    def refresh_3d_display(self):
+        """Redraw the current hull after the resolution toggle changes"""
+        if '3d' in self.current_results:
+            self.plot_3d_results(self.current_results['3d'])
+
+    def plot_3d_results(self, results):
+        """Draw the hull mesh, decimated to MAX_DISPLAY_FACES by default"""
         vertices = results['vertices']
         faces = results['faces']
+        if not self.chk_full_res_3d.isChecked():
+            faces = _downsample_faces(faces, self.MAX_DISPLAY_FACES)
         
-        # Plot hull mesh
-        from mpl_toolkits.mplot3d.art3d import Poly3DCollection
-        
-        # Create face vertices list (faces is a list of vertex indices)
-        face_vertices = [[vertices[idx] for idx in face] for face in faces]
+        self._ensure_3d_view()
+        if self.gl_view is not None:
+            self.plot_3d_gl(vertices, faces, results['bounds'])
+            return
         
-        hull_collection = Poly3DCollection(
-            face_vertices,
+        def style_hull(ax):
+            ax.set_xlabel('Length (m)')
+            ax.set_ylabel('Beam (m)')
+            ax.set_zlabel('Height (m)')  # type: ignore
+            ax.set_title('3D Hull Geometry (Pyramidal Bow + Rectangular Stern)', pad=20)
+            
+            ax.xaxis.pane.fill = False  # type: ignore
+            ax.yaxis.pane.fill = False  # type: ignore
+            ax.zaxis.pane.fill = False  # type: ignore
+            ax.grid(True)
+        
+        # Plot hull mesh; one fancy-index gather instead of a per-vertex
+        # Python loop, and later runs only swap the collection's polygons
+        hull_collection = self.plot_3d.update_poly3d(
+            'hull', _face_vertices(vertices, faces), setup=style_hull,
             alpha=0.7,
             facecolor='#0d7377',
             edgecolor='#14a085',
             linewidths=1
         )
-        ax.add_collection3d(hull_collection)  # type: ignore
-        
-        # Set equal aspect ratio
-        max_range = np.array([
-            vertices[:, 0].max() - vertices[:, 0].min(),
-            vertices[:, 1].max() - vertices[:, 1].min(),
-            vertices[:, 2].max() - vertices[:, 2].min()
-        ]).max() / 2.0
-        
-        mid_x = (vertices[:, 0].max() + vertices[:, 0].min()) * 0.5
-        mid_y = (vertices[:, 1].max() + vertices[:, 1].min()) * 0.5
-        mid_z = (vertices[:, 2].max() + vertices[:, 2].min()) * 0.5
-        
-        ax.set_xlim(mid_x - max_range, mid_x + max_range)
-        ax.set_ylim(mid_y - max_range, mid_y + max_range)
-        ax.set_zlim(mid_z - max_range, mid_z + max_range)  # type: ignore
-        
-        ax.set_xlabel('Length (m)', color='#e0e0e0')
-        ax.set_ylabel('Beam (m)', color='#e0e0e0')
-        ax.set_zlabel('Height (m)', color='#e0e0e0')  # type: ignore
-        ax.set_title('3D Hull Geometry (Pyramidal Bow + Rectangular Stern)',
-                     color='#14a085', fontweight='bold', pad=20)
-        
-        ax.set_facecolor('#1e1e1e')
-        fig.patch.set_facecolor('#1e1e1e')
-        ax.tick_params(colors='#e0e0e0')
-        ax.xaxis.pane.fill = False  # type: ignore
-        ax.yaxis.pane.fill = False  # type: ignore
-        ax.zaxis.pane.fill = False  # type: ignore
-        ax.grid(color='#3d3d3d', alpha=0.3)
-        
-        self.plot_3d.canvas.draw()
-        
-        self.tabs.setCurrentIndex(3)
-        
-        self.enable_buttons()
-        self.update_status("3D visualization complete!")
-        self.progress_bar.setValue(0)
+        ax = hull_collection.axes
+        
+        # Set equal aspect ratio (bounds precomputed by the worker);
+        # limits are left alone unless the hull moved by more than 1%
+        vmin, vmax = results['bounds']
+        max_range = (vmax - vmin).max() / 2.0
+        bounds = np.concatenate([vmin, vmax])
+        if (self._hull_bounds is None or
+                np.abs(bounds - self._hull_bounds).max() > 0.01 * max_range):
+            self._hull_bounds = bounds
+            mid_x, mid_y, mid_z = (vmax + vmin) * 0.5
+            ax.set_xlim(mid_x - max_range, mid_x + max_range)
+            ax.set_ylim(mid_y - max_range, mid_y + max_range)
+            ax.set_zlim(mid_z - max_range, mid_z + max_range)  # type: ignore
+        
+        self.plot_3d.draw()
+
+    def plot_3d_gl(self, vertices, faces, bounds):
+        """
+        Draw the hull as one GLMeshItem; projection and shading happen on
+        the GPU. Later runs only replace the mesh data.
+        """
+        tris = _triangulate(faces)
+        if self._gl_mesh is None:
+            self._gl_mesh = _gl_module().GLMeshItem(
+                vertexes=vertices, faces=tris,
+                smooth=False, drawEdges=True,
+                color=(0.05, 0.45, 0.47, 0.7),
+                edgeColor=(0.08, 0.63, 0.52, 1.0),
+                glOptions='translucent'
+            )
+            self.gl_view.addItem(self._gl_mesh)
+        else:
+            self._gl_mesh.setMeshData(vertexes=vertices, faces=tris)
+        
+        # Re-aim the camera only if the hull moved by more than 1%
+        vmin, vmax = bounds
+        max_range = (vmax - vmin).max() / 2.0
+        packed = np.concatenate([vmin, vmax])
+        if (self._hull_bounds is None or
+                np.abs(packed - self._hull_bounds).max() > 0.01 * max_range):
+            self._hull_bounds = packed
+            center = (vmax + vmin) * 0.5
+            self.gl_view.setCameraPosition(
+                pos=QVector3D(*(float(c) for c in center)),
+                distance=6 * max_range
+            )
 
     def display_complete_results(self, results):
         """Display complete analysis results"""
         self.current_results = results
         
-        # Display individual results
+        # Fill every tab; the tab switch, button and status bookkeeping
+        # happens once below instead of once per part
         if 'stability' in results:
-            self.display_stability_results(results['stability'])
+            self._build_stability(results['stability'])
         if 'resistance' in results:
-            self.display_resistance_results(results['resistance'])
+            self._build_resistance(results['resistance'])
         if '3d' in results:
-            self.display_3d_results(results['3d'])
+            self._build_3d(results['3d'])
         
         # Generate summary report
-        summary = self.generate_summary_report(results)
-        self.summary_text.setText(summary)
+        summary = self.generate_summary_report(results, self._session_timestamp)
+        self.summary_text.setPlainText(summary)
         
         # Switch to summary tab
         self.tabs.setCurrentIndex(4)
@@ -1073,90 +1522,105 @@ class MainWindow(QMainWindow):
         self.update_status("Complete analysis finished!")
         self.progress_bar.setValue(0)
 
-    def generate_summary_report(self, results):
-        """Generate comprehensive summary report"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def _design_idx(self, velocities, design_v):
+        """Index of the sweep velocity closest to design_v (sorted sweep)"""
+        last = self._last_design_idx
+        if last is not None and last[0] is velocities and last[1] == design_v:
+            return last[2]
+        idx = int(np.searchsorted(velocities, design_v))
+        idx = min(idx, len(velocities) - 1)
+        # searchsorted gives the right neighbour; take the left one when it
+        # is at least as close, matching argmin's first-minimum choice
+        if idx > 0 and abs(velocities[idx - 1] - design_v) <= abs(velocities[idx] - design_v):
+            idx -= 1
+        self._last_design_idx = (velocities, design_v, idx)
+        return idx
+
+    def generate_summary_report(self, results, timestamp=None):
+        """Generate comprehensive summary report, stamped with timestamp (default: now)"""
+        timestamp = (timestamp or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
         
-        report = "=" * 90 + "\n"
-        report += "RC CARGO BARGE - COMPREHENSIVE ANALYSIS REPORT\n"
-        report += "=" * 90 + "\n\n"
-        report += f"Generated: {timestamp}\n"
-        report += "Universidad Militar Nueva Granada | Fluid Mechanics Project\n\n"
+        parts = [_EQ90 + "\n"]
+        parts.append("RC CARGO BARGE - COMPREHENSIVE ANALYSIS REPORT\n")
+        parts.append(_EQ90 + "\n\n")
+        parts.append(f"Generated: {timestamp}\n")
+        parts.append("Universidad Militar Nueva Granada | Fluid Mechanics Project\n\n")
         
         if 'stability' in results:
             stab = results['stability']
-            report += "HULL SPECIFICATIONS\n"
-            report += "-" * 90 + "\n"
-            report += f"  Total Length:          {stab['hull'].length:.3f} m\n"
-            report += f"  Beam:                  {stab['hull'].beam:.3f} m\n"
-            report += f"  Height:                {stab['hull'].height:.3f} m\n"
-            report += f"  Draft:                 {stab['hull'].draft:.3f} m\n"
-            report += f"  Bow Length (pyramid):  {stab['hull'].bow_length:.3f} m\n"
-            report += f"  Stern Length (rect):   {stab['hull'].length - stab['hull'].bow_length:.3f} m\n\n"
+            parts.append("HULL SPECIFICATIONS\n")
+            parts.append(_DASH90 + "\n")
+            parts.append(f"  Total Length:          {stab.hull.length:.3f} m\n")
+            parts.append(f"  Beam:                  {stab.hull.beam:.3f} m\n")
+            parts.append(f"  Height:                {stab.hull.height:.3f} m\n")
+            parts.append(f"  Draft:                 {stab.hull.draft:.3f} m\n")
+            parts.append(f"  Bow Length (pyramid):  {stab.hull.bow_length:.3f} m\n")
+            parts.append(f"  Stern Length (rect):   {stab.hull.length - stab.hull.bow_length:.3f} m\n\n")
             
-            report += "MASS DISTRIBUTION\n"
-            report += "-" * 90 + "\n"
-            report += f"  Hull:                  {stab['total_mass'] - 3.5:.2f} kg\n"
-            report += f"  Electronics:           1.00 kg\n"
-            report += f"  Cargo:                 2.50 kg\n"
-            report += f"  TOTAL:                 {stab['total_mass']:.2f} kg\n\n"
+            parts.append("MASS DISTRIBUTION\n")
+            parts.append(_DASH90 + "\n")
+            parts.append(f"  Hull:                  {stab.total_mass - 3.5:.2f} kg\n")
+            parts.append(f"  Electronics:           1.00 kg\n")
+            parts.append(f"  Cargo:                 2.50 kg\n")
+            parts.append(f"  TOTAL:                 {stab.total_mass:.2f} kg\n\n")
             
-            report += "STABILITY ANALYSIS\n"
-            report += "-" * 90 + "\n"
-            report += f"  Displacement:          {stab['displacement_mass']:.3f} kg\n"
-            report += f"  KB:                    {stab['kb']*100:.2f} cm\n"
-            report += f"  BM:                    {stab['bm']*100:.2f} cm\n"
-            report += f"  KG:                    {stab['kg']*100:.2f} cm\n"
-            report += f"  GM:                    {stab['gm']*100:.2f} cm "
-            if stab['gm'] < 0:
-                report += "✗ UNSTABLE\n"
-            elif stab['gm'] < 0.05:
-                report += "⚠ MARGINAL\n"
+            parts.append("STABILITY ANALYSIS\n")
+            parts.append(_DASH90 + "\n")
+            parts.append(f"  Displacement:          {stab.displacement_mass:.3f} kg\n")
+            parts.append(f"  KB:                    {stab.kb*100:.2f} cm\n")
+            parts.append(f"  BM:                    {stab.bm*100:.2f} cm\n")
+            parts.append(f"  KG:                    {stab.kg*100:.2f} cm\n")
+            parts.append(f"  GM:                    {stab.gm*100:.2f} cm ")
+            if stab.gm < 0:
+                parts.append("✗ UNSTABLE\n")
+            elif stab.gm < 0.05:
+                parts.append("⚠ MARGINAL\n")
             else:
-                report += "✓ STABLE\n"
+                parts.append("✓ STABLE\n")
             
-            report += f"\n  Buoyancy Force:        {stab['buoyancy_force']:.2f} N ↑\n"
-            report += f"  Weight Force:          {stab['weight_force']:.2f} N ↓\n"
-            report += f"  Net Force:             {stab['net_force']:.2f} N\n"
-            report += f"  Flotation Status:      {'✓ FLOATS' if stab['floats'] else '✗ SINKS'}\n\n"
+            parts.append(f"\n  Buoyancy Force:        {stab.buoyancy_force:.2f} N ↑\n")
+            parts.append(f"  Weight Force:          {stab.weight_force:.2f} N ↓\n")
+            parts.append(f"  Net Force:             {stab.net_force:.2f} N\n")
+            parts.append(f"  Flotation Status:      {'✓ FLOATS' if stab.floats else '✗ SINKS'}\n\n")
         
         if 'resistance' in results:
             res = results['resistance']
-            design_v = self.velocity_input[1].value()
-            idx = np.argmin(np.abs(np.array(res['velocities']) - design_v))
+            design_v = self._params['velocity']
+            idx = self._design_idx(res.velocities, design_v)
+            _, re, fr, cf, resistance, power = res.at(idx)
             
-            report += "HYDRODYNAMIC PERFORMANCE (ITTC-1957)\n"
-            report += "-" * 90 + "\n"
-            report += f"  Design Velocity:       {design_v:.2f} m/s\n"
-            report += f"  Reynolds Number:       {res['reynolds'][idx]:.2e}\n"
-            report += f"  Froude Number:         {res['froude'][idx]:.3f} "
-            if res['froude'][idx] < 0.4:
-                report += "(Displacement mode)\n"
+            parts.append("HYDRODYNAMIC PERFORMANCE (ITTC-1957)\n")
+            parts.append(_DASH90 + "\n")
+            parts.append(f"  Design Velocity:       {design_v:.2f} m/s\n")
+            parts.append(f"  Reynolds Number:       {re:.2e}\n")
+            parts.append(f"  Froude Number:         {fr:.3f} ")
+            if fr < 0.4:
+                parts.append("(Displacement mode)\n")
             else:
-                report += "(Planing mode)\n"
-            report += f"  Friction Coefficient:  {res['cf'][idx]:.5f}\n"
-            report += f"  Total Resistance:      {res['resistance'][idx]:.3f} N\n"
-            report += f"  Effective Power:       {res['power'][idx]:.3f} W\n"
-            report += f"  Shaft Power (η=0.38):  {res['power'][idx]/0.38:.3f} W\n\n"
-        
-        report += "DESIGN COMPLIANCE\n"
-        report += "-" * 90 + "\n"
+                parts.append("(Planing mode)\n")
+            parts.append(f"  Friction Coefficient:  {cf:.5f}\n")
+            parts.append(f"  Total Resistance:      {resistance:.3f} N\n")
+            parts.append(f"  Effective Power:       {power:.3f} W\n")
+            parts.append(f"  Shaft Power (η=0.38):  {power/0.38:.3f} W\n\n")
+        
+        parts.append("DESIGN COMPLIANCE\n")
+        parts.append(_DASH90 + "\n")
         if 'stability' in results:
-            draft_ok = "✓" if stab['hull'].draft <= 0.06 else "✗"
-            report += f"  Draft < 6 cm           {draft_ok} ({stab['hull'].draft*100:.1f} cm)\n"
-            cargo_ok = "✓" if stab['total_mass'] >= 4.0 else "✗"
-            report += f"  Cargo ≥ 1.5 kg         {cargo_ok} ({stab['total_mass'] - 2.2:.1f} kg cargo)\n"
-            gm_ok = "✓" if stab['gm'] > 0.05 else "⚠"
-            report += f"  GM > 5 cm              {gm_ok} ({stab['gm']*100:.1f} cm)\n"
+            draft_ok = "✓" if stab.hull.draft <= 0.06 else "✗"
+            parts.append(f"  Draft < 6 cm           {draft_ok} ({stab.hull.draft*100:.1f} cm)\n")
+            cargo_ok = "✓" if stab.total_mass >= 4.0 else "✗"
+            parts.append(f"  Cargo ≥ 1.5 kg         {cargo_ok} ({stab.total_mass - 2.2:.1f} kg cargo)\n")
+            gm_ok = "✓" if stab.gm > 0.05 else "⚠"
+            parts.append(f"  GM > 5 cm              {gm_ok} ({stab.gm*100:.1f} cm)\n")
         if 'resistance' in results:
-            power_ok = "✓" if res['power'][idx]/0.38 < 75 else "✗"
-            report += f"  Power < 75 W           {power_ok} ({res['power'][idx]/0.38:.1f} W)\n"
+            power_ok = "✓" if power/0.38 < 75 else "✗"
+            parts.append(f"  Power < 75 W           {power_ok} ({power/0.38:.1f} W)\n")
         
-        report += "\n" + "=" * 90 + "\n"
-        report += "END OF REPORT\n"
-        report += "=" * 90 + "\n"
+        parts.append("\n" + _EQ90 + "\n")
+        parts.append("END OF REPORT\n")
+        parts.append(_EQ90 + "\n")
         
-        return report
+        return "".join(parts)
 
     def display_error(self, error_message):
         """Display error message"""
@@ -1165,6 +1629,10 @@ class MainWindow(QMainWindow):
         self.update_status("Error occurred!")
         self.progress_bar.setValue(0)
 
+    def _export_stamp(self):
+        """Default export file name suffix: the last analysis start time"""
+        return (self._session_timestamp or datetime.now()).strftime('%Y%m%d_%H%M%S')
+
     def export_3d_image(self):
         """Export 3D visualization as image"""
         if '3d' not in self.current_results:
@@ -1174,12 +1642,15 @@ class MainWindow(QMainWindow):
         filename, _ = QFileDialog.getSaveFileName(
             self,
             "Save 3D Visualization",
-            f"hull_3d_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png",
+            f"hull_3d_{self._export_stamp()}.png",
             "PNG Image (*.png);;All Files (*)"
         )
         
         if filename:
-            self.plot_3d.figure.savefig(filename, dpi=300, facecolor='#1e1e1e')
+            if self.gl_view is not None:
+                self.gl_view.grabFramebuffer().save(filename)
+            else:
+                self.plot_3d.figure.savefig(filename, dpi=300, facecolor='#1e1e1e')
             QMessageBox.information(self, "Success", f"Image saved to:\n{filename}")
 
     def export_report_txt(self):
@@ -1191,7 +1662,7 @@ class MainWindow(QMainWindow):
         filename, _ = QFileDialog.getSaveFileName(
             self,
             "Save Report",
-            f"analysis_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+            f"analysis_report_{self._export_stamp()}.txt",
             "Text File (*.txt);;All Files (*)"
         )
         
@@ -1209,7 +1680,7 @@ class MainWindow(QMainWindow):
         filename, _ = QFileDialog.getSaveFileName(
             self,
             "Save Data",
-            f"analysis_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            f"analysis_data_{self._export_stamp()}.json",
             "JSON File (*.json);;All Files (*)"
         )
         
@@ -1220,28 +1691,36 @@ class MainWindow(QMainWindow):
             if 'stability' in self.current_results:
                 stab = self.current_results['stability']
                 export_data['stability'] = {
-                    'displacement': float(stab['displacement']),
-                    'kb': float(stab['kb']),
-                    'bm': float(stab['bm']),
-                    'kg': float(stab['kg']),
-                    'gm': float(stab['gm']),
-                    'buoyancy_force': float(stab['buoyancy_force']),
-                    'weight_force': float(stab['weight_force']),
-                    'floats': bool(stab['floats'])
+                    'displacement': float(stab.displacement),
+                    'kb': float(stab.kb),
+                    'bm': float(stab.bm),
+                    'kg': float(stab.kg),
+                    'gm': float(stab.gm),
+                    'buoyancy_force': float(stab.buoyancy_force),
+                    'weight_force': float(stab.weight_force),
+                    'floats': bool(stab.floats)
                 }
             
             if 'resistance' in self.current_results:
                 res = self.current_results['resistance']
-                export_data['resistance'] = {
-                    'velocities': [float(v) for v in res['velocities']],
-                    'reynolds': [float(r) for r in res['reynolds']],
-                    'froude': [float(f) for f in res['froude']],
-                    'resistance': [float(r) for r in res['resistance']],
-                    'power': [float(p) for p in res['power']]
-                }
+                arrays = (res.velocities, res.reynolds, res.froude,
+                          res.resistance, res.power)
+                if not HAS_ORJSON:
+                    # ndarray.tolist() converts each array to Python floats in C
+                    arrays = [a.tolist() for a in arrays]
+                export_data['resistance'] = dict(zip(
+                    ('velocities', 'reynolds', 'froude', 'resistance', 'power'),
+                    arrays))
             
-            with open(filename, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            if HAS_ORJSON:
+                # orjson serializes the ndarrays directly
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(
+                        export_data,
+                        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(export_data, f, indent=2)
             
             QMessageBox.information(self, "Success", f"Data saved to:\n{filename}")
 
@@ -1251,6 +1730,9 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("RC Barge Analysis Dashboard")
     
+    # Dark plot theme for every figure created from here on
+    matplotlib.rcParams.update(_MPL_DARK_RC)
+    
     # Set application-wide font
     font = QFont("Segoe UI", 10)
     app.setFont(font)
@@ -15,6 +15,55 @@ import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _wetted_sweep_kernel(drafts, bottom_area, rect_length, beam, bow_slant_perim):
+    """
+    Wetted surface area over a draft array; same formula as
+    CustomHullGeometry.wetted_surface_area, written as one loop so it can
+    be compiled by Numba.
+    """
+    n = drafts.shape[0]
+    out = np.empty(n)
+    for i in range(n):
+        t = drafts[i]
+        if t <= 0:
+            out[i] = 0.0
+        else:
+            out[i] = bottom_area + (2 * rect_length + beam + bow_slant_perim) * t
+    return out
+
+
+def _volume_sweep_kernel(drafts, rect_length, beam, bow_length, inv_height):
+    """
+    Displaced volume over a draft array; same formula as
+    CustomHullGeometry.displaced_volume, written as one loop so it can be
+    compiled by Numba.
+    """
+    n = drafts.shape[0]
+    out = np.empty(n)
+    for i in range(n):
+        t = drafts[i]
+        if t <= 0:
+            out[i] = 0.0
+            continue
+        bow_base_top = beam * (1 - t * inv_height)
+        if bow_base_top < 0:
+            bow_base_top = 0.0
+        bow_volume = (beam + bow_base_top) / 2 * bow_length * t / 2
+        out[i] = rect_length * beam * t + bow_volume
+    return out
+
+
+if HAS_NUMBA:
+    _wetted_sweep_kernel = njit(cache=True, fastmath=True)(_wetted_sweep_kernel)
+    _volume_sweep_kernel = njit(cache=True, fastmath=True)(_volume_sweep_kernel)
+
 
 class CustomHullGeometry:
     """Calculate geometric properties of the custom pentagonal barge"""
@@ -31,21 +80,30 @@ class CustomHullGeometry:
         self.mdf_density = 700  # kg/m³
         self.paint_weight = 0.05  # kg (estimated)
         
+        self.precompute()
+    
+    def precompute(self):
+        """
+        Cache draft-independent geometry, areas and hull weight.
+        Call again after changing any main dimension or material property.
+        """
+        self._rect_length = self.length - self.bow_length
+        self._lb = self.length * self.beam
+        self._bottom_area = self._lb
+        self._bow_slant_perim = 2 * np.sqrt(self.bow_length**2 + (self.beam/2)**2)
+        self._inv_height = 1.0 / self.height
+        self._deck_area = self._rect_length * self.beam + 0.5 * self.beam * self.bow_length
+        self._hull_weight = self._compute_hull_weight()
+        
     def deck_area(self):
         """Calculate deck area (pentagonal top view)"""
-        # Rectangular section + triangular bow
-        rect_length = self.length - self.bow_length
-        rect_area = rect_length * self.beam
-        
-        # Triangular bow (isosceles triangle)
-        # Base = beam, height = bow_length
-        triangle_area = 0.5 * self.beam * self.bow_length
-        
-        return rect_area + triangle_area
+        # Rectangular section + triangular bow (isosceles triangle,
+        # base = beam, height = bow_length); cached by precompute()
+        return self._deck_area
     
     def bottom_area(self):
         """Calculate bottom area (rectangular - straight bow at bottom)"""
-        return self.length * self.beam
+        return self._bottom_area
     
     def wetted_surface_area(self, draft):
         """
@@ -61,11 +119,10 @@ class CustomHullGeometry:
             return 0.0
         
         # Bottom area (fully submerged if draft > 0)
-        bottom = self.bottom_area()
+        bottom = self._bottom_area
         
         # Side walls - rectangular section
-        rect_length = self.length - self.bow_length
-        side_rect = 2 * rect_length * draft
+        side_rect = 2 * self._rect_length * draft
         
         # Stern (popa) - rectangular
         stern = self.beam * draft
@@ -74,20 +131,65 @@ class CustomHullGeometry:
         # At bottom: beam wide
         # At draft height: depends on taper
         # Simplified: assume linear taper from beam to point over bow_length
-        bow_width_at_draft = self.beam * (1 - draft / self.height)
+        bow_width_at_draft = self.beam * (1 - draft * self._inv_height)
         if bow_width_at_draft < 0:
             bow_width_at_draft = 0
         
         # Two trapezoidal bow faces
         # Height = draft, parallel sides = beam and bow_width_at_draft, slant height ≈ bow_length
         avg_bow_width = (self.beam + bow_width_at_draft) / 2
-        bow_perimeter = 2 * np.sqrt(self.bow_length**2 + (self.beam/2)**2)
-        bow_sides = bow_perimeter * draft
+        bow_sides = self._bow_slant_perim * draft
         
         total_wetted = bottom + side_rect + stern + bow_sides
         
         return total_wetted
     
+    def wetted_surface_area_vec(self, drafts):
+        """
+        Vectorized wetted_surface_area over an array of drafts
+        (Numba-compiled kernel when Numba is installed)
+        
+        Args:
+            drafts: Drafts in meters (ndarray)
+            
+        Returns:
+            Wetted surface areas in m² (ndarray, 0 where draft <= 0)
+        """
+        if HAS_NUMBA:
+            drafts = np.ascontiguousarray(drafts, dtype=np.float64)
+            return _wetted_sweep_kernel(drafts.ravel(), self._bottom_area,
+                                        self._rect_length, self.beam,
+                                        self._bow_slant_perim).reshape(drafts.shape)
+        drafts = np.asarray(drafts, dtype=float)
+        total_wetted = (self._bottom_area + 2 * self._rect_length * drafts
+                        + self.beam * drafts + self._bow_slant_perim * drafts)
+        return np.where(drafts > 0, total_wetted, 0.0)
+    
+    def displaced_volume_vec(self, drafts):
+        """
+        Vectorized displaced_volume over an array of drafts
+        (Numba-compiled kernel when Numba is installed)
+        
+        Args:
+            drafts: Drafts in meters (ndarray)
+            
+        Returns:
+            Displaced volumes in m³ (ndarray, 0 where draft <= 0)
+        """
+        if HAS_NUMBA:
+            drafts = np.ascontiguousarray(drafts, dtype=np.float64)
+            return _volume_sweep_kernel(drafts.ravel(), self._rect_length,
+                                        self.beam, self.bow_length,
+                                        self._inv_height).reshape(drafts.shape)
+        drafts = np.asarray(drafts, dtype=float)
+        rect_volume = self._rect_length * self.beam * drafts
+        
+        bow_base_top = np.clip(self.beam * (1 - drafts * self._inv_height), 0, None)
+        avg_bow_base = (self.beam + bow_base_top) / 2
+        bow_volume = avg_bow_base * self.bow_length * drafts / 2
+        
+        return np.where(drafts > 0, rect_volume + bow_volume, 0.0)
+    
     def displaced_volume(self, draft):
         """
         Calculate displaced volume at given draft
@@ -102,14 +204,13 @@ class CustomHullGeometry:
             return 0.0
         
         # Rectangular section volume
-        rect_length = self.length - self.bow_length
-        rect_volume = rect_length * self.beam * draft
+        rect_volume = self._rect_length * self.beam * draft
         
         # Bow volume - wedge/pyramid
         # Base area at draft level varies linearly
         # Simplified: trapezoidal prism
         bow_base_bottom = self.beam
-        bow_base_top = self.beam * (1 - draft / self.height)
+        bow_base_top = self.beam * (1 - draft * self._inv_height)
         if bow_base_top < 0:
             bow_base_top = 0
         
@@ -123,17 +224,16 @@ class CustomHullGeometry:
     def block_coefficient(self, draft):
         """Calculate block coefficient Cb"""
         volume = self.displaced_volume(draft)
-        return volume / (self.length * self.beam * draft)
+        return volume / (self._lb * draft)
     
     def waterplane_area(self, draft):
         """Calculate waterplane area at given draft (pentagonal)"""
         # At waterline, bow tapers
-        bow_width = self.beam * (1 - draft / self.height)
+        bow_width = self.beam * (1 - draft * self._inv_height)
         if bow_width < 0:
             bow_width = 0
         
-        rect_length = self.length - self.bow_length
-        rect_area = rect_length * self.beam
+        rect_area = self._rect_length * self.beam
         triangle_area = 0.5 * (self.beam + bow_width) * self.bow_length
         
         return rect_area + triangle_area
@@ -141,30 +241,21 @@ class CustomHullGeometry:
     def waterplane_coefficient(self, draft):
         """Calculate waterplane coefficient Cwp"""
         aw = self.waterplane_area(draft)
-        return aw / (self.length * self.beam)
+        return aw / self._lb
     
     def hull_weight(self):
-        """Calculate weight of MDF hull + paint"""
-        # Bottom
-        bottom_area = self.bottom_area()
-        
-        # Sides (approximate as sum of rectangles)
-        rect_length = self.length - self.bow_length
-        side_area = 2 * rect_length * self.height + 2 * self.bow_length * self.height
-        
-        # Stern
-        stern_area = self.beam * self.height
-        
-        # Deck (pentagonal)
-        deck_area = self.deck_area()
-        
-        total_area = bottom_area + side_area + stern_area + deck_area
-        
-        # Volume of MDF
-        mdf_volume = total_area * self.mdf_thickness
-        mdf_weight = mdf_volume * self.mdf_density
-        
-        return mdf_weight + self.paint_weight
+        """Calculate weight of MDF hull + paint (cached by precompute())"""
+        return self._hull_weight
+    
+    def _compute_hull_weight(self):
+        # Bottom + sides (approximate as sum of rectangles) + stern + deck
+        side_area = (2 * self._rect_length * self.height
+                     + 2 * self.bow_length * self.height)
+        total_area = (self._bottom_area + side_area
+                      + self.beam * self.height + self._deck_area)
+        
+        # Volume and weight of MDF
+        return total_area * self.mdf_thickness * self.mdf_density + self.paint_weight
     
     def center_of_buoyancy(self, draft):
         """Estimate KB (keel to center of buoyancy)"""
@@ -175,11 +266,10 @@ class CustomHullGeometry:
         """Calculate second moment of waterplane area about centerline"""
         # Simplified for rectangular + triangle
         # I = (L × B³)/12 for rectangle
-        rect_length = self.length - self.bow_length
-        I_rect = rect_length * self.beam**3 / 12
+        I_rect = self._rect_length * self.beam**3 / 12
         
         # Triangle contribution (approximated)
-        bow_width = self.beam * (1 - draft / self.height)
+        bow_width = self.beam * (1 - draft * self._inv_height)
         I_triangle = self.bow_length * self.beam**3 / 36
         
         return I_rect + I_triangle
@@ -262,9 +352,9 @@ class CustomHullGeometry:
         """Plot displacement and wetted area vs draft"""
         drafts = np.linspace(0.01, 0.10, 100)
         
-        wetted_areas = [self.wetted_surface_area(d) for d in drafts]
-        volumes = [self.displaced_volume(d) for d in drafts]
-        displacements = [v * 1000 for v in volumes]  # kg
+        wetted_areas = self.wetted_surface_area_vec(drafts)
+        volumes = self.displaced_volume_vec(drafts)
+        displacements = volumes * 1000  # kg
         
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
         
@@ -9,15 +9,33 @@ and estimates power requirements for various velocities.
 Usage:
     python resistance_calc.py --length 0.45 --velocity 0.5 --wetted_area 0.18
     python resistance_calc.py --config hull_v2.json --velocity_range 0.2 0.8 0.1
+    python resistance_calc.py --plot --save_plot curves.png --no_show
 """
 
 import argparse
+import functools
 import json
 import math
 import matplotlib.pyplot as plt
 import numpy as np
-from dataclasses import dataclass
-from typing import List, Tuple
+from dataclasses import astuple, dataclass, fields
+from typing import List, Optional, Tuple
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+try:
+    import numexpr as ne
+    HAS_NUMEXPR = True
+except ImportError:
+    HAS_NUMEXPR = False
+
+# Sweeps at least this long use the multi-threaded kernel
+PARALLEL_SWEEP_MIN = 10000
 
 
 @dataclass
@@ -40,6 +58,34 @@ class FluidProperties:
     gravity: float = 9.81  # m/s²
     
 
+@dataclass
+class RunParameters:
+    """Hull and velocity-sweep settings of a run; defaults are the CLI defaults"""
+    length: float = 0.40  # Waterline length (m)
+    beam: float = 0.172   # Beam (m)
+    draft: float = 0.055  # Draft (m)
+    wetted_area: float = 0.1258  # Wetted surface area (m²)
+    form_factor: float = 0.25    # Form factor k
+    velocity: Optional[float] = None  # Single velocity; overrides the range
+    v_min: float = 0.1   # m/s
+    v_max: float = 1.0   # m/s
+    v_step: float = 0.05  # m/s
+    
+    def hull(self) -> HullParameters:
+        return HullParameters(
+            length=self.length,
+            beam=self.beam,
+            draft=self.draft,
+            wetted_area=self.wetted_area,
+            form_factor=self.form_factor
+        )
+    
+    def velocities(self):
+        if self.velocity is not None:
+            return [self.velocity]
+        return np.arange(self.v_min, self.v_max + self.v_step, self.v_step)
+    
+
 @dataclass
 class ResistanceComponents:
     """Breakdown of resistance forces"""
@@ -52,41 +98,166 @@ class ResistanceComponents:
     wave_resistance: float
     total_resistance: float
     effective_power: float
+
+
+@dataclass
+class ResistanceSweep:
+    """
+    Resistance breakdown over a velocity sweep, one array per quantity.
+    Iterating (or indexing) yields ResistanceComponents rows, so code
+    written for the old list of components keeps working.
+    """
+    velocity: np.ndarray
+    reynolds: np.ndarray
+    froude: np.ndarray
+    friction_coeff: np.ndarray
+    friction_resistance: np.ndarray
+    viscous_resistance: np.ndarray
+    wave_resistance: np.ndarray
+    total_resistance: np.ndarray
+    effective_power: np.ndarray
+    
+    def columns(self) -> Tuple[np.ndarray, ...]:
+        """Arrays in ResistanceComponents field order"""
+        return (self.velocity, self.reynolds, self.froude, self.friction_coeff,
+                self.friction_resistance, self.viscous_resistance,
+                self.wave_resistance, self.total_resistance, self.effective_power)
+    
+    def __len__(self) -> int:
+        return len(self.velocity)
+    
+    def __getitem__(self, i: int) -> ResistanceComponents:
+        return ResistanceComponents(*(c[i].item() for c in self.columns()))
+    
+    def __iter__(self):
+        for row in zip(*(c.tolist() for c in self.columns())):
+            yield ResistanceComponents(*row)
     
 
+def _ittc_sweep_kernel(velocities, length, beam, wetted_area, form_factor,
+                       density, nu, gravity, air_coeff):
+    """
+    Single-pass ITTC-1957 sweep over a velocity array.
+    Returns (Re, Fr, Cf, Rf, Rv, Rw, Ra, RT) arrays; same formulas as the
+    ITTCResistanceCalculator methods (air_coeff is Ra / V²), written as
+    one loop so it can be compiled by Numba.
+    """
+    n = velocities.shape[0]
+    re = np.empty(n)
+    fr = np.empty(n)
+    cf = np.empty(n)
+    rf = np.empty(n)
+    rv = np.empty(n)
+    rw = np.empty(n)
+    ra = np.empty(n)
+    rt = np.empty(n)
+    sqrt_gl = math.sqrt(gravity * length)
+    for i in prange(n):
+        v = velocities[i]
+        re[i] = v * length / nu
+        fr[i] = v / sqrt_gl
+        log_re = math.log10(re[i])
+        cf[i] = 0.075 / ((log_re - 2) ** 2)
+        rf[i] = 0.5 * density * v**2 * wetted_area * cf[i]
+        rv[i] = (1 + form_factor) * rf[i]
+        if fr[i] < 0.3:
+            wave_factor = 0.1
+        elif fr[i] < 0.4:
+            wave_factor = 0.2
+        elif fr[i] < 0.5:
+            wave_factor = 0.5
+        else:
+            wave_factor = 1.0
+        rw[i] = wave_factor * 0.01 * density * v**4 * beam
+        ra[i] = air_coeff * v**2
+        rt[i] = rv[i] + rw[i] + ra[i]
+    return re, fr, cf, rf, rv, rw, ra, rt
+
+
+if HAS_NUMBA:
+    _ittc_sweep_kernel_parallel = njit(cache=True, fastmath=True, parallel=True)(
+        _ittc_sweep_kernel)
+    _ittc_sweep_kernel = njit(cache=True, fastmath=True)(_ittc_sweep_kernel)
+else:
+    _ittc_sweep_kernel_parallel = _ittc_sweep_kernel
+
+
+@functools.lru_cache(maxsize=512)
+def _resistance_cached(params_key, velocity):
+    """
+    Scalar calculate_resistance, memoized on the (hull, fluid) field
+    values and the velocity for callers such as parameter searches that
+    revisit the same point. Evaluated by the ITTCResistanceCalculator
+    methods themselves, so it cannot drift from the array paths.
+    """
+    hull_values, fluid_values = params_key
+    calc = ITTCResistanceCalculator(HullParameters(*hull_values),
+                                    FluidProperties(*fluid_values))
+    return calc._components(velocity)
+
+
 class ITTCResistanceCalculator:
     """Calculate ship resistance using ITTC-1957 method"""
     
     def __init__(self, hull: HullParameters, fluid: FluidProperties):
         self.hull = hull
         self.fluid = fluid
+        # Wave factor table: Fr < 0.3: 0.1, Fr < 0.4: 0.2, Fr < 0.5: 0.5,
+        # otherwise planing regime - simplified model: 1.0
+        self._wave_bins = np.array([0.3, 0.4, 0.5])
+        self._wave_factors = np.array([0.1, 0.2, 0.5, 1.0])
+        self.precompute()
+    
+    def precompute(self):
+        """
+        Cache the velocity-independent hull/fluid constants.
+        Call again after changing any hull or fluid property.
+        """
+        self._inv_nu_L = self.hull.length / self.fluid.kinematic_viscosity
+        self._sqrt_gL = math.sqrt(self.fluid.gravity * self.hull.length)
+        self._half_rho_S = 0.5 * self.fluid.density * self.hull.wetted_area
+        self._one_plus_k = 1 + self.hull.form_factor
+        self._wave_const = 0.01 * self.fluid.density * self.hull.beam
+        
+        # Air: ρ_air = 1.225 kg/m³, frontal area = beam * 0.05 m (estimated
+        # above-water profile), Cd = 0.8 (bluff body)
+        rho_air = 1.225
+        frontal_area = self.hull.beam * 0.05
+        drag_coeff = 0.8
+        self._half_rho_air_A_cd = 0.5 * rho_air * frontal_area * drag_coeff
+        
+        # Memo key of the scalar path, taken with the caches above
+        self._params_key = (astuple(self.hull), astuple(self.fluid))
         
+    # The per-quantity methods below accept either a scalar or a NumPy array
+    # of velocities (or Reynolds/Froude numbers) and broadcast elementwise.
+
     def reynolds_number(self, velocity: float) -> float:
         """Calculate Reynolds number: Re = VL/ν"""
-        return (velocity * self.hull.length) / self.fluid.kinematic_viscosity
+        return velocity * self._inv_nu_L
     
     def froude_number(self, velocity: float) -> float:
         """Calculate Froude number: Fr = V/√(gL)"""
-        return velocity / math.sqrt(self.fluid.gravity * self.hull.length)
+        return velocity / self._sqrt_gL
     
     def ittc_friction_coefficient(self, reynolds: float) -> float:
         """
         ITTC-1957 friction line: Cf = 0.075 / (log10(Re) - 2)²
         Valid for Re > 10⁶ originally, but used for scale models
         """
-        if reynolds < 1e4:
-            raise ValueError(f"Reynolds number {reynolds:.2e} too low for ITTC method")
+        if np.any(np.less(reynolds, 1e4)):
+            raise ValueError(f"Reynolds number {np.min(reynolds):.2e} too low for ITTC method")
         
-        log_re = math.log10(reynolds)
+        log_re = np.log10(reynolds)
         return 0.075 / ((log_re - 2) ** 2)
     
     def friction_resistance(self, velocity: float, cf: float) -> float:
         """Friction resistance: Rf = 0.5 * ρ * V² * S * Cf"""
-        return 0.5 * self.fluid.density * velocity**2 * self.hull.wetted_area * cf
+        return self._half_rho_S * velocity**2 * cf
     
     def viscous_resistance(self, friction_resistance: float) -> float:
         """Viscous resistance including form factor: Rv = (1 + k) * Rf"""
-        return (1 + self.hull.form_factor) * friction_resistance
+        return self._one_plus_k * friction_resistance
     
     def wave_resistance(self, velocity: float, froude: float) -> float:
         """
@@ -94,18 +265,13 @@ class ITTCResistanceCalculator:
         For displacement hulls (Fr < 0.4): Rw ≈ 0.2 * Rv
         For transition (0.4 < Fr < 0.5): Rw increases significantly
         """
-        if froude < 0.3:
-            wave_factor = 0.1
-        elif froude < 0.4:
-            wave_factor = 0.2
-        elif froude < 0.5:
-            wave_factor = 0.5
-        else:
-            # Planing regime - simplified model
-            wave_factor = 1.0
+        # Branchless table lookup; side='right' so a Froude number equal
+        # to a bin edge falls in the upper band, as with Fr < edge
+        idx = np.searchsorted(self._wave_bins, froude, side='right')
+        wave_factor = self._wave_factors[idx]
         
         # Wave resistance proportional to velocity^4 for simplicity
-        base_wave = 0.01 * self.fluid.density * velocity**4 * self.hull.beam
+        base_wave = self._wave_const * velocity**4
         return wave_factor * base_wave
     
     def air_resistance(self, velocity: float) -> float:
@@ -113,14 +279,10 @@ class ITTCResistanceCalculator:
         Air resistance (typically negligible for small scale models)
         Ra = 0.5 * ρ_air * V² * A_frontal * Cd
         """
-        rho_air = 1.225  # kg/m³
-        frontal_area = self.hull.beam * 0.05  # Estimated above-water profile
-        drag_coeff = 0.8  # Bluff body
-        return 0.5 * rho_air * velocity**2 * frontal_area * drag_coeff
+        return self._half_rho_air_A_cd * velocity**2
     
-    def calculate_resistance(self, velocity: float) -> ResistanceComponents:
-        """Calculate all resistance components at given velocity"""
-        
+    def _components(self, velocity):
+        """(Re, Fr, Cf, Rf, Rv, Rw, Ra, RT, PE) at velocity (scalar or array)"""
         # Dimensionless numbers
         re = self.reynolds_number(velocity)
         fr = self.froude_number(velocity)
@@ -144,6 +306,18 @@ class ITTCResistanceCalculator:
         # Effective power
         pe = rt * velocity
         
+        return re, fr, cf, rf, rv, rw, ra, rt, pe
+    
+    def calculate_resistance(self, velocity: float) -> ResistanceComponents:
+        """Calculate all resistance components at given velocity"""
+        
+        # Scalars go through the memoized pipeline
+        if np.ndim(velocity) == 0:
+            re, fr, cf, rf, rv, rw, ra, rt, pe = _resistance_cached(
+                self._params_key, float(velocity))
+        else:
+            re, fr, cf, rf, rv, rw, ra, rt, pe = self._components(velocity)
+        
         return ResistanceComponents(
             velocity=velocity,
             reynolds=re,
@@ -156,19 +330,98 @@ class ITTCResistanceCalculator:
             effective_power=pe
         )
     
-    def power_curve(self, velocities: List[float]) -> List[ResistanceComponents]:
-        """Calculate resistance at multiple velocities"""
-        return [self.calculate_resistance(v) for v in velocities]
+    def calculate_resistance_vec(self, velocities: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        calculate_resistance over a velocity array: (Re, Fr, Cf, Rf, Rv,
+        Rw, Ra, RT, PE). Uses the Numba-compiled kernel when Numba is
+        installed, then fused numexpr passes, otherwise one NumPy pass per
+        quantity.
+        """
+        if HAS_NUMBA:
+            v = np.ascontiguousarray(velocities, dtype=np.float64)
+            *components, rt = self._run_kernel(v)
+            return (*components, rt, rt * v)
+        
+        v = np.asarray(velocities, dtype=np.float64)
+        if HAS_NUMEXPR:
+            return self._run_numexpr(v)
+        
+        return self._components(v)
+    
+    def sweep(self, velocities: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Resistance components over a velocity array: (Re, Fr, Cf, Rf, Rv, Rw).
+        Uses the Numba-compiled kernel when Numba is installed, otherwise
+        the broadcasting methods above.
+        """
+        velocities = np.ascontiguousarray(velocities, dtype=np.float64)
+        if HAS_NUMBA:
+            return self._run_kernel(velocities)[:6]
+        
+        re = self.reynolds_number(velocities)
+        fr = self.froude_number(velocities)
+        cf = self.ittc_friction_coefficient(re)
+        rf = self.friction_resistance(velocities, cf)
+        rv = self.viscous_resistance(rf)
+        rw = self.wave_resistance(velocities, fr)
+        return re, fr, cf, rf, rv, rw
+    
+    def _run_kernel(self, velocities: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """Compiled sweep; multi-threaded for PARALLEL_SWEEP_MIN points or more"""
+        # Validate in Python; the compiled kernel does not raise
+        self.ittc_friction_coefficient(self.reynolds_number(velocities.min(initial=np.inf)))
+        kernel = (_ittc_sweep_kernel_parallel if velocities.size >= PARALLEL_SWEEP_MIN
+                  else _ittc_sweep_kernel)
+        return kernel(
+            velocities, self.hull.length, self.hull.beam, self.hull.wetted_area,
+            self.hull.form_factor, self.fluid.density,
+            self.fluid.kinematic_viscosity, self.fluid.gravity,
+            self._half_rho_air_A_cd
+        )
+    
+    def _run_numexpr(self, v: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        calculate_resistance_vec with each output evaluated as one fused
+        numexpr expression, so powers and products of V make no temporaries
+        """
+        re = self.reynolds_number(v)
+        self.ittc_friction_coefficient(re.min(initial=np.inf))
+        fr = self.froude_number(v)
+        wave_factor = self._wave_factors[np.searchsorted(self._wave_bins, fr, side='right')]
+        
+        consts = {
+            'v': v, 're': re, 'wave_factor': wave_factor,
+            'half_rho_S': self._half_rho_S, 'one_plus_k': self._one_plus_k,
+            'wave_const': self._wave_const, 'air_coeff': self._half_rho_air_A_cd,
+        }
+        cf = ne.evaluate("0.075 / (log10(re) - 2)**2", local_dict=consts)
+        consts['cf'] = cf
+        rf = ne.evaluate("half_rho_S * v * v * cf", local_dict=consts)
+        consts['rf'] = rf
+        rv = ne.evaluate("one_plus_k * rf", local_dict=consts)
+        rw = ne.evaluate("wave_factor * wave_const * v**4", local_dict=consts)
+        ra = ne.evaluate("air_coeff * v * v", local_dict=consts)
+        consts.update(rv=rv, rw=rw, ra=ra)
+        rt = ne.evaluate("rv + rw + ra", local_dict=consts)
+        pe = rt * v
+        return re, fr, cf, rf, rv, rw, ra, rt, pe
+    
+    def power_curve(self, velocities: List[float]) -> ResistanceSweep:
+        """Calculate resistance at multiple velocities (one array per quantity)"""
+        v = np.asarray(velocities, dtype=np.float64)
+        re, fr, cf, rf, rv, rw, ra, rt, pe = self.calculate_resistance_vec(v)
+        return ResistanceSweep(v, re, fr, cf, rf, rv, rw, rt, pe)
     
     def shaft_power(self, effective_power: float, efficiency: float = 0.5) -> float:
         """Convert effective power to shaft power: P_shaft = P_e / η_total"""
         return effective_power / efficiency
     
 
-def plot_results(results: List[ResistanceComponents], hull: HullParameters, save_path: str = None):
-    """Generate comprehensive plots of resistance analysis"""
+def plot_results(results: ResistanceSweep, hull: HullParameters, save_path: str = None,
+                 show: bool = True):
+    """Generate comprehensive plots of resistance analysis (closed after saving if not show)"""
     
-    velocities = [r.velocity for r in results]
+    velocities = results.velocity
     
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
     fig.suptitle(f'ITTC-1957 Resistance Analysis - L={hull.length}m, S={hull.wetted_area}m²', 
@@ -176,10 +429,10 @@ def plot_results(results: List[ResistanceComponents], hull: HullParameters, save
     
     # Plot 1: Resistance components vs velocity
     ax1 = axes[0, 0]
-    ax1.plot(velocities, [r.friction_resistance for r in results], 'b-', label='Friction (Rf)', linewidth=2)
-    ax1.plot(velocities, [r.viscous_resistance for r in results], 'g-', label='Viscous (Rv)', linewidth=2)
-    ax1.plot(velocities, [r.wave_resistance for r in results], 'r-', label='Wave (Rw)', linewidth=2)
-    ax1.plot(velocities, [r.total_resistance for r in results], 'k--', label='Total (RT)', linewidth=2.5)
+    ax1.plot(velocities, results.friction_resistance, 'b-', label='Friction (Rf)', linewidth=2)
+    ax1.plot(velocities, results.viscous_resistance, 'g-', label='Viscous (Rv)', linewidth=2)
+    ax1.plot(velocities, results.wave_resistance, 'r-', label='Wave (Rw)', linewidth=2)
+    ax1.plot(velocities, results.total_resistance, 'k--', label='Total (RT)', linewidth=2.5)
     ax1.set_xlabel('Velocity (m/s)', fontweight='bold')
     ax1.set_ylabel('Resistance (N)', fontweight='bold')
     ax1.set_title('Resistance Components')
@@ -188,9 +441,9 @@ def plot_results(results: List[ResistanceComponents], hull: HullParameters, save
     
     # Plot 2: Power requirements
     ax2 = axes[0, 1]
-    pe_values = [r.effective_power for r in results]
-    p_shaft_50 = [p / 0.5 for p in pe_values]
-    p_shaft_40 = [p / 0.4 for p in pe_values]
+    pe_values = results.effective_power
+    p_shaft_50 = pe_values / 0.5
+    p_shaft_40 = pe_values / 0.4
     
     ax2.plot(velocities, pe_values, 'b-', label='Effective Power (PE)', linewidth=2)
     ax2.plot(velocities, p_shaft_50, 'g--', label='Shaft Power (η=50%)', linewidth=2)
@@ -204,7 +457,7 @@ def plot_results(results: List[ResistanceComponents], hull: HullParameters, save
     
     # Plot 3: Reynolds number
     ax3 = axes[1, 0]
-    ax3.plot(velocities, [r.reynolds for r in results], 'b-', linewidth=2)
+    ax3.plot(velocities, results.reynolds, 'b-', linewidth=2)
     ax3.set_xlabel('Velocity (m/s)', fontweight='bold')
     ax3.set_ylabel('Reynolds Number', fontweight='bold')
     ax3.set_title('Reynolds Number vs Velocity')
@@ -213,10 +466,10 @@ def plot_results(results: List[ResistanceComponents], hull: HullParameters, save
     
     # Plot 4: Froude number and regime
     ax4 = axes[1, 1]
-    ax4.plot(velocities, [r.froude for r in results], 'r-', linewidth=2)
+    ax4.plot(velocities, results.froude, 'r-', linewidth=2)
     ax4.axhline(y=0.4, color='orange', linestyle='--', label='Displacement limit (Fr=0.4)', linewidth=2)
     ax4.fill_between(velocities, 0, 0.4, alpha=0.2, color='green', label='Displacement mode')
-    ax4.fill_between(velocities, 0.4, max([r.froude for r in results]), alpha=0.2, color='yellow', label='Transition')
+    ax4.fill_between(velocities, 0.4, results.froude.max(), alpha=0.2, color='yellow', label='Transition')
     ax4.set_xlabel('Velocity (m/s)', fontweight='bold')
     ax4.set_ylabel('Froude Number', fontweight='bold')
     ax4.set_title('Froude Number and Operating Regime')
@@ -229,10 +482,13 @@ def plot_results(results: List[ResistanceComponents], hull: HullParameters, save
         plt.savefig(save_path, dpi=300, bbox_inches='tight')
         print(f"Plot saved to: {save_path}")
     
-    plt.show()
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
 
 
-def print_summary(results: List[ResistanceComponents], hull: HullParameters):
+def print_summary(results: ResistanceSweep, hull: HullParameters):
     """Print formatted summary table"""
     
     print("\n" + "="*100)
@@ -248,85 +504,101 @@ def print_summary(results: List[ResistanceComponents], hull: HullParameters):
     print(f"{'V (m/s)':>8} {'Re':>12} {'Fr':>8} {'Cf':>10} {'Rf (N)':>10} {'Rv (N)':>10} {'Rw (N)':>10} {'RT (N)':>10} {'PE (W)':>10}")
     print("-"*100)
     
-    for r in results:
-        print(f"{r.velocity:8.2f} {r.reynolds:12.2e} {r.froude:8.3f} {r.friction_coeff:10.6f} "
-              f"{r.friction_resistance:10.3f} {r.viscous_resistance:10.3f} {r.wave_resistance:10.3f} "
-              f"{r.total_resistance:10.3f} {r.effective_power:10.3f}")
+    rows = zip(*(c.tolist() for c in results.columns()))
+    print("\n".join(f"{v:8.2f} {re:12.2e} {fr:8.3f} {cf:10.6f} "
+                    f"{rf:10.3f} {rv:10.3f} {rw:10.3f} {rt:10.3f} {pe:10.3f}"
+                    for v, re, fr, cf, rf, rv, rw, rt, pe in rows))
     
     print("-"*100)
     
     # Find optimal velocity (minimum specific resistance)
-    specific_resistances = [(r.velocity, r.total_resistance / r.velocity) for r in results if r.velocity > 0]
-    optimal = min(specific_resistances, key=lambda x: x[1])
-    print(f"\nOptimal velocity (minimum RT/V): {optimal[0]:.2f} m/s")
+    moving = results.velocity > 0
+    specific = results.total_resistance[moving] / results.velocity[moving]
+    optimal = results.velocity[moving][np.argmin(specific)]
+    print(f"\nOptimal velocity (minimum RT/V): {optimal:.2f} m/s")
     
-    # Check power limit compliance
+    # Check power limit compliance (shaft power and status for the whole
+    # sweep at once, printed in one call)
     print(f"\nPower Limit Check (75W @ η=50%):")
-    for r in results:
-        shaft_power = r.effective_power / 0.5
-        status = "✓ OK" if shaft_power < 75 else "✗ EXCEEDS"
-        print(f"  V={r.velocity:.2f} m/s → P_shaft={shaft_power:.2f} W {status}")
+    shaft_power = results.effective_power * 2.0  # PE / 0.5
+    status = np.where(shaft_power < 75, "✓ OK", "✗ EXCEEDS")
+    print("\n".join(f"  V={v:.2f} m/s → P_shaft={p:.2f} W {s}"
+                    for v, p, s in zip(results.velocity.tolist(), shaft_power.tolist(),
+                                       status.tolist())))
     
     print("\n" + "="*100 + "\n")
 
 
-def main():
-    parser = argparse.ArgumentParser(description='ITTC-1957 Resistance Calculator')
-    parser.add_argument('--length', type=float, default=0.40, help='Waterline length (m)')
-    parser.add_argument('--beam', type=float, default=0.172, help='Beam (m)')
-    parser.add_argument('--draft', type=float, default=0.055, help='Draft (m)')
-    parser.add_argument('--wetted_area', type=float, default=0.1258, help='Wetted surface area (m²)')
-    parser.add_argument('--form_factor', type=float, default=0.25, help='Form factor k')
-    parser.add_argument('--velocity', type=float, default=None, help='Single velocity to analyze (m/s)')
-    parser.add_argument('--v_min', type=float, default=0.1, help='Minimum velocity for range (m/s)')
-    parser.add_argument('--v_max', type=float, default=1.0, help='Maximum velocity for range (m/s)')
-    parser.add_argument('--v_step', type=float, default=0.05, help='Velocity step (m/s)')
-    parser.add_argument('--plot', action='store_true', help='Generate plots')
-    parser.add_argument('--save_plot', type=str, default='resistance_analysis.png', help='Plot filename')
-    parser.add_argument('--export_csv', type=str, default=None, help='Export results to CSV')
-    
-    args = parser.parse_args()
-    
-    # Setup hull and fluid
-    hull = HullParameters(
-        length=args.length,
-        beam=args.beam,
-        draft=args.draft,
-        wetted_area=args.wetted_area,
-        form_factor=args.form_factor
-    )
-    
-    fluid = FluidProperties()
-    
-    calculator = ITTCResistanceCalculator(hull, fluid)
-    
-    # Calculate resistance
-    if args.velocity is not None:
-        results = [calculator.calculate_resistance(args.velocity)]
-    else:
-        velocities = np.arange(args.v_min, args.v_max + args.v_step, args.v_step)
-        results = calculator.power_curve(velocities.tolist())
+def export_csv(results: ResistanceSweep, path: str):
+    """Write the sweep and shaft powers (η = 50%, 40%) as CSV"""
+    # One formatting call for the whole table (12 significant digits)
+    pe = results.effective_power
+    table = np.column_stack(results.columns() + (pe / 0.5, pe / 0.4))
+    header = ','.join(['Velocity (m/s)', 'Reynolds', 'Froude', 'Cf', 'Rf (N)', 'Rv (N)',
+                       'Rw (N)', 'RT (N)', 'PE (W)', 'P_shaft_50% (W)', 'P_shaft_40% (W)'])
+    np.savetxt(path, table, delimiter=',', header=header, fmt='%.12g', comments='')
+    print(f"Results exported to: {path}")
+
+
+def run(hull: HullParameters, velocities, fluid: FluidProperties = None,
+        plot: bool = False, save_path: str = None, csv_path: str = None,
+        show: bool = True) -> ResistanceSweep:
+    """
+    Calculate, print and optionally export/plot a resistance sweep;
+    in-process entry point
+    """
+    calculator = ITTCResistanceCalculator(hull, fluid or FluidProperties())
+    results = calculator.power_curve(velocities)
     
     # Print summary
     print_summary(results, hull)
     
     # Export CSV if requested
-    if args.export_csv:
-        import csv
-        with open(args.export_csv, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Velocity (m/s)', 'Reynolds', 'Froude', 'Cf', 'Rf (N)', 'Rv (N)', 
-                           'Rw (N)', 'RT (N)', 'PE (W)', 'P_shaft_50% (W)', 'P_shaft_40% (W)'])
-            for r in results:
-                writer.writerow([r.velocity, r.reynolds, r.froude, r.friction_coeff,
-                               r.friction_resistance, r.viscous_resistance, r.wave_resistance,
-                               r.total_resistance, r.effective_power, 
-                               r.effective_power/0.5, r.effective_power/0.4])
-        print(f"Results exported to: {args.export_csv}")
+    if csv_path:
+        export_csv(results, csv_path)
     
     # Generate plots
-    if args.plot and len(results) > 1:
-        plot_results(results, hull, args.save_plot if args.save_plot else None)
+    if plot and len(results) > 1:
+        plot_results(results, hull, save_path, show)
+    
+    return results
+
+
+def build_parser() -> argparse.ArgumentParser:
+    defaults = RunParameters()
+    parser = argparse.ArgumentParser(description='ITTC-1957 Resistance Calculator')
+    parser.add_argument('--length', type=float, default=defaults.length, help='Waterline length (m)')
+    parser.add_argument('--beam', type=float, default=defaults.beam, help='Beam (m)')
+    parser.add_argument('--draft', type=float, default=defaults.draft, help='Draft (m)')
+    parser.add_argument('--wetted_area', type=float, default=defaults.wetted_area, help='Wetted surface area (m²)')
+    parser.add_argument('--form_factor', type=float, default=defaults.form_factor, help='Form factor k')
+    parser.add_argument('--velocity', type=float, default=defaults.velocity, help='Single velocity to analyze (m/s)')
+    parser.add_argument('--v_min', type=float, default=defaults.v_min, help='Minimum velocity for range (m/s)')
+    parser.add_argument('--v_max', type=float, default=defaults.v_max, help='Maximum velocity for range (m/s)')
+    parser.add_argument('--v_step', type=float, default=defaults.v_step, help='Velocity step (m/s)')
+    parser.add_argument('--plot', action='store_true', help='Generate plots')
+    parser.add_argument('--save_plot', type=str, default='resistance_analysis.png', help='Plot filename')
+    parser.add_argument('--export_csv', type=str, default=None, help='Export results to CSV')
+    parser.add_argument('--no_show', action='store_true',
+                        help='Only save the plot; skip the interactive window')
+    return parser
+
+
+def run_from_args(args: argparse.Namespace) -> ResistanceSweep:
+    """Run from parsed command-line arguments"""
+    # Save-only runs never need a GUI backend; switching before the first
+    # figure means it is never loaded
+    if args.no_show:
+        plt.switch_backend('Agg')
+    
+    params = RunParameters(**{f.name: getattr(args, f.name) for f in fields(RunParameters)})
+    return run(params.hull(), params.velocities(), plot=args.plot,
+               save_path=args.save_plot or None, csv_path=args.export_csv,
+               show=not args.no_show)
+
+
+def main():
+    run_from_args(build_parser().parse_args())
 
 
 if __name__ == "__main__":
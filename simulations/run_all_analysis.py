@@ -14,12 +14,24 @@ Usage:
     python run_all_analysis.py --cargo 2.5 --velocity 0.5
 """
 
-import subprocess
 import sys
 import os
+import io
+import contextlib
 from pathlib import Path
 import argparse
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+# The steps only save figures, so pick the non-interactive backend before
+# the analysis modules import pyplot
+import matplotlib
+matplotlib.use('Agg')
+
+# Analysis steps run in this interpreter, sharing one numpy/matplotlib import
+import visualize_hull_3d
+import stability_analysis
+import resistance_calc
 
 
 class AnalysisSuite:
@@ -42,6 +54,12 @@ class AnalysisSuite:
         self.electronics_mass = 0.8  # kg (ESP32, battery, motors)
         self.total_empty = self.hull_mass + self.electronics_mass
         
+        # Water density (kg/m³), gravity (m/s²) and the displaced volume
+        # per metre of draft: (1/3)*B*L_bow + L_stern*B
+        self._rho = 1000.0
+        self._g = 9.81
+        self._vol_coef = (1/3) * self.B * self.L_bow + self.L_stern * self.B
+        
         # Calculate draft if not provided
         if self.draft is None:
             self.draft = self.calculate_required_draft()
@@ -55,71 +73,81 @@ class AnalysisSuite:
         
     def calculate_required_draft(self):
         """Calculate draft needed to displace total mass"""
-        total_mass = self.total_empty + self.cargo_mass
-        # Volume coefficient: (1/3)*B*L_bow + L_stern*B
-        vol_coef = (1/3) * self.B * self.L_bow + self.L_stern * self.B
-        draft = total_mass / (1000 * vol_coef)  # rho = 1000 kg/m³
-        return draft
+        return (self.total_empty + self.cargo_mass) / (self._rho * self._vol_coef)
     
-    def run_command(self, cmd, description):
-        """Run a command and return success status"""
-        print(f"\n{'='*80}")
-        print(f"  {description}")
-        print(f"{'='*80}")
-        print(f"Command: {' '.join(cmd)}\n")
-        
-        try:
-            result = subprocess.run(cmd, check=True, capture_output=False, text=True)
-            print(f"\n✓ {description} completed successfully")
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"\n✗ {description} failed with error code {e.returncode}")
-            return False
-        except FileNotFoundError:
-            print(f"\n✗ Command not found: {cmd[0]}")
-            return False
+    def displacement(self, draft):
+        """Displaced volume (m³), displacement (kg), buoyancy and weight (N)"""
+        volume = draft * self._vol_coef
+        displacement = volume * self._rho
+        weight = (self.total_empty + self.cargo_mass) * self._g
+        return volume, displacement, displacement * self._g, weight
+    
+    def run_step(self, description, func, *args, **kwargs):
+        """
+        Run one analysis step and return (success, console output). The
+        output is captured so concurrent steps can be printed in order.
+        """
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            print(f"\n{'='*80}")
+            print(f"  {description}")
+            print(f"{'='*80}\n")
+            
+            try:
+                func(*args, **kwargs)
+                print(f"\n✓ {description} completed successfully")
+                success = True
+            except Exception as e:
+                print(f"\n✗ {description} failed: {e}")
+                success = False
+        return success, out.getvalue()
     
     def step1_hull_visualization(self):
         """Generate 3D hull visualization"""
-        cmd = [
-            sys.executable,
-            "visualize_hull_3d.py",
-            "--draft", str(self.draft),
-            "--save", str(self.output_dir / f"hull_3d_{self.timestamp}.png")
-        ]
-        return self.run_command(cmd, "STEP 1: 3D Hull Visualization")
+        return self.run_step(
+            "STEP 1: 3D Hull Visualization",
+            visualize_hull_3d.run,
+            self.draft,
+            str(self.output_dir / f"hull_3d_{self.timestamp}.png"),
+            show=False
+        )
     
     def step2_stability_analysis(self):
         """Run stability analysis with flotation check"""
-        cmd = [
-            sys.executable,
-            "stability_analysis.py",
-            "--length", str(self.L),
-            "--beam", str(self.B),
-            "--draft", str(self.draft),
-            "--height", str(self.H),
-            "--hull_mass", str(self.hull_mass),
-            "--cargo", str(self.cargo_mass),
-            "--hull_cg", "0.04",
-            "--cargo_cg", "0.06",
-            "--plot",
-            "--save_plot", str(self.output_dir / f"stability_{self.timestamp}.png")
-        ]
-        return self.run_command(cmd, "STEP 2: Stability Analysis")
+        hull = stability_analysis.real_hull(self.L, self.B, self.draft, self.H)
+        mass_dist = stability_analysis.MassDistribution(
+            hull_mass=self.hull_mass,
+            hull_cg_height=0.04,
+            cargo_mass=self.cargo_mass,
+            cargo_cg_height=0.06
+        )
+        return self.run_step(
+            "STEP 2: Stability Analysis",
+            stability_analysis.run,
+            hull, mass_dist,
+            plot=True,
+            save_path=str(self.output_dir / f"stability_{self.timestamp}.png"),
+            show=False
+        )
     
     def step3_resistance_calculation(self):
         """Run resistance and power calculations"""
-        cmd = [
-            sys.executable,
-            "resistance_calc.py",
-            "--length", str(self.L),
-            "--beam", str(self.B),
-            "--draft", str(self.draft),
-            "--v_max", str(self.max_velocity),
-            "--plot",
-            "--save_plot", str(self.output_dir / f"resistance_{self.timestamp}.png")
-        ]
-        return self.run_command(cmd, "STEP 3: Resistance & Power Calculation (ITTC-1957)")
+        # Wetted area, form factor and sweep start/step keep the
+        # resistance_calc.py command-line defaults
+        params = resistance_calc.RunParameters(
+            length=self.L,
+            beam=self.B,
+            draft=self.draft,
+            v_max=self.max_velocity
+        )
+        return self.run_step(
+            "STEP 3: Resistance & Power Calculation (ITTC-1957)",
+            resistance_calc.run,
+            params.hull(), params.velocities(),
+            plot=True,
+            save_path=str(self.output_dir / f"resistance_{self.timestamp}.png"),
+            show=False
+        )
     
     def generate_summary_report(self, results):
         """Generate comprehensive summary report"""
@@ -161,15 +189,12 @@ class AnalysisSuite:
                 f.write("✗ EXCEDE\n")
             
             # Calculate volume and displacement
-            V_bow = (1/3) * self.B * self.draft * self.L_bow
-            V_stern = self.L_stern * self.B * self.draft
-            V_total = V_bow + V_stern
-            displacement = V_total * 1000
+            V_total, displacement, buoyancy, weight = self.displacement(self.draft)
             
             f.write(f"  Displaced volume:          {V_total*1e6:.1f} cm³\n")
             f.write(f"  Displacement:              {displacement:.2f} kg\n")
-            f.write(f"  Buoyancy force:            {displacement*9.81:.2f} N\n")
-            f.write(f"  Weight force:              {(self.total_empty + self.cargo_mass)*9.81:.2f} N\n\n")
+            f.write(f"  Buoyancy force:            {buoyancy:.2f} N\n")
+            f.write(f"  Weight force:              {weight:.2f} N\n\n")
             
             # Analysis results
             f.write(f"{'ANALYSIS RESULTS':^90}\n")
@@ -192,7 +217,7 @@ class AnalysisSuite:
             f.write("="*90 + "\n")
             if self.draft > 0.06:
                 f.write("  ⚠ Draft exceeds 6 cm limit\n")
-                max_load_6cm = 0.06 * ((1/3) * self.B * self.L_bow + self.L_stern * self.B) * 1000
+                max_load_6cm = 0.06 * self._vol_coef * self._rho
                 f.write(f"     → Maximum total mass for T<6cm: {max_load_6cm:.2f} kg\n")
                 f.write(f"     → Current total mass: {self.total_empty + self.cargo_mass:.2f} kg\n")
                 f.write(f"     → Reduce mass by: {(self.total_empty + self.cargo_mass - max_load_6cm):.2f} kg\n\n")
@@ -228,11 +253,20 @@ class AnalysisSuite:
         print(f"  Output dir:    {self.output_dir}")
         
         results = {}
+        steps = {
+            "3D Hull Visualization": self.step1_hull_visualization,
+            "Stability Analysis": self.step2_stability_analysis,
+            "Resistance Calculation": self.step3_resistance_calculation,
+        }
         
-        # Run all analysis steps
-        results["3D Hull Visualization"] = self.step1_hull_visualization()
-        results["Stability Analysis"] = self.step2_stability_analysis()
-        results["Resistance Calculation"] = self.step3_resistance_calculation()
+        # The steps are independent; run them concurrently, one process
+        # each since pyplot is not thread-safe, and print in step order
+        with ProcessPoolExecutor(max_workers=len(steps)) as pool:
+            futures = {name: pool.submit(step) for name, step in steps.items()}
+            for name, future in futures.items():
+                success, output = future.result()
+                print(output, end="")
+                results[name] = success
         
         # Generate summary
         report_path = self.generate_summary_report(results)
@@ -6,17 +6,38 @@ Metacentric height, righting moment, and heel angle calculations
 Usage:
     python stability_analysis.py --length 0.45 --beam 0.20 --draft 0.055
     python stability_analysis.py --cargo 2.5 --cg_height 0.04
+    python stability_analysis.py --plot --save_plot stability.png --no_show --quiet
 """
 
 import argparse
-import math
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Tuple
 
+# Heel grid of the righting-moment plot and its sine table, evaluated once
+# per process; any RM curve is then Δ × GM × g times the table
+PLOT_HEEL_ANGLES = np.linspace(0, 20, 100)
+_PLOT_SIN_HEELS = np.sin(np.deg2rad(PLOT_HEEL_ANGLES))
 
-@dataclass
+# Sweep grids of the load and offset-sensitivity plots (float64, which is
+# what Matplotlib transforms in anyway)
+PLOT_CARGO_LOADS = np.linspace(0, 4, 50)  # kg
+PLOT_LATERAL_OFFSETS = np.linspace(0, 0.1, 100)  # 0 to 10 cm offset
+
+# Report banners are constant, so they are centred once here; each section
+# heading is the (blank line + title, rule) pair that opens it
+_REPORT_RULE = "="*100
+_REPORT_TITLE = f"{'STABILITY ANALYSIS REPORT':^100}"
+_REPORT_SECTIONS = {
+    title: (f"\n{title:^100}", "-"*100)
+    for title in ('HULL GEOMETRY', 'HYDROSTATIC PROPERTIES', 'FLOTATION ANALYSIS',
+                  'STABILITY CENTERS', 'MASS DISTRIBUTION', 'STABILITY PARAMETERS',
+                  'DESIGN CRITERION CHECK', 'SENSITIVITY TO LOAD POSITION')
+}
+
+
+@dataclass(frozen=True, slots=True)
 class HullGeometry:
     """Hull dimensions and coefficients for hybrid bow-rectangular stern hull"""
     length: float  # Total waterline length (m)
@@ -28,9 +49,57 @@ class HullGeometry:
     stern_length: float = 0.40  # Length of rectangular stern section (m)
     block_coeff: float = 0.70  # Block coefficient Cb (adjusted for hybrid shape)
     waterplane_coeff: float = 0.88  # Waterplane coefficient Cwp (pentagonal deck)
+    # Derived hydrostatics at the design draft, filled in by __post_init__
+    _volume: float = field(init=False, repr=False, compare=False)
+    _waterplane_area: float = field(init=False, repr=False, compare=False)
+    _kb: float = field(init=False, repr=False, compare=False)
+    _I_total: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Plain Python on purpose: this runs once per hull, so a Numba
+        # compile (or cache load) would cost far more than the arithmetic
+        
+        # Bow volume: Pirámide = (1/3) × base_area × height
+        # Base rectangular en x=bow_length: width=beam, height=draft (sumergido)
+        # Altura de la pirámide = bow_length (5 cm)
+        submerged_bow = min(self.draft, self.height)
+        bow_base_area = self.bow_base_width * submerged_bow
+        bow_volume = (1/3) * bow_base_area * self.bow_length
+        
+        # Stern volume (rectangular prism): V = length × width × draft
+        stern_volume = self.stern_length * self.beam * self.draft
+        
+        volume = bow_volume + stern_volume
+        
+        # Waterplane: bow triangle (A = 0.5 × base × height, 5 cm horizontal
+        # projection) + stern rectangle (A = length × width)
+        bow_triangle_height = 0.05
+        bow_area = 0.5 * self.bow_base_width * bow_triangle_height
+        stern_area = self.stern_length * self.beam
+        waterplane_area = bow_area + stern_area
+        
+        # KB: volume-weighted centroids from keel (vertical position)
+        bow_kb = 0.25 * submerged_bow  # Pyramid centroid
+        stern_kb = 0.5 * self.draft  # Rectangle centroid
+        if volume > 0:
+            kb = (bow_volume * bow_kb + stern_volume * stern_kb) / volume
+        else:
+            kb = 0.5 * self.draft
+        
+        # Waterplane second moment about the centerline (BM = I / ∇)
+        # Bow triangle: I ≈ (base × height³) / 36 for isosceles triangle
+        # Stern rectangle: I = (L × B³) / 12
+        I_bow = (self.bow_base_width * bow_triangle_height**3) / 36
+        I_stern = (self.stern_length * self.beam**3) / 12
+        I_total = I_bow + I_stern
+        
+        # Frozen, so the cache is set through object.__setattr__
+        for name, value in (('_volume', volume), ('_waterplane_area', waterplane_area),
+                            ('_kb', kb), ('_I_total', I_total)):
+            object.__setattr__(self, name, value)
     
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MassDistribution:
     """Mass and center of gravity information"""
     hull_mass: float  # Mass of hull structure (kg)
@@ -39,6 +108,23 @@ class MassDistribution:
     cargo_cg_height: float  # Height of cargo CG (m)
     electronics_mass: float = 1.0  # ESP32, batteries, motors (kg)
     electronics_cg_height: float = 0.03  # Low and centered (m)
+    _m: np.ndarray = field(init=False, repr=False, compare=False)
+    _z: np.ndarray = field(init=False, repr=False, compare=False)
+    _fixed_moment: float = field(init=False, repr=False, compare=False)
+    _fixed_mass: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Masses and CG heights packed as (hull, cargo, electronics) for
+        # combined_cg (frozen, so set through object.__setattr__)
+        object.__setattr__(self, '_m', np.array(
+            [self.hull_mass, self.cargo_mass, self.electronics_mass]))
+        object.__setattr__(self, '_z', np.array(
+            [self.hull_cg_height, self.cargo_cg_height, self.electronics_cg_height]))
+        # Hull + electronics part of Σm·z and Σm, fixed when only cargo varies
+        object.__setattr__(self, '_fixed_moment',
+                           self.hull_mass * self.hull_cg_height +
+                           self.electronics_mass * self.electronics_cg_height)
+        object.__setattr__(self, '_fixed_mass', self.hull_mass + self.electronics_mass)
     
 
 class StabilityCalculator:
@@ -48,6 +134,22 @@ class StabilityCalculator:
         self.hull = hull
         self.rho = rho  # Water density (kg/m³)
         self.g = g      # Gravity (m/s²)
+        self.precompute()
+        
+    def precompute(self):
+        """
+        Cache the hydrostatics of self.hull (∇, Aw, KB, BM) and ρg.
+        Call again after assigning a new hull, rho or g.
+        """
+        self._rho_g = self.rho * self.g  # Hydrostatic weight density (N/m³)
+        
+        # The geometry-only terms live on the (frozen) hull, so calculators
+        # built on the same HullGeometry share them
+        self._volume = self.hull._volume
+        self._waterplane_area = self.hull._waterplane_area
+        self._kb = self.hull._kb
+        self._I_total = self.hull._I_total
+        self._bm = self._I_total / self._volume if self._volume > 0 else 0
         
     def displacement_volume(self) -> float:
         """
@@ -58,34 +160,32 @@ class StabilityCalculator:
              NO hay punto D - el vértice A está en (0,0,H) y la base en x=bow_length
         Stern: Prisma rectangular
         """
-        # Bow volume: Pirámide = (1/3) × base_area × height
-        # Base rectangular en x=bow_length: width=beam, height=draft (sumergido)
-        # Altura de la pirámide = bow_length (5 cm)
-        bow_base_area = self.hull.bow_base_width * min(self.hull.draft, self.hull.height)
-        bow_volume = (1/3) * bow_base_area * self.hull.bow_length
-        
-        # Stern volume (rectangular prism): V = length × width × draft
-        stern_volume = self.hull.stern_length * self.hull.beam * self.hull.draft
-        
-        return bow_volume + stern_volume
+        return self._volume
     
     def displacement_mass(self) -> float:
         """Calculate displacement mass: Δ = ρ × ∇"""
-        return self.rho * self.displacement_volume()
+        return self.rho * self._volume
+    
+    def displacement_mass_array(self, drafts: np.ndarray) -> np.ndarray:
+        """
+        displacement_mass over an array of drafts (m), same bow pyramid +
+        stern prism model; for draft-vs-displacement tables
+        """
+        return self.rho * self._volume_array(drafts)
+    
+    def _volume_array(self, drafts: np.ndarray) -> np.ndarray:
+        drafts = np.asarray(drafts, dtype=float)
+        bow_base_area = self.hull.bow_base_width * np.minimum(drafts, self.hull.height)
+        bow_volume = (1/3) * bow_base_area * self.hull.bow_length
+        stern_volume = self.hull.stern_length * self.hull.beam * drafts
+        return bow_volume + stern_volume
     
     def waterplane_area(self) -> float:
         """
         Calculate waterplane area for pentagonal deck:
         Area = Bow triangle + Stern rectangle
         """
-        # Bow triangle area: A = 0.5 × base × height
-        bow_triangle_height = 0.05  # 5 cm horizontal projection
-        bow_area = 0.5 * self.hull.bow_base_width * bow_triangle_height
-        
-        # Stern rectangle area: A = length × width
-        stern_area = self.hull.stern_length * self.hull.beam
-        
-        return bow_area + stern_area
+        return self._waterplane_area
     
     def center_of_buoyancy(self) -> float:
         """
@@ -95,21 +195,7 @@ class StabilityCalculator:
         - Pyramid: centroid at 1/4 of height from base
         - Rectangular prism: centroid at 1/2 of draft from keel
         """
-        bow_base_area = self.hull.bow_base_width * min(self.hull.draft, self.hull.height)
-        bow_volume = (1/3) * bow_base_area * self.hull.bow_length
-        stern_volume = self.hull.stern_length * self.hull.beam * self.hull.draft
-        total_volume = bow_volume + stern_volume
-        
-        # Centroids from keel (vertical position)
-        bow_kb = 0.25 * min(self.hull.draft, self.hull.height)  # Pyramid centroid
-        stern_kb = 0.5 * self.hull.draft  # Rectangle centroid
-        
-        # Weighted average
-        if total_volume > 0:
-            kb = (bow_volume * bow_kb + stern_volume * stern_kb) / total_volume
-        else:
-            kb = 0.5 * self.hull.draft
-        return kb
+        return self._kb
     
     def metacentric_radius(self) -> float:
         """
@@ -120,42 +206,46 @@ class StabilityCalculator:
         For pentagonal deck (triangle + rectangle):
         I_total = I_bow_triangle + I_stern_rectangle
         """
-        # Bow triangle: I ≈ (base × height³) / 36 for isosceles triangle
-        bow_triangle_height = 0.05
-        I_bow = (self.hull.bow_base_width * bow_triangle_height**3) / 36
-        
-        # Stern rectangle: I = (L × B³) / 12
-        I_stern = (self.hull.stern_length * self.hull.beam**3) / 12
-        
-        I_total = I_bow + I_stern
-        volume = self.displacement_volume()
-        
-        return I_total / volume if volume > 0 else 0
+        return self._bm
+    
+    def metacentric_radius_array(self, drafts: np.ndarray) -> np.ndarray:
+        """metacentric_radius over an array of drafts (m): BM = I / ∇(T)"""
+        volume = self._volume_array(drafts)
+        return np.divide(self._I_total, volume, out=np.zeros_like(volume),
+                         where=volume > 0)
     
     def metacentric_height(self, kg: float) -> float:
         """
         Calculate GM (metacentric height)
         GM = KB + BM - KG
         """
-        kb = self.center_of_buoyancy()
-        bm = self.metacentric_radius()
-        return kb + bm - kg
+        return self._kb + self._bm - kg
     
     def combined_cg(self, mass_dist: MassDistribution) -> Tuple[float, float]:
         """
         Calculate combined center of gravity
         Returns: (total_mass, KG)
         """
-        total_mass = (mass_dist.hull_mass + mass_dist.cargo_mass + 
-                     mass_dist.electronics_mass)
-        
-        kg = ((mass_dist.hull_mass * mass_dist.hull_cg_height +
-               mass_dist.cargo_mass * mass_dist.cargo_cg_height +
-               mass_dist.electronics_mass * mass_dist.electronics_cg_height) / 
-              total_mass)
+        m = mass_dist._m
+        total_mass = float(m.sum())
+        kg = float(m @ mass_dist._z) / total_mass
         
         return total_mass, kg
     
+    def kg_of_cargo(self, mass_dist: MassDistribution):
+        """
+        KG as a function of cargo mass alone, for cargo sweeps: the hull and
+        electronics terms of mass_dist are folded into constants. The
+        returned function broadcasts over cargo arrays.
+        """
+        fixed_moment = mass_dist._fixed_moment
+        fixed_mass = mass_dist._fixed_mass
+        cargo_cg = mass_dist.cargo_cg_height
+        
+        def kg(cargo):
+            return (fixed_moment + cargo * cargo_cg) / (fixed_mass + cargo)
+        return kg
+    
     def righting_moment(self, heel_angle_deg: float, gm: float, 
                        displacement: float) -> float:
         """
@@ -163,8 +253,13 @@ class StabilityCalculator:
         RM = Δ × GM × sin(θ)
         (Linear approximation valid for small angles)
         """
-        heel_rad = math.radians(heel_angle_deg)
-        return displacement * gm * math.sin(heel_rad) * self.g
+        return float(self.righting_moment_array(heel_angle_deg, gm, displacement))
+    
+    def righting_moment_array(self, angles_deg: np.ndarray, gm: float,
+                              displacement: float) -> np.ndarray:
+        """righting_moment over an array of heel angles (degrees)"""
+        # Scalars folded first, so the array sees a single multiply
+        return (displacement * gm * self.g) * np.sin(np.deg2rad(angles_deg))
     
     def max_stable_heel(self, gm: float) -> float:
         """
@@ -188,32 +283,82 @@ class StabilityCalculator:
         tan(θ) ≈ (m × d) / (Δ × GM)
         where m = offset mass, d = lateral distance from centerline
         """
-        if gm <= 0:
-            return 90.0  # Unstable
+        return float(self.heel_angle_from_offset_load_array(
+            lateral_offset, load_mass, gm, displacement))
+    
+    def heel_angle_from_offset_load_array(self, lateral_offsets: np.ndarray,
+                                          load_mass: float, gm: float,
+                                          displacement: float) -> np.ndarray:
+        """
+        heel_angle_from_offset_load over an array of lateral offsets (m);
+        gm may also be an array (e.g. a GM-vs-load sweep) and broadcasts
+        """
+        gm = np.asarray(gm, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # One division for the (m / Δ·GM) factor, then a multiply per offset
+            tan_theta = (load_mass / (displacement * gm)) * np.asarray(lateral_offsets)
+            heel = np.degrees(np.arctan(tan_theta))
+        return np.where(gm <= 0, 90.0, heel)  # 90° = unstable
+    
+    def batch_heel(self, mass_dist: MassDistribution, cargo_masses: np.ndarray,
+                   lateral_offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        GM and heel angle for a batch of cargo masses, each placed at the
+        matching lateral offset (arrays broadcast), e.g. for Monte-Carlo
+        loading studies. Hull and electronics come from mass_dist.
+        Returns (gm, heel_deg) in the broadcast shape.
+        Uses the Numba-compiled kernel when Numba is installed.
+        """
+        # Imported here so that Numba's load and compile cost is paid only by
+        # batch callers, not by every import of this module
+        import _stability_kernels as kernels
+        
+        cargo, offsets = np.broadcast_arrays(np.asarray(cargo_masses, dtype=np.float64),
+                                             np.asarray(lateral_offsets, dtype=np.float64))
+        displacement = self.displacement_mass()
         
-        tan_theta = (load_mass * lateral_offset) / (displacement * gm)
-        return math.degrees(math.atan(tan_theta))
+        if kernels.HAS_NUMBA:
+            kernel = (kernels.batch_heel_parallel if cargo.size >= kernels.PARALLEL_BATCH_MIN
+                      else kernels.batch_heel)
+            gm, heel = kernel(np.ascontiguousarray(cargo).ravel(),
+                              np.ascontiguousarray(offsets).ravel(),
+                              mass_dist._fixed_moment, mass_dist._fixed_mass,
+                              mass_dist.cargo_cg_height,
+                              self._kb + self._bm, displacement)
+            return gm.reshape(cargo.shape), heel.reshape(cargo.shape)
+        
+        gm = self.metacentric_height(self.kg_of_cargo(mass_dist)(cargo))
+        return gm, self.heel_angle_from_offset_load_array(offsets, cargo, gm, displacement)
 
 
 def plot_stability_curves(calculator: StabilityCalculator, mass_dist: MassDistribution,
-                         save_path: str = None):
-    """Generate stability analysis plots"""
+                         save_path: str = None, show: bool = True):
+    """
+    Generate stability analysis plots. Save-only calls (show=False) draw on
+    a standalone Figure that never touches pyplot or a GUI backend.
+    """
+    # matplotlib is imported here so that using StabilityCalculator alone
+    # does not pay for its start-up
+    from matplotlib.figure import Figure
+    from matplotlib.lines import Line2D
     
     total_mass, kg = calculator.combined_cg(mass_dist)
     gm = calculator.metacentric_height(kg)
     displacement = calculator.displacement_mass()
     
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    if show:
+        import matplotlib.pyplot as plt
+        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    else:
+        fig = Figure(figsize=(14, 10))
+        axes = fig.subplots(2, 2)
     fig.suptitle(f'Stability Analysis - GM={gm*100:.2f} cm, Δ={displacement:.2f} kg', 
                  fontsize=14, fontweight='bold')
     
     # Plot 1: Righting moment vs heel angle
     ax1 = axes[0, 0]
-    heel_angles = np.linspace(0, 20, 100)
-    righting_moments = [calculator.righting_moment(angle, gm, displacement) 
-                       for angle in heel_angles]
-    
-    ax1.plot(heel_angles, righting_moments, 'b-', linewidth=2)
+    righting_moments = (displacement * gm * calculator.g) * _PLOT_SIN_HEELS
+    ax1.plot(PLOT_HEEL_ANGLES, righting_moments, 'b-', linewidth=2)
     ax1.axvline(x=10, color='r', linestyle='--', label='Design limit (10°)', linewidth=2)
     ax1.set_xlabel('Heel Angle (degrees)', fontweight='bold')
     ax1.set_ylabel('Righting Moment (N·m)', fontweight='bold')
@@ -223,20 +368,14 @@ def plot_stability_curves(calculator: StabilityCalculator, mass_dist: MassDistri
     
     # Plot 2: GM vs cargo load
     ax2 = axes[0, 1]
-    cargo_loads = np.linspace(0, 4, 50)
-    gm_values = []
-    
-    for cargo in cargo_loads:
-        test_mass = MassDistribution(
-            hull_mass=mass_dist.hull_mass,
-            hull_cg_height=mass_dist.hull_cg_height,
-            cargo_mass=cargo,
-            cargo_cg_height=mass_dist.cargo_cg_height
-        )
-        _, test_kg = calculator.combined_cg(test_mass)
-        gm_values.append(calculator.metacentric_height(test_kg))
-    
-    ax2.plot(cargo_loads, np.array(gm_values)*100, 'g-', linewidth=2)
+    cargo_loads = PLOT_CARGO_LOADS
+    
+    # KB and BM do not depend on the cargo, so GM(cargo) = KB + BM - KG(cargo)
+    # with KG as one weighted-sum expression over the whole sweep
+    kg_values = calculator.kg_of_cargo(mass_dist)(cargo_loads)
+    gm_values = calculator.metacentric_height(kg_values)
+    
+    ax2.plot(cargo_loads, gm_values*100, 'g-', linewidth=2)
     ax2.axhline(y=5, color='orange', linestyle='--', label='Minimum recommended (5 cm)', linewidth=2)
     ax2.axvline(x=2.5, color='purple', linestyle=':', label='Target load (2.5 kg)', linewidth=2)
     ax2.set_xlabel('Cargo Load (kg)', fontweight='bold')
@@ -247,9 +386,9 @@ def plot_stability_curves(calculator: StabilityCalculator, mass_dist: MassDistri
     
     # Plot 3: Heel angle from lateral offset
     ax3 = axes[1, 0]
-    lateral_offsets = np.linspace(0, 0.1, 100)  # 0 to 10 cm offset
-    heel_angles_offset = [calculator.heel_angle_from_offset_load(offset, 1.0, gm, displacement)
-                         for offset in lateral_offsets]
+    lateral_offsets = PLOT_LATERAL_OFFSETS
+    heel_angles_offset = calculator.heel_angle_from_offset_load_array(
+        lateral_offsets, 1.0, gm, displacement)
     
     ax3.plot(lateral_offsets*100, heel_angles_offset, 'r-', linewidth=2)
     ax3.axhline(y=10, color='orange', linestyle='--', label='Design limit (10°)', linewidth=2)
@@ -263,82 +402,94 @@ def plot_stability_curves(calculator: StabilityCalculator, mass_dist: MassDistri
     ax4 = axes[1, 1]
     
     # Draw hull profile
-    hull_x = [0, calculator.hull.length, calculator.hull.length, 0, 0]
-    hull_y = [0, 0, calculator.hull.draft, calculator.hull.draft, 0]
+    length, draft = calculator.hull.length, calculator.hull.draft
+    hull_x = [0, length, length, 0, 0]
+    hull_y = [0, 0, draft, draft, 0]
     ax4.plot(hull_x, hull_y, 'k-', linewidth=2)
     ax4.fill(hull_x, hull_y, alpha=0.2, color='gray')
     
     # Draw waterline
-    ax4.axhline(y=calculator.hull.draft, color='b', linestyle='--', 
-               label='Waterline', linewidth=2)
+    waterline = ax4.axhline(y=draft, color='b', linestyle='--', 
+                            label='Waterline', linewidth=2)
     
     # Mark centers
     kb = calculator.center_of_buoyancy()
     bm = calculator.metacentric_radius()
+    km = kb + bm
+    x_mid = length / 2
     
-    ax4.plot(calculator.hull.length/2, kb, 'bo', markersize=10, label=f'B (KB={kb*100:.1f}cm)')
-    ax4.plot(calculator.hull.length/2, kg, 'ro', markersize=10, label=f'G (KG={kg*100:.1f}cm)')
-    ax4.plot(calculator.hull.length/2, kb+bm, 'go', markersize=10, 
-            label=f'M (BM={bm*100:.1f}cm)')
+    # B, G and M as one marker collection; the legend gets proxy handles
+    center_colors = ['b', 'r', 'g']
+    center_labels = [f'B (KB={kb*100:.1f}cm)', f'G (KG={kg*100:.1f}cm)',
+                     f'M (BM={bm*100:.1f}cm)']
+    ax4.scatter([x_mid] * 3, [kb, kg, km], c=center_colors, s=100, zorder=5)
     
     # Draw GM line
-    ax4.plot([calculator.hull.length/2, calculator.hull.length/2], [kg, kb+bm], 
-            'g-', linewidth=2, label=f'GM={gm*100:.1f}cm')
+    gm_line, = ax4.plot([x_mid, x_mid], [kg, km], 
+                        'g-', linewidth=2, label=f'GM={gm*100:.1f}cm')
     
     ax4.set_xlabel('Length (m)', fontweight='bold')
     ax4.set_ylabel('Height from Keel (m)', fontweight='bold')
     ax4.set_title('Stability Centers (Side View)')
-    ax4.legend(loc='upper right')
+    center_handles = [Line2D([], [], color=c, marker='o', linestyle='', markersize=10,
+                             label=label)
+                      for c, label in zip(center_colors, center_labels)]
+    ax4.legend(handles=[waterline, *center_handles, gm_line], loc='upper right')
     ax4.grid(True, alpha=0.3)
     ax4.set_aspect('equal')
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=300, bbox_inches='tight')
         print(f"Plot saved to: {save_path}")
     
-    plt.show()
+    if show:
+        plt.show()
 
 
-def print_stability_report(calculator: StabilityCalculator, mass_dist: MassDistribution):
-    """Print comprehensive stability report"""
+def print_stability_report(calculator: StabilityCalculator, mass_dist: MassDistribution,
+                           stream=None):
+    """
+    Print comprehensive stability report, written in one call to stream
+    (stdout by default). Sweeps can pass one io.StringIO for all runs and
+    dump it once at the end.
+    """
+    
+    # Each quantity is evaluated once; the report is assembled as lines
+    volume = calculator.displacement_volume()
+    displacement = calculator.displacement_mass()
+    waterplane = calculator.waterplane_area()
+    kb = calculator.center_of_buoyancy()
+    bm = calculator.metacentric_radius()
+    total_mass, kg = calculator.combined_cg(mass_dist)
+    gm = calculator.metacentric_height(kg)
     
-    print("\n" + "="*100)
-    print(f"{'STABILITY ANALYSIS REPORT':^100}")
-    print("="*100)
+    lines = ["\n" + _REPORT_RULE, _REPORT_TITLE, _REPORT_RULE]
     
     # Hull geometry
-    print(f"\n{'HULL GEOMETRY':^100}")
-    print("-"*100)
-    print(f"  Length (L):              {calculator.hull.length:.3f} m")
-    print(f"  Beam (B):                {calculator.hull.beam:.3f} m")
-    print(f"  Draft (T):               {calculator.hull.draft:.3f} m")
-    print(f"  Block Coefficient (Cb):  {calculator.hull.block_coeff:.3f}")
-    print(f"  Waterplane Coeff (Cwp):  {calculator.hull.waterplane_coeff:.3f}")
+    lines.extend(_REPORT_SECTIONS['HULL GEOMETRY'])
+    lines.append(f"  Length (L):              {calculator.hull.length:.3f} m")
+    lines.append(f"  Beam (B):                {calculator.hull.beam:.3f} m")
+    lines.append(f"  Draft (T):               {calculator.hull.draft:.3f} m")
+    lines.append(f"  Block Coefficient (Cb):  {calculator.hull.block_coeff:.3f}")
+    lines.append(f"  Waterplane Coeff (Cwp):  {calculator.hull.waterplane_coeff:.3f}")
     
     # Hydrostatics
-    print(f"\n{'HYDROSTATIC PROPERTIES':^100}")
-    print("-"*100)
-    volume = calculator.displacement_volume()
-    displacement = calculator.displacement_mass()
-    waterplane = calculator.waterplane_area()
-    
-    print(f"  Displacement Volume (∇): {volume:.6f} m³")
-    print(f"  Displacement Mass (Δ):   {displacement:.3f} kg")
-    print(f"  Waterplane Area (Aw):    {waterplane:.4f} m²")
+    lines.extend(_REPORT_SECTIONS['HYDROSTATIC PROPERTIES'])
+    lines.append(f"  Displacement Volume (∇): {volume:.6f} m³")
+    lines.append(f"  Displacement Mass (Δ):   {displacement:.3f} kg")
+    lines.append(f"  Waterplane Area (Aw):    {waterplane:.4f} m²")
     
     # Buoyancy force and flotation check
-    total_mass, _ = calculator.combined_cg(mass_dist)
     buoyancy_force = displacement * calculator.g  # N
     weight_force = total_mass * calculator.g      # N
     net_force = buoyancy_force - weight_force     # N
     
-    print(f"\n{'FLOTATION ANALYSIS':^100}")
-    print("-"*100)
-    print(f"  Buoyancy Force (Fb):     {buoyancy_force:.3f} N ↑")
-    print(f"  Weight Force (W):        {weight_force:.3f} N ↓")
-    print(f"  Net Vertical Force:      {net_force:+.3f} N")
+    lines.extend(_REPORT_SECTIONS['FLOTATION ANALYSIS'])
+    lines.append(f"  Buoyancy Force (Fb):     {buoyancy_force:.3f} N ↑")
+    lines.append(f"  Weight Force (W):        {weight_force:.3f} N ↓")
+    lines.append(f"  Net Vertical Force:      {net_force:+.3f} N")
     
     if abs(net_force) < 0.1:  # Nearly balanced (< 0.1 N difference)
         flotation_status = "✓ FLOTA EN EQUILIBRIO"
@@ -350,44 +501,34 @@ def print_stability_report(calculator: StabilityCalculator, mass_dist: MassDistr
         flotation_status = f"✗ SE HUNDE - Falta flotabilidad: {abs(net_force):.2f} N"
         flotation_color = "red"
     
-    print(f"  Estado de flotación:     {flotation_status}")
+    lines.append(f"  Estado de flotación:     {flotation_status}")
     
     # Reserve buoyancy
     draft_margin = calculator.hull.height - calculator.hull.draft
     if draft_margin > 0:
         reserve_volume = waterplane * draft_margin
-        reserve_buoyancy = reserve_volume * calculator.rho * calculator.g
-        additional_load = reserve_buoyancy / calculator.g
-        print(f"  Margen de calado:        {draft_margin*100:.2f} cm")
-        print(f"  Reserva de flotabilidad: {reserve_buoyancy:.2f} N")
-        print(f"  Carga adicional máxima:  {additional_load:.2f} kg")
+        reserve_buoyancy = reserve_volume * calculator._rho_g
+        additional_load = reserve_volume * calculator.rho
+        lines.append(f"  Margen de calado:        {draft_margin*100:.2f} cm")
+        lines.append(f"  Reserva de flotabilidad: {reserve_buoyancy:.2f} N")
+        lines.append(f"  Carga adicional máxima:  {additional_load:.2f} kg")
     
     # Centers
-    kb = calculator.center_of_buoyancy()
-    bm = calculator.metacentric_radius()
-    
-    print(f"\n{'STABILITY CENTERS':^100}")
-    print("-"*100)
-    print(f"  Center of Buoyancy (KB): {kb*100:.2f} cm from keel")
-    print(f"  Metacentric Radius (BM): {bm*100:.2f} cm")
+    lines.extend(_REPORT_SECTIONS['STABILITY CENTERS'])
+    lines.append(f"  Center of Buoyancy (KB): {kb*100:.2f} cm from keel")
+    lines.append(f"  Metacentric Radius (BM): {bm*100:.2f} cm")
     
     # Mass distribution
-    total_mass, kg = calculator.combined_cg(mass_dist)
-    
-    print(f"\n{'MASS DISTRIBUTION':^100}")
-    print("-"*100)
-    print(f"  Hull:        {mass_dist.hull_mass:.2f} kg @ {mass_dist.hull_cg_height*100:.1f} cm")
-    print(f"  Cargo:       {mass_dist.cargo_mass:.2f} kg @ {mass_dist.cargo_cg_height*100:.1f} cm")
-    print(f"  Electronics: {mass_dist.electronics_mass:.2f} kg @ {mass_dist.electronics_cg_height*100:.1f} cm")
-    print(f"  TOTAL:       {total_mass:.2f} kg")
-    print(f"  Combined CG (KG): {kg*100:.2f} cm from keel")
+    lines.extend(_REPORT_SECTIONS['MASS DISTRIBUTION'])
+    lines.append(f"  Hull:        {mass_dist.hull_mass:.2f} kg @ {mass_dist.hull_cg_height*100:.1f} cm")
+    lines.append(f"  Cargo:       {mass_dist.cargo_mass:.2f} kg @ {mass_dist.cargo_cg_height*100:.1f} cm")
+    lines.append(f"  Electronics: {mass_dist.electronics_mass:.2f} kg @ {mass_dist.electronics_cg_height*100:.1f} cm")
+    lines.append(f"  TOTAL:       {total_mass:.2f} kg")
+    lines.append(f"  Combined CG (KG): {kg*100:.2f} cm from keel")
     
     # Stability parameters
-    gm = calculator.metacentric_height(kg)
-    
-    print(f"\n{'STABILITY PARAMETERS':^100}")
-    print("-"*100)
-    print(f"  Metacentric Height (GM): {gm*100:.2f} cm")
+    lines.extend(_REPORT_SECTIONS['STABILITY PARAMETERS'])
+    lines.append(f"  Metacentric Height (GM): {gm*100:.2f} cm")
     
     if gm > 0.05:
         stability_rating = "EXCELLENT"
@@ -402,18 +543,17 @@ def print_stability_report(calculator: StabilityCalculator, mass_dist: MassDistr
         stability_rating = "UNSTABLE"
         color = "✗"
     
-    print(f"  Stability Rating: {color} {stability_rating}")
+    lines.append(f"  Stability Rating: {color} {stability_rating}")
     
     max_heel = calculator.max_stable_heel(gm)
-    print(f"  Estimated Max Safe Heel: {max_heel:.1f}°")
+    lines.append(f"  Estimated Max Safe Heel: {max_heel:.1f}°")
     
     # Righting moment at 10°
     rm_10 = calculator.righting_moment(10, gm, displacement)
-    print(f"  Righting Moment @ 10°: {rm_10:.3f} N·m")
+    lines.append(f"  Righting Moment @ 10°: {rm_10:.3f} N·m")
     
     # Check design criterion
-    print(f"\n{'DESIGN CRITERION CHECK':^100}")
-    print("-"*100)
+    lines.extend(_REPORT_SECTIONS['DESIGN CRITERION CHECK'])
     
     criteria = [
         ("GM > 5 cm", gm*100 > 5, f"{gm*100:.2f} cm"),
@@ -424,21 +564,55 @@ def print_stability_report(calculator: StabilityCalculator, mass_dist: MassDistr
     
     for criterion, passed, value in criteria:
         status = "✓ PASS" if passed else "✗ FAIL"
-        print(f"  {criterion:.<50} {status:>15} ({value})")
+        lines.append(f"  {criterion:.<50} {status:>15} ({value})")
     
     # Sensitivity analysis
-    print(f"\n{'SENSITIVITY TO LOAD POSITION':^100}")
-    print("-"*100)
+    lines.extend(_REPORT_SECTIONS['SENSITIVITY TO LOAD POSITION'])
     
     lateral_offsets = [0.02, 0.05, 0.08]  # 2cm, 5cm, 8cm from centerline
     
-    print(f"  Heel angle for 1 kg load at lateral offset:")
-    for offset in lateral_offsets:
-        heel = calculator.heel_angle_from_offset_load(offset, 1.0, gm, displacement)
+    lines.append(f"  Heel angle for 1 kg load at lateral offset:")
+    heels = calculator.heel_angle_from_offset_load_array(lateral_offsets, 1.0, gm, displacement)
+    for offset, heel in zip(lateral_offsets, heels.tolist()):
         status = "✓" if heel < 10 else "✗"
-        print(f"    {offset*100:.0f} cm offset → {heel:.2f}° heel {status}")
+        lines.append(f"    {offset*100:.0f} cm offset → {heel:.2f}° heel {status}")
     
-    print("\n" + "="*100 + "\n")
+    lines.append("\n" + _REPORT_RULE + "\n")
+    
+    (sys.stdout if stream is None else stream).write("\n".join(lines) + "\n")
+
+
+def real_hull(length: float = 0.45, beam: float = 0.172, draft: float = 0.055,
+              height: float = 0.156) -> HullGeometry:
+    """HullGeometry of the real boat (5 cm pyramidal bow, 40 cm stern)"""
+    return HullGeometry(
+        length=length,
+        beam=beam,
+        draft=draft,
+        height=height,
+        bow_length=0.05,  # 5 cm pyramidal bow
+        bow_base_width=0.172,  # 17.2 cm base
+        stern_length=0.40,  # 40 cm rectangular stern
+        block_coeff=0.70,
+        waterplane_coeff=0.88
+    )
+
+
+def run(hull: HullGeometry, mass_dist: MassDistribution, plot: bool = False,
+        save_path: str = None, show: bool = True,
+        report: bool = True) -> StabilityCalculator:
+    """Print the stability report and optionally plot; in-process entry point"""
+    calculator = StabilityCalculator(hull)
+    
+    # Print report
+    if report:
+        print_stability_report(calculator, mass_dist)
+    
+    # Generate plots
+    if plot:
+        plot_stability_curves(calculator, mass_dist, save_path, show)
+    
+    return calculator
 
 
 def main():
@@ -453,21 +627,15 @@ def main():
     parser.add_argument('--cargo_cg', type=float, default=0.06, help='Cargo CG height (m)')
     parser.add_argument('--plot', action='store_true', help='Generate plots')
     parser.add_argument('--save_plot', type=str, default='stability_analysis.png')
+    parser.add_argument('--no_show', action='store_true',
+                        help='Only save the plot; skip the interactive window')
+    parser.add_argument('--quiet', action='store_true',
+                        help='Skip the printed stability report')
     
     args = parser.parse_args()
     
     # Setup with real boat geometry
-    hull = HullGeometry(
-        length=args.length,
-        beam=args.beam,
-        draft=args.draft,
-        height=args.height,
-        bow_length=0.05,  # 5 cm pyramidal bow
-        bow_base_width=0.172,  # 17.2 cm base
-        stern_length=0.40,  # 40 cm rectangular stern
-        block_coeff=0.70,
-        waterplane_coeff=0.88
-    )
+    hull = real_hull(args.length, args.beam, args.draft, args.height)
     
     mass_dist = MassDistribution(
         hull_mass=args.hull_mass,
@@ -476,14 +644,8 @@ def main():
         cargo_cg_height=args.cargo_cg
     )
     
-    calculator = StabilityCalculator(hull)
-    
-    # Print report
-    print_stability_report(calculator, mass_dist)
-    
-    # Generate plots
-    if args.plot:
-        plot_stability_curves(calculator, mass_dist, args.save_plot)
+    run(hull, mass_dist, args.plot, args.save_plot, show=not args.no_show,
+        report=not args.quiet)
 
 
 if __name__ == "__main__":
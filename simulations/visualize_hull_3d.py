@@ -11,7 +11,7 @@ Vista superior: Pentágono (triángulo + rectángulo)
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
 
 
 def create_hull_mesh(L_total=0.45, L_bow=0.05, B=0.172, H=0.156, draft=0.064):
@@ -77,11 +77,29 @@ def create_hull_mesh(L_total=0.45, L_bow=0.05, B=0.172, H=0.156, draft=0.064):
         [5, 6, 8, 7],   # Stern transom: G-H-J-I
     ]
     
-    return np.array(vertices), faces
+    return np.array(vertices, dtype=np.float64), faces
 
 
-def plot_hull_3d(draft=0.064, save_path='hull_3d_real.png'):
-    """Generate 3D plot with real geometry"""
+def dedupe_mesh(vertices, faces, eps=1e-6):
+    """
+    Merge vertices closer than eps into a unique vertex list and remap the
+    faces onto it (vertex list + index list)
+    
+    Returns:
+        (unique_vertices, faces) with faces as lists of new indices
+    """
+    keys = np.round(vertices / eps).astype(np.int64)
+    _, first, inverse = np.unique(keys, axis=0, return_index=True,
+                                  return_inverse=True)
+    if len(first) == len(vertices):
+        return vertices, faces
+    inverse = inverse.ravel()
+    unique_vertices = vertices[first]
+    return unique_vertices, [[int(inverse[idx]) for idx in face] for face in faces]
+
+
+def plot_hull_3d(draft=0.064, save_path='hull_3d_real.png', show=True):
+    """Generate 3D plot with real geometry (closed after saving if not show)"""
     
     L_total = 0.45  # 45 cm
     L_bow = 0.05    # 5 cm
@@ -95,44 +113,35 @@ def plot_hull_3d(draft=0.064, save_path='hull_3d_real.png'):
     ax = fig.add_subplot(111, projection='3d')
     
     # Plot hull faces
-    face_vertices = [[vertices[idx] for idx in face] for face in faces]
+    face_vertices = [vertices[face] for face in faces]  # one gather per face
     hull_poly = Poly3DCollection(face_vertices, alpha=0.75, 
                                  facecolor='steelblue', 
                                  edgecolor='navy', linewidths=2)
     ax.add_collection3d(hull_poly)
     
-    # Plot vertices with labels (SIN punto D)
+    # Plot vertices (one collection) with labels (SIN punto D)
     labels = ['A', 'B', 'C', 'E', 'F', 'G', 'H', 'I', 'J']
-    for i, (v, label) in enumerate(zip(vertices, labels)):
-        ax.scatter(*v, c='red', s=100, marker='o', edgecolor='darkred', linewidth=1.5)
-        offset = 0.015
-        ax.text(v[0]+offset, v[1], v[2]+offset, f'  {label}', 
+    ax.scatter(vertices[:, 0], vertices[:, 1], vertices[:, 2], c='red', s=100,
+               marker='o', edgecolor='darkred', linewidth=1.5, depthshade=False)
+    offset = 0.015
+    for x, y, z, label in zip(*vertices.T.tolist(), labels):
+        ax.text(x+offset, y, z+offset, f'  {label}', 
                fontsize=12, fontweight='bold', color='darkred')
     
-    # Plot waterline
-    n = 50
-    # Bow waterline (triangular cross-section)
-    x_bow = np.linspace(0, L_bow, n)
-    # Width increases linearly from 0 to B
-    y_left_bow = -B/2 * (x_bow / L_bow)
-    y_right_bow = B/2 * (x_bow / L_bow)
-    z_bow = np.full(n, draft)
-    
-    ax.plot(x_bow, y_left_bow, z_bow, 'cyan', linewidth=3, label='Waterline')
-    ax.plot(x_bow, y_right_bow, z_bow, 'cyan', linewidth=3)
-    
-    # Stern waterline (rectangular)
-    x_stern = np.linspace(L_bow, L_total, n)
-    y_left_stern = np.full(n, -B/2)
-    y_right_stern = np.full(n, B/2)
-    z_stern = np.full(n, draft)
-    
-    ax.plot(x_stern, y_left_stern, z_stern, 'cyan', linewidth=3)
-    ax.plot(x_stern, y_right_stern, z_stern, 'cyan', linewidth=3)
-    
-    # Close waterline at bow and stern
-    ax.plot([0, 0], [0, 0], [0, draft], 'cyan', linewidth=3)
-    ax.plot([L_total, L_total], [-B/2, B/2], [draft, draft], 'cyan', linewidth=3)
+    # Plot waterline: every piece is straight, so one collection of
+    # end-point segments
+    waterline = Line3DCollection([
+        # Bow waterline (triangular cross-section), width 0 to B
+        [(0, 0, draft), (L_bow, -B/2, draft)],
+        [(0, 0, draft), (L_bow, B/2, draft)],
+        # Stern waterline (rectangular)
+        [(L_bow, -B/2, draft), (L_total, -B/2, draft)],
+        [(L_bow, B/2, draft), (L_total, B/2, draft)],
+        # Close waterline at bow and stern
+        [(0, 0, 0), (0, 0, draft)],
+        [(L_total, -B/2, draft), (L_total, B/2, draft)],
+    ], colors='cyan', linewidths=3, label='Waterline')
+    ax.add_collection3d(waterline)
     
     # Add dimension annotations
     # Length
@@ -192,25 +201,24 @@ def plot_hull_3d(draft=0.064, save_path='hull_3d_real.png'):
     plt.tight_layout()
     plt.savefig(save_path, dpi=300, bbox_inches='tight')
     print(f"✓ 3D hull visualization saved: {save_path}")
-    plt.show()
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
 
 
 def calculate_displacement(draft):
-    """Calculate displacement at given draft"""
+    """Calculate displacement (kg) at given draft; accepts a scalar or an array of drafts"""
     L_bow = 0.05
     L_stern = 0.40
     B = 0.172
     
-    # Bow volume: triangular prism
-    V_bow = 0.5 * B * draft * L_bow
-    
-    # Stern volume: rectangular prism
-    V_stern = L_stern * B * draft
+    # Bow (triangular prism) + stern (rectangular prism) waterplane area:
+    # displacement is linear in draft, so one multiply covers a whole sweep
+    A_wp = 0.5 * B * L_bow + L_stern * B
     
     # Total displacement (kg)
-    displacement = (V_bow + V_stern) * 1000  # rho = 1000 kg/m³
-    
-    return displacement
+    return A_wp * np.asarray(draft, dtype=np.float64) * 1000  # rho = 1000 kg/m³
 
 
 def print_geometry_info(draft=0.064):
@@ -283,6 +291,12 @@ def print_geometry_info(draft=0.064):
     print("\n" + "="*90 + "\n")
 
 
+def run(draft=0.064, save_path='hull_3d_real.png', show=True):
+    """Print the geometry report and save the 3D plot; in-process entry point"""
+    print_geometry_info(draft)
+    plot_hull_3d(draft, save_path, show)
+
+
 if __name__ == '__main__':
     import argparse
     
@@ -292,5 +306,4 @@ if __name__ == '__main__':
     
     args = parser.parse_args()
     
-    print_geometry_info(args.draft)
-    plot_hull_3d(args.draft, args.save)
+    run(args.draft, args.save)